@@ -0,0 +1,145 @@
+# benchmarks/bench_e2e.py
+"""
+녹화본을 로컬 재생 서버로 띄워 main_crawler.main 전체(Chrome 포함)를 오프라인으로 측정합니다.
+
+    # 1) 실제 사이트를 한 번 녹화 (HTTP 응답 + 렌더링된 page_source)
+    python -m benchmarks.bench_e2e record --recordings recordings
+
+    # 2) 재생 서버로 실행 방식별 소요 시간 비교
+    python -m benchmarks.bench_e2e run --recordings recordings --latency-ms 150 \
+        --modes sequential,concurrent --repeat 3
+
+결과 업로드는 S3 대신 임시 디렉터리(LocalPublisher)에 저장합니다.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+
+def _isolate(workdir):
+    """상태/캐시/출력(crawl_summary.json 포함)이 이전 실행과 섞이지 않도록 임시 디렉터리로 분리"""
+    os.chdir(workdir)
+    os.environ["CRAWLER_STATE_DIR"] = os.path.join(workdir, "state")
+    os.environ["CRAWLER_OUTPUT_DIR"] = os.path.join(workdir, "output")
+    # 매번 같은 페이지를 끝까지 가져오도록 증분 수집은 끕니다.
+    os.environ["CRAWLER_INCREMENTAL"] = "false"
+
+
+def record(args):
+    args.recordings = os.path.abspath(args.recordings)
+    workdir = tempfile.mkdtemp(prefix="crawler-record-")
+    _isolate(workdir)
+    os.environ["CRAWLER_RECORD_DIR"] = args.recordings
+
+    import main_crawler
+    from crawlers.publish import LocalPublisher
+
+    main_crawler.main(
+        concurrent=False, publisher=LocalPublisher(os.path.join(workdir, "uploads"))
+    )
+    print(f"\n✅ 녹화 완료: {args.recordings}")
+    return 0
+
+
+def run(args):
+    from crawlers.replay import start_server
+
+    # 작업 디렉터리를 옮기기 전에 경로를 고정
+    args.recordings = os.path.abspath(args.recordings)
+    if args.output:
+        args.output = os.path.abspath(args.output)
+
+    server, base_url = start_server(
+        args.recordings,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        max_pages=args.max_pages,
+    )
+    os.environ["DDM_BASE_URL"] = base_url
+    os.environ["WARAK_BASE_URL"] = base_url
+    # 재생 서버는 매번 같은 본문을 주므로 조건부 GET 캐시는 측정을 왜곡합니다.
+    os.environ["CRAWLER_HTTP_CACHE"] = "false"
+    workdir = tempfile.mkdtemp(prefix="crawler-replay-")
+    _isolate(workdir)
+
+    # 환경 변수를 읽는 모듈은 설정 후에 import
+    import main_crawler
+    from crawlers.metrics import metrics
+    from crawlers.publish import LocalPublisher
+
+    modes = args.modes.split(",")
+    timings = {mode: [] for mode in modes}
+    counts = {}
+    phases = {}
+    for i in range(args.warmup + args.repeat):
+        for mode in modes:
+            started = time.perf_counter()
+            results = main_crawler.main(
+                concurrent=(mode == "concurrent"),
+                publisher=LocalPublisher(os.path.join(workdir, "uploads", mode)),
+            )
+            elapsed = time.perf_counter() - started
+            if i >= args.warmup:
+                timings[mode].append(elapsed)
+                counts[mode] = {name: r.get("count", 0) for name, r in results.items()}
+                # 마지막 실행의 단계별 소요 시간
+                phases[mode] = metrics.summary()["phases"]
+
+    server.shutdown()
+
+    report = {
+        "latency_ms": args.latency_ms,
+        "jitter_ms": args.jitter_ms,
+        "max_pages": args.max_pages,
+        "modes": {
+            mode: {
+                "runs": [round(t, 3) for t in values],
+                "median_s": round(statistics.median(values), 3),
+                "min_s": round(min(values), 3),
+                "counts": counts.get(mode, {}),
+                "phases": phases.get(mode, {}),
+            }
+            for mode, values in timings.items()
+            if values
+        },
+    }
+
+    print("\n" + "=" * 50)
+    print("   재생 벤치마크 결과")
+    print("=" * 50)
+    for mode, r in report["modes"].items():
+        print(f"{mode:<12} median {r['median_s']:.3f}s  min {r['min_s']:.3f}s  {r['counts']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="녹화/재생 기반 전체 파이프라인 벤치마크")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rec = sub.add_parser("record", help="실제 사이트를 크롤링하며 응답을 녹화")
+    rec.add_argument("--recordings", default="recordings")
+
+    rep = sub.add_parser("run", help="녹화본 재생 서버로 main_crawler.main 실행")
+    rep.add_argument("--recordings", default="recordings")
+    rep.add_argument("--latency-ms", type=float, default=0)
+    rep.add_argument("--jitter-ms", type=float, default=0)
+    rep.add_argument("--max-pages", type=int, default=None, help="목록 페이지 수 조정")
+    rep.add_argument("--modes", default="sequential,concurrent")
+    rep.add_argument("--repeat", type=int, default=1)
+    rep.add_argument("--warmup", type=int, default=0)
+    rep.add_argument("--output", help="결과 JSON 저장 경로")
+
+    args = parser.parse_args(argv)
+    return record(args) if args.command == "record" else run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
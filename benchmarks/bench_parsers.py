@@ -0,0 +1,242 @@
+# benchmarks/bench_parsers.py
+"""
+네트워크 없이 저장된 HTML 픽스처로 목록 파서의 성능을 측정합니다.
+
+    python -m benchmarks.bench_parsers                    # 측정 후 기준값과 비교
+    python -m benchmarks.bench_parsers --update-baseline --runs 5  # 여러 번 측정해 기준값 갱신
+
+파서별로 지연 시간(p50/min), 초당 행 수, tracemalloc 최대 메모리를 측정하고,
+기준값보다 threshold% 이상 느려지면(또는 빠른 파서 결과가 기존 파서와 다르면) 실패합니다.
+머신 성능 차이를 줄이기 위해 비교는 지연 시간 중앙값을 실행마다 한 번 측정한 보정 작업 시간으로
+나눈 값으로 하고, --runs를 주면 여러 번 실행한 값의 중앙값을 씁니다.
+"""
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+BASELINE_PATH = os.environ.get(
+    "BENCH_BASELINE", os.path.join(os.path.dirname(__file__), "baseline.json")
+)
+
+THRESHOLD_PCT = float(os.environ.get("BENCH_THRESHOLD_PCT", "25"))
+REPEAT = int(os.environ.get("BENCH_REPEAT", "50"))
+RUNS = int(os.environ.get("BENCH_RUNS", "3"))
+
+# 날짜 필터 결과가 실행일에 따라 달라지지 않도록 고정
+FIXED_TODAY = date(2026, 1, 1)
+
+TABLE_PAGE_TYPES = (
+    "edu_board",
+    "edu_expo",
+    "edu_notice",
+    "news_list",
+    "reserve_programs",
+    "reserve_receptions",
+)
+
+
+def _load_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, f"{name}.html"), "rb") as f:
+        return f.read()
+
+
+def _cases():
+    """(케이스 이름, 픽스처 이름, 파서 함수)"""
+    from crawlers import table_parser
+    from crawlers.warak_crawler import parse_warak_programs
+
+    for page_type in TABLE_PAGE_TYPES:
+        slow, fast = table_parser.parsers_for(page_type)
+        yield f"{page_type}:bs4", page_type, slow
+        yield f"{page_type}:lxml", page_type, fast
+    yield (
+        "warak_list:bs4",
+        "warak_list",
+        lambda html: parse_warak_programs(html, today=FIXED_TODAY),
+    )
+
+
+def _row_count(result):
+    # 교육지원센터 결과 끝의 다음 페이지 여부(bool)는 행이 아닙니다.
+    return sum(1 for row in result if not isinstance(row, bool))
+
+
+def _calibration_timings(rounds=9):
+    """머신 속도 보정용 고정 작업 시간 목록(초)"""
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        total = 0
+        for i in range(50000):
+            total += i % 7
+        "".join(str(i) for i in range(5000))
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def measure(func, html, repeat=REPEAT):
+    # 파서의 진행 로그는 측정 출력에서 숨깁니다.
+    with contextlib.redirect_stdout(io.StringIO()):
+        rows = _row_count(func(html))  # 워밍업 (지연 import 등)
+
+        # timeit과 같이 측정 중에는 GC를 끕니다. (앞 케이스가 남긴 객체 정리가 섞이지 않도록)
+        gc.collect()
+        gc.disable()
+        try:
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                func(html)
+                timings.append(time.perf_counter() - started)
+        finally:
+            gc.enable()
+
+        tracemalloc.start()
+        func(html)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    p50 = statistics.median(timings)
+    return {
+        "rows": rows,
+        "latency_ms_p50": round(p50 * 1000, 3),
+        "latency_ms_min": round(min(timings) * 1000, 3),
+        "rows_per_sec": round(rows / p50, 1) if p50 else 0.0,
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def check_parity():
+    """빠른 파서 결과가 기존 BeautifulSoup 파서와 같은지 (다른 페이지 유형 목록)"""
+    from crawlers import table_parser
+
+    mismatched = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for page_type in TABLE_PAGE_TYPES:
+            slow, fast = table_parser.parse_both(page_type, _load_fixture(page_type))
+            if slow != fast:
+                mismatched.append(page_type)
+    return mismatched
+
+
+def run_once(repeat=REPEAT, only=None):
+    """
+    한 번 측정. 보정값은 실행 전후에 잰 시간의 중앙값 하나를 모든 케이스에 씁니다.
+    (케이스마다 따로 보정하면 보정 잡음이 케이스별 기준값에 그대로 섞입니다)
+    """
+    timings = _calibration_timings()
+    results = {}
+    for name, fixture, func in _cases():
+        if only and not any(part in name for part in only):
+            continue
+        results[name] = measure(func, _load_fixture(fixture), repeat)
+    calibration = statistics.median(timings + _calibration_timings())
+    for result in results.values():
+        result["normalized"] = round(result["latency_ms_p50"] / 1000 / calibration, 4)
+    return {"calibration_ms": round(calibration * 1000, 3), "cases": results}
+
+
+def run(repeat=REPEAT, only=None, runs=RUNS):
+    """runs번 실행해 케이스별 항목의 중앙값을 반환"""
+    measured = [run_once(repeat, only) for _ in range(max(1, runs))]
+    if len(measured) == 1:
+        return measured[0]
+
+    def median_of(values):
+        return round(statistics.median(values), 4)
+
+    cases = {}
+    for name, first in measured[0]["cases"].items():
+        cases[name] = {
+            key: median_of([m["cases"][name][key] for m in measured])
+            if key != "rows"
+            else first["rows"]
+            for key in first
+        }
+    return {
+        "calibration_ms": median_of([m["calibration_ms"] for m in measured]),
+        "runs": len(measured),
+        "cases": cases,
+    }
+
+
+def compare(results, baseline, threshold_pct):
+    """기준값 대비 threshold% 이상 느려진 케이스 목록 [(이름, 변화율%)]"""
+    regressions = []
+    for name, result in results["cases"].items():
+        base = baseline.get("cases", {}).get(name)
+        if not base or not base.get("normalized"):
+            continue
+        change = (result["normalized"] / base["normalized"] - 1) * 100
+        result["change_pct"] = round(change, 1)
+        if change > threshold_pct:
+            regressions.append((name, change))
+    return regressions
+
+
+def _print_table(results):
+    print(f"보정 작업: {results['calibration_ms']}ms")
+    print(
+        f"{'케이스':<26}{'행':>5}{'p50(ms)':>10}{'min(ms)':>10}"
+        f"{'행/초':>11}{'최대(KB)':>10}{'변화':>9}"
+    )
+    for name, r in results["cases"].items():
+        change = f"{r['change_pct']:+.1f}%" if "change_pct" in r else "-"
+        print(
+            f"{name:<26}{r['rows']:>5}{r['latency_ms_p50']:>10.3f}{r['latency_ms_min']:>10.3f}"
+            f"{r['rows_per_sec']:>11.1f}{r['peak_kb']:>10.1f}{change:>9}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="오프라인 파서 벤치마크")
+    parser.add_argument("--update-baseline", action="store_true", help="측정값을 기준값으로 저장")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD_PCT, help="허용 감속률(%%)")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="케이스별 반복 횟수")
+    parser.add_argument("--runs", type=int, default=RUNS, help="전체 측정 횟수 (중앙값 사용)")
+    parser.add_argument("--only", help="케이스 이름 일부 (쉼표 구분)")
+    parser.add_argument("--output", help="측정 결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    mismatched = check_parity()
+    for page_type in mismatched:
+        print(f"❌ 파서 결과 불일치: {page_type} (python -m crawlers.table_parser로 확인)")
+
+    only = args.only.split(",") if args.only else None
+    results = run(args.repeat, only, args.runs)
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, encoding="utf-8") as f:
+            baseline = json.load(f)
+    regressions = [] if args.update_baseline else compare(results, baseline, args.threshold)
+
+    _print_table(results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.update_baseline:
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"✅ 기준값 저장: {BASELINE_PATH}")
+
+    for name, change in regressions:
+        print(f"❌ 성능 저하: {name} {change:+.1f}% (허용 {args.threshold}%)")
+
+    return 1 if regressions or mismatched else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
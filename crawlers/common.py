@@ -1,29 +1,536 @@
+import atexit
+import json
 import os
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
+import platform
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .metrics import metrics
+from .replay import get_recorder
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# 실행 간 유지되는 상태 파일 위치 (fetch 전략, 캐시 등)
+STATE_DIR = os.environ.get("CRAWLER_STATE_DIR", ".crawler_state")
+
+
+def state_path(*parts):
+    """상태 디렉터리 아래 경로를 반환하고 상위 디렉터리를 만들어 둡니다."""
+    path = os.path.join(STATE_DIR, *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+
+def use_scratch_state():
+    """
+    상태 디렉터리를 임시 사본으로 바꿉니다 (--dry-run).
+    지난 실행의 상태는 그대로 읽지만 이번 실행의 변경은 종료 시 사본과 함께 삭제됩니다.
+    """
+    global STATE_DIR
+    scratch = tempfile.mkdtemp(prefix="crawler_state_")
+    if os.path.isdir(STATE_DIR):
+        shutil.copytree(STATE_DIR, scratch, dirs_exist_ok=True)
+    atexit.register(shutil.rmtree, scratch, ignore_errors=True)
+    STATE_DIR = scratch
+    return scratch
+
+
+# 대상 사이트 주소 (녹화본 재생 서버 등 다른 주소로 바꿀 수 있음)
+DDM_BASE_URL = os.environ.get("DDM_BASE_URL", "https://www.ddm.go.kr").rstrip("/")
+WARAK_BASE_URL = os.environ.get("WARAK_BASE_URL", "https://www.ddmwarak.com").rstrip("/")
+
+# HTTP 연결/읽기 제한 시간 (초)
+HTTP_TIMEOUT = (
+    float(os.environ.get("CRAWLER_HTTP_CONNECT_TIMEOUT", "5")),
+    float(os.environ.get("CRAWLER_HTTP_READ_TIMEOUT", "15")),
+)
+
+
+def create_http_session(pool_size=None, retries=None, headers=None):
+    """
+    keep-alive 연결 풀과 재시도 정책을 갖춘 requests.Session 생성 함수.
+    5xx 응답과 연결 끊김은 지수 백오프로 재시도합니다.
+    """
+    pool_size = pool_size or int(os.environ.get("CRAWLER_HTTP_POOL_SIZE", "10"))
+    retries = retries if retries is not None else int(
+        os.environ.get("CRAWLER_HTTP_RETRIES", "3")
+    )
+
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    if headers:
+        session.headers.update(headers)
+
+    recorder = get_recorder()
+    if recorder is not None:
+        session.hooks["response"].append(recorder.record_response)
+    return session
+
+
+_http_sessions = {}
+_http_sessions_lock = threading.Lock()
+
+
+def get_http_session(name="default", headers=None):
+    """
+    이름별로 프로세스 전체에서 공유하는 세션 (스케줄러처럼 오래 도는 프로세스에서
+    실행마다 새 연결을 맺지 않도록 keep-alive 연결을 유지합니다).
+    """
+    with _http_sessions_lock:
+        session = _http_sessions.get(name)
+        if session is None:
+            session = _http_sessions[name] = create_http_session(headers=headers)
+        return session
+
+
+# 호스트별 동시 요청 수 상한 (프로세스 전체 공유)
+HOST_CONCURRENCY = int(os.environ.get("CRAWLER_HOST_CONCURRENCY", "4"))
+
+_host_slots = {}
+_host_slots_lock = threading.Lock()
+
+
+def host_slot(url):
+    """url 호스트의 동시 요청 슬롯(BoundedSemaphore)을 반환. with 문으로 사용합니다."""
+    host = urlsplit(url).netloc
+    with _host_slots_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.BoundedSemaphore(HOST_CONCURRENCY)
+        return slot
+
+
+# 빠른 렌더링 프로필: 표 HTML만 읽으므로 이미지/글꼴/미디어와 분석 스크립트를 받지 않습니다.
+FAST_RENDER = os.environ.get("CRAWLER_FAST_RENDER", "true").lower() == "true"
+# eager: DOMContentLoaded까지만 기다림 (준비 여부는 wait_until_ready가 판단), none도 가능
+PAGE_LOAD_STRATEGY = os.environ.get("CRAWLER_PAGE_LOAD_STRATEGY", "eager")
+
+# 브라우저가 받은 API 응답을 읽기 위한 performance 로그 (와락 Wix 데이터 수집)
+NETWORK_LOG = os.environ.get("CRAWLER_NETWORK_LOG", "true").lower() == "true"
+
+# 글꼴/미디어 파일 (이미지는 브라우저 설정으로 끔)
+BLOCKED_RESOURCE_PATTERNS = (
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+    "*.eot",
+    "*.mp4",
+    "*.webm",
+    "*.mp3",
+    "*.m3u8",
+)
+
+# 분석/광고/SNS/외부 위젯 호스트 (CRAWLER_BLOCKED_HOSTS로 추가 가능)
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "fonts.googleapis.com",
+    "fonts.gstatic.com",
+    "youtube.com",
+    "ytimg.com",
+    "facebook.net",
+    "facebook.com",
+    "wcs.naver.net",
+    "kakao.com",
+    "daumcdn.net",
+    "hotjar.com",
+    "frog.wix.com",
+    "parastorage.com",
+    "wixstatic.com",
+    "wixapps.net",
+) + tuple(
+    host.strip()
+    for host in os.environ.get("CRAWLER_BLOCKED_HOSTS", "").split(",")
+    if host.strip()
+)
+
+# 크롤러별로 차단하지 않을 호스트. 와락(Wix)은 목록을 Wix 스크립트로 그리므로 정적 리소스가 필요합니다.
+RENDER_ALLOWLISTS = {
+    "ddm": (),
+    "warak": ("parastorage.com", "wixstatic.com", "wixapps.net"),
+}
+
+
+def blocked_url_patterns(profile):
+    """profile(크롤러 이름)에 적용할 Network.setBlockedURLs 패턴 목록"""
+    allowed = RENDER_ALLOWLISTS.get(profile, ())
+    patterns = list(BLOCKED_RESOURCE_PATTERNS)
+    for host in BLOCKED_HOSTS:
+        if host not in allowed:
+            patterns.append(f"*{host}*")
+    return patterns
+
+
+def apply_render_profile(driver, profile):
+    """CDP로 profile의 URL 차단 목록을 설정. 지원하지 않는 드라이버면 False."""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd(
+            "Network.setBlockedURLs", {"urls": blocked_url_patterns(profile)}
+        )
+        return True
+    except Exception as e:
+        print(f"   [DriverPool] URL 차단 설정 실패 ({profile}): {e}")
+        return False
+
+
+# 드라이버 경로 캐시 유효 기간 (Chrome 버전이 바뀌면 기간과 무관하게 다시 확인)
+DRIVER_CACHE_TTL = float(os.environ.get("CRAWLER_DRIVER_CACHE_DAYS", "7")) * 86400
+CHROME_BINARIES = (
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "chrome",
+)
+
+# 설정하면 풀 슬롯별로 Chrome 사용자 데이터 디렉터리를 유지해 브라우저 HTTP 캐시를 다음 실행에 재사용
+CHROME_PROFILE_DIR = os.environ.get("CRAWLER_CHROME_PROFILE_DIR")
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def _chrome_fingerprint():
+    """설치된 Chrome 버전 + 플랫폼 (드라이버 경로 캐시 키)"""
+    binary = os.environ.get("CHROME_BINARY") or next(
+        (path for path in map(shutil.which, CHROME_BINARIES) if path), None
+    )
+    version = "unknown"
+    if binary:
+        try:
+            version = subprocess.run(
+                [binary, "--version"], capture_output=True, text=True, timeout=5
+            ).stdout.strip() or version
+        except (OSError, subprocess.SubprocessError):
+            pass
+    return f"{platform.system()}-{platform.machine()}|{version}"
+
+
+def resolve_driver_path():
+    """
+    ChromeDriverManager().install() 결과를 프로세스와 디스크에 캐시.
+    같은 Chrome 버전이면 버전 확인/다운로드 없이 저장된 경로를 바로 사용합니다.
+    """
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path and os.path.exists(_driver_path):
+            return _driver_path
+
+        cache_path = state_path("chromedriver.json")
+        fingerprint = _chrome_fingerprint()
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            cached = {}
+        if (
+            cached.get("fingerprint") == fingerprint
+            and time.time() - cached.get("resolved_at", 0) < DRIVER_CACHE_TTL
+            and os.path.exists(cached.get("path", ""))
+        ):
+            _driver_path = cached["path"]
+            return _driver_path
+
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        _driver_path = ChromeDriverManager().install()
+        try:
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "fingerprint": fingerprint,
+                        "path": _driver_path,
+                        "resolved_at": time.time(),
+                    },
+                    f,
+                    ensure_ascii=False,
+                    indent=2,
+                )
+        except OSError as e:
+            print(f"   [driver] 드라이버 경로 저장 실패: {e}")
+        return _driver_path
+
+
+def get_chrome_driver(fast=None, user_data_dir=None):
+    """
+    공통 Chrome WebDriver 생성 함수 (fast이면 빠른 렌더링 프로필).
+    user_data_dir을 주면 그 디렉터리의 브라우저 캐시/쿠키를 이어서 사용합니다.
+    """
+    # Selenium은 브라우저가 필요할 때만 import (HTTP만 쓰는 실행의 시작 시간 단축)
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
+    fast = FAST_RENDER if fast is None else fast
 
-def get_chrome_driver():
-    """공통 Chrome WebDriver 생성 함수"""
     options = Options()
     options.add_argument("--headless")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--disable-gpu")
     options.add_argument("--window-size=1920x1080")
-    options.add_argument(
-        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-    )
+    options.add_argument(f"user-agent={USER_AGENT}")
+    if fast:
+        options.page_load_strategy = PAGE_LOAD_STRATEGY
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--mute-audio")
+        options.add_argument("--autoplay-policy=user-gesture-required")
+        options.add_experimental_option(
+            "prefs",
+            {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.media_stream": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            },
+        )
+    if NETWORK_LOG:
+        # 로그는 읽을 때 비워지고, 쌓이더라도 드라이버 교체(max_pages) 때 함께 정리됩니다.
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        options.add_experimental_option(
+            "perfLoggingPrefs", {"enableNetwork": True, "enablePage": False}
+        )
+    if user_data_dir:
+        os.makedirs(user_data_dir, exist_ok=True)
+        options.add_argument(f"--user-data-dir={os.path.abspath(user_data_dir)}")
 
     if os.environ.get("GITHUB_ACTIONS"):
         # GitHub Actions 환경
         driver = webdriver.Chrome(options=options)
     else:
-        # 로컬 환경
-        from webdriver_manager.chrome import ChromeDriverManager
-
-        service = Service(ChromeDriverManager().install())
+        # 로컬 환경 (드라이버 경로는 한 번만 확인)
+        service = Service(resolve_driver_path())
         driver = webdriver.Chrome(service=service, options=options)
 
     return driver
+
+
+class _PooledDriver:
+    """풀에서 관리되는 드라이버와 사용 통계"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+        self.created_at = time.monotonic()
+        # 현재 적용된 URL 차단 프로필 (크롤러마다 다를 수 있음)
+        self.profile = None
+        # 사용자 데이터 디렉터리 슬롯 번호 (CHROME_PROFILE_DIR 사용 시)
+        self.slot = None
+
+
+class DriverPool:
+    """
+    웜 상태의 Chrome WebDriver를 재사용하는 풀.
+
+    - checkout() 컨텍스트 매니저로 드라이버를 빌려주고 반납받습니다.
+    - 빌려주기 전에 상태를 확인하고, 응답하지 않는 드라이버는 새로 만듭니다.
+    - max_pages 만큼 사용했거나 JS 힙이 max_heap_mb를 넘으면 반납 시 폐기합니다.
+    - checkout(profile=...)로 크롤러별 URL 차단 목록을 적용합니다. (FAST_RENDER일 때)
+    - CHROME_PROFILE_DIR이 있으면 동시에 떠 있는 드라이버마다 다른 slot-N 디렉터리를 씁니다.
+    """
+
+    def __init__(self, max_size=None, max_pages=None, max_heap_mb=None, factory=None):
+        self.max_size = max_size or int(os.environ.get("CRAWLER_DRIVER_POOL_SIZE", "3"))
+        self.max_pages = max_pages or int(
+            os.environ.get("CRAWLER_DRIVER_MAX_PAGES", "50")
+        )
+        self.max_heap_mb = max_heap_mb or int(
+            os.environ.get("CRAWLER_DRIVER_MAX_HEAP_MB", "512")
+        )
+        self.factory = factory or get_chrome_driver
+        self.profile_dir = CHROME_PROFILE_DIR if factory is None else None
+
+        self._free_slots = list(range(self.max_size))
+        self._idle = []
+        self._leased = {}
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def checkout(self, timeout=None, profile="ddm"):
+        """드라이버 하나를 빌려줍니다. 블록을 벗어나면 자동으로 반납됩니다."""
+        entry = self._acquire(timeout)
+        if FAST_RENDER and entry.profile != profile:
+            # 실패해도 차단 없이 진행 (다음 대여 때 다시 시도)
+            if apply_render_profile(entry.driver, profile):
+                entry.profile = profile
+        failed = False
+        try:
+            yield entry.driver
+        except Exception:
+            failed = True
+            raise
+        finally:
+            entry.pages += 1
+            self._release(entry, check_health=failed)
+
+    def _acquire(self, timeout):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("DriverPool이 이미 종료되었습니다.")
+                if self._idle:
+                    entry = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    # 생성은 느리므로 자리만 예약하고 락 밖에서 만듭니다.
+                    self._size += 1
+                    entry = None
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("사용 가능한 WebDriver가 없습니다.")
+                self._cond.wait(remaining)
+
+        if entry is not None and not self._is_healthy(entry.driver):
+            print("   [DriverPool] 응답 없는 드라이버 교체")
+            self._quit(entry.driver)
+            with self._cond:
+                self._return_slot(entry.slot)
+            entry = None
+
+        if entry is None:
+            slot = self._take_slot()
+            try:
+                with metrics.timer("driver_startup"):
+                    entry = _PooledDriver(self._create(slot))
+                entry.slot = slot
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._return_slot(slot)
+                    self._cond.notify()
+                raise
+
+        with self._cond:
+            self._leased[id(entry.driver)] = entry
+        return entry
+
+    def _create(self, slot):
+        if self.profile_dir and slot is not None:
+            return get_chrome_driver(
+                user_data_dir=os.path.join(self.profile_dir, f"slot-{slot}")
+            )
+        return self.factory()
+
+    def _take_slot(self):
+        with self._cond:
+            return self._free_slots.pop(0) if self._free_slots else None
+
+    def _return_slot(self, slot):
+        # self._cond를 잡은 상태에서 호출
+        if slot is not None and slot not in self._free_slots:
+            self._free_slots.append(slot)
+            self._free_slots.sort()
+
+    def _release(self, entry, check_health=False):
+        recycle = entry.pages >= self.max_pages
+        if not recycle and check_health:
+            recycle = not self._is_healthy(entry.driver)
+        if not recycle:
+            heap_mb = self._heap_mb(entry.driver)
+            recycle = heap_mb is not None and heap_mb >= self.max_heap_mb
+
+        with self._cond:
+            self._leased.pop(id(entry.driver), None)
+            if recycle or self._closed:
+                self._size -= 1
+                self._return_slot(entry.slot)
+            else:
+                self._idle.append(entry)
+            self._cond.notify()
+
+        if recycle or self._closed:
+            self._quit(entry.driver)
+
+    def close(self):
+        """대기 중인 드라이버와 아직 반납되지 않은 드라이버를 모두 종료합니다."""
+        with self._cond:
+            self._closed = True
+            entries = self._idle + list(self._leased.values())
+            self._idle = []
+            self._leased = {}
+            self._size = 0
+            self._free_slots = list(range(self.max_size))
+            self._cond.notify_all()
+        for entry in entries:
+            self._quit(entry.driver)
+
+    @staticmethod
+    def _is_healthy(driver):
+        try:
+            return driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    @staticmethod
+    def _heap_mb(driver):
+        try:
+            used = driver.execute_script(
+                "return window.performance && performance.memory"
+                " ? performance.memory.usedJSHeapSize : null"
+            )
+        except Exception:
+            return None
+        return used / (1024 * 1024) if used else None
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+_driver_pool = None
+_driver_pool_lock = threading.Lock()
+
+
+def get_driver_pool():
+    """프로세스 전체에서 공유하는 DriverPool을 반환"""
+    global _driver_pool
+    with _driver_pool_lock:
+        if _driver_pool is None:
+            _driver_pool = DriverPool()
+        return _driver_pool
+
+
+def shutdown_driver_pool():
+    """공유 DriverPool의 모든 브라우저를 종료"""
+    global _driver_pool
+    with _driver_pool_lock:
+        pool, _driver_pool = _driver_pool, None
+    if pool is not None:
+        pool.close()
+
+
+atexit.register(shutdown_driver_pool)
@@ -0,0 +1,125 @@
+# crawlers/crawl_state.py
+import json
+import os
+import re
+import threading
+from datetime import datetime, timedelta
+
+from .common import state_path
+
+INCREMENTAL = os.environ.get("CRAWLER_INCREMENTAL", "true").lower() == "true"
+# 마지막 전체 크롤링이 이 기간보다 오래되었으면 상태를 무시하고 전체 크롤링 (누락/오래된 항목 정리용)
+STATE_MAX_AGE = timedelta(days=int(os.environ.get("CRAWLER_STATE_MAX_AGE_DAYS", "14")))
+
+NTT_NO_PATTERN = re.compile(r"nttNo=(\d+)")
+
+# 이전 스냅샷에서 이어 붙인 항목 표시 (이번 실행에서 다시 받지 않은 항목)
+CARRIED_OVER_FIELD = "carried_over"
+
+
+def item_id(item):
+    """게시물 식별자: URL의 nttNo, 없으면 URL + 제목"""
+    url = item.get("url") or item.get("link") or ""
+    match = NTT_NO_PATTERN.search(url)
+    if match:
+        return f"ntt:{match.group(1)}"
+    return f"{url}|{item.get('title', '')}"
+
+
+class CrawlStateStore:
+    """
+    게시판별로 마지막 실행에서 수집한 항목(스냅샷)과 그 식별자를 저장합니다.
+
+    최신순 게시판은 이미 아는 항목만 있는 페이지에 도달하면 페이지 탐색을 멈추고,
+    새 항목을 이전 스냅샷 앞에 합쳐 결과를 만듭니다.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or state_path("crawl_state.json")
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._data = json.load(f)
+        except (OSError, ValueError):
+            self._data = {}
+
+    def _entry(self, board_key):
+        with self._lock:
+            entry = self._data.get(board_key)
+        if not entry:
+            return None
+        # 증분 실행은 updated_at만 갱신하므로 기한은 마지막 전체 크롤링 기준
+        full_crawl_at = datetime.fromisoformat(
+            entry.get("full_crawl_at") or entry["updated_at"]
+        )
+        if datetime.now() - full_crawl_at > STATE_MAX_AGE:
+            return None
+        return entry
+
+    def known_ids(self, board_key):
+        """이전 실행에서 본 항목 식별자 (상태가 없거나 오래되었으면 빈 집합)"""
+        entry = self._entry(board_key)
+        return set(entry["ids"]) if entry else set()
+
+    def merge(self, board_key, new_items, keep=None):
+        """
+        새 항목 뒤에 이전 스냅샷 중 아직 유효한(keep) 항목을 중복 없이 이어 붙입니다.
+
+        이어 붙인 항목은 다시 받지 않았으므로 상태 필드(접수 상태 등)와 crawled_at이
+        그 항목을 마지막으로 받은 실행 때 그대로이며, carried_over=True로 표시됩니다.
+        """
+        entry = self._entry(board_key)
+        merged = list(new_items)
+        if not entry:
+            return merged
+
+        seen = {item_id(item) for item in merged}
+        for item in entry["items"]:
+            if item_id(item) in seen:
+                continue
+            if keep is not None and not keep(item):
+                continue
+            merged.append(dict(item, **{CARRIED_OVER_FIELD: True}))
+            seen.add(item_id(item))
+        return merged
+
+    def record(self, board_key, items, full=True):
+        """
+        이번 실행의 최종 항목을 스냅샷으로 저장.
+        full: 아는 항목에서 멈추지 않고 끝까지 탐색했는지 (아니면 이전 full_crawl_at 유지)
+        """
+        now = datetime.now().isoformat()
+        with self._lock:
+            previous = self._data.get(board_key) or {}
+            full_crawl_at = now
+            if not full:
+                full_crawl_at = previous.get("full_crawl_at") or previous.get("updated_at", now)
+            self._data[board_key] = {
+                "updated_at": now,
+                "full_crawl_at": full_crawl_at,
+                "ids": [item_id(item) for item in items],
+                "items": items,
+            }
+            try:
+                with open(self.path, "w", encoding="utf-8") as f:
+                    json.dump(self._data, f, ensure_ascii=False, indent=2)
+            except OSError as e:
+                print(f"   [crawl_state] 저장 실패: {e}")
+
+
+def page_is_known(page_ids, known_ids):
+    """페이지의 모든 항목이 이미 수집된 항목인지 (고정 공지가 섞여도 안전하도록 페이지 단위로 판단)"""
+    return bool(known_ids) and bool(page_ids) and all(i in known_ids for i in page_ids)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_crawl_state():
+    """프로세스 전체에서 공유하는 CrawlStateStore를 반환"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = CrawlStateStore()
+        return _store
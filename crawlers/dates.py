@@ -0,0 +1,92 @@
+# crawlers/dates.py
+import os
+import re
+from datetime import date
+from functools import lru_cache
+
+# 형식별 날짜 패턴 (앞에 있는 형식이 우선)
+YMD_PATTERN = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+KOREAN_MD_PATTERN = re.compile(r"(\d{1,2})월\s*(\d{1,2})일")
+MD_PATTERN = re.compile(r"(\d{1,2})/(\d{1,2})")
+
+CACHE_SIZE = 4096
+# 연도 없는 날짜를 내년/작년으로 볼 수 있는 최대 일수 (연말/연초 경계만)
+LOOKAHEAD_DAYS = int(os.environ.get("CRAWLER_DATE_LOOKAHEAD_DAYS", "30"))
+
+
+def _nearest_year(month, day, today):
+    """
+    연도가 없는 날짜의 연도 추론 (연말/연초 경계 처리).
+    기본은 올해이고, 연말/연초 경계의 LOOKAHEAD_DAYS 이내만 내년/작년으로 봅니다.
+    예: 10월 중순에 "2/10"과 "12/20"은 올해, 12월 20일에 "1/5"는 내년, 1월 10일에 "12/20"은 작년.
+    """
+
+    def candidate(year):
+        try:
+            return date(year, month, day)
+        except ValueError:
+            return None
+
+    following = candidate(today.year + 1)
+    if following is not None and (following - today).days <= LOOKAHEAD_DAYS:
+        return following
+    previous = candidate(today.year - 1)
+    if previous is not None and (today - previous).days <= LOOKAHEAD_DAYS:
+        return previous
+    return candidate(today.year)
+
+
+def _following(month, day, previous):
+    """기간의 뒤쪽 날짜: 앞 날짜 이후의 가장 가까운 날짜 (예: 12/20~1/5)"""
+    for year in (previous.year, previous.year + 1):
+        try:
+            candidate = date(year, month, day)
+        except ValueError:
+            continue
+        if candidate >= previous:
+            return candidate
+    return None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse(text, today):
+    matches = YMD_PATTERN.findall(text)
+    if matches:
+        found = []
+        for year, month, day in matches:
+            try:
+                found.append(date(int(year), int(month), int(day)))
+            except ValueError:
+                pass
+        return (found[0], found[-1]) if found else (None, None)
+
+    matches = KOREAN_MD_PATTERN.findall(text) or MD_PATTERN.findall(text)
+    found = []
+    for month, day in matches:
+        month, day = int(month), int(day)
+        if found:
+            value = _following(month, day, found[-1])
+        else:
+            value = _nearest_year(month, day, today)
+        if value is not None:
+            found.append(value)
+    return (found[0], found[-1]) if found else (None, None)
+
+
+def parse(text, today=None):
+    """
+    문자열에서 날짜(기간)를 찾아 (시작일, 종료일)을 반환. 날짜가 없으면 (None, None).
+
+    - YYYY-MM-DD, "N월 N일", M/D 순으로 먼저 찾은 형식을 사용합니다.
+    - 날짜가 하나면 시작일과 종료일이 같고, "~" 기간이면 처음/마지막 날짜입니다.
+    - 연도가 없으면 LOOKAHEAD_DAYS 규칙으로 연도를 추론합니다. (_nearest_year)
+    """
+    if not text:
+        return None, None
+    return _parse(text, today or date.today())
+
+
+def ends_on_or_after(text, threshold, today=None):
+    """기간의 종료일이 threshold 이후인지 (날짜를 찾지 못하면 포함)"""
+    end = parse(text, today)[1]
+    return end is None or end >= threshold
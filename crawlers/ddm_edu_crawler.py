@@ -1,20 +1,31 @@
 # crawlers/ddm_edu_crawler.py
-import requests
 from bs4 import BeautifulSoup
 import json
 from datetime import datetime
-import re
 from dateutil.relativedelta import relativedelta
 import os
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 
+from .common import DDM_BASE_URL, HTTP_TIMEOUT, get_http_session, host_slot
+from .crawl_state import INCREMENTAL, get_crawl_state, item_id, page_is_known
+from .http_cache import get_http_cache
+from .metrics import metrics, submit_with_context
+from .pagination import PrefetchPaginator, get_prefetch_history
+from . import dates, table_parser
+
 
 class DDMEducationCrawler:
     """동대문구 교육지원센터 규칙별 맞춤 크롤러"""
 
     def __init__(self):
-        self.base_url = "https://www.ddm.go.kr"
+        self.base_url = DDM_BASE_URL
         self.headers = {"User-Agent": "Mozilla/5.0"}
+        # 모든 게시판이 같은 호스트이므로 keep-alive 세션 하나를 재사용 (실행 간에도 공유)
+        self.session = get_http_session("ddm_edu", headers=self.headers)
+        self.prefetch_history = get_prefetch_history()
+        self.http_cache = get_http_cache()
+        self.crawl_state = get_crawl_state()
         self.today = datetime.now().date()
 
         self.test_mode = os.environ.get("CRAWLER_TEST_MODE", "false").lower() == "true"
@@ -27,82 +38,159 @@ class DDMEducationCrawler:
         else:
             self.date_threshold = self.today
 
+        # 테스트 모드는 날짜 범위가 달라 이전 스냅샷과 섞지 않습니다.
+        self.incremental = INCREMENTAL and not self.test_mode
+
     def _is_future_event(self, date_string):
-        """테스트 모드에서는 3개월 전까지, 일반 모드에서는 미래 이벤트만"""
-        dates_found_ymd = re.findall(r"(\d{4})-(\d{2})-(\d{2})", date_string)
-        if dates_found_ymd:
-            try:
-                last_date_str = "-".join(dates_found_ymd[-1])
-                event_date = datetime.strptime(last_date_str, "%Y-%m-%d").date()
-                return event_date >= self.date_threshold
-            except ValueError:
-                return True
-
-        korean_dates = re.findall(r"(\d{1,2})월\s*(\d{1,2})일", date_string)
-        if korean_dates:
-            try:
-                month, day = map(int, korean_dates[-1])
-                event_date = datetime(self.today.year, month, day).date()
-                if event_date < self.date_threshold and self.today.month < month:
-                    event_date = datetime(self.today.year - 1, month, day).date()
-                return event_date >= self.date_threshold
-            except ValueError:
-                return True
-
-        dates_found_md = re.findall(r"(\d{1,2})/(\d{1,2})", date_string)
-        if dates_found_md:
-            try:
-                month, day = map(int, dates_found_md[-1])
-                event_date = datetime(self.today.year, month, day).date()
-                if event_date < self.date_threshold and self.today.month < month:
-                    event_date = datetime(self.today.year - 1, month, day).date()
-                return event_date >= self.date_threshold
-            except ValueError:
-                return True
-
-        return True
+        """테스트 모드에서는 3개월 전까지, 일반 모드에서는 미래 이벤트만 (기간이면 종료일 기준)"""
+        return dates.ends_on_or_after(date_string, self.date_threshold, self.today)
+
+    def _load_page(self, params, page, parser_func, content_type):
+        """
+        게시판 목록의 page 번째 페이지를 가져와 (행별 파싱 결과, 다음 페이지 여부)를 반환.
+        본문이 지난 실행과 같으면(304 또는 해시 일치) 저장해 둔 파싱 결과를 재사용합니다.
+        """
+        params_copy = params.copy()
+        params_copy["pageIndex"] = page
+        url_path = params_copy.pop("url_path", "/jinhak/selectBbsNttList.do")
+        url = f"{self.base_url}{url_path}"
+
+        parse_key = f"{parser_func.__name__}|{content_type}|{self.date_threshold}"
+        with metrics.timer("fetch", via="http", page_type="edu_board"):
+            if self.http_cache is not None:
+                response = self.http_cache.get(self.session, url, params=params_copy)
+            else:
+                # 같은 호스트에 대한 동시 요청 수 제한
+                with host_slot(url):
+                    response = self.session.get(
+                        url, params=params_copy, timeout=HTTP_TIMEOUT
+                    )
+                response.raise_for_status()
+        if self.http_cache is not None:
+            parsed = self.http_cache.get_parsed(response, parse_key)
+            if parsed is not None:
+                return [tuple(row) for row in parsed["rows"]], parsed["has_next"]
+
+        with metrics.timer("parse", page_type="edu_board"):
+            rows, has_next = self._parse_page(response.content, parser_func, content_type)
+
+        if self.http_cache is not None:
+            self.http_cache.set_parsed(
+                response, parse_key, {"rows": rows, "has_next": has_next}
+            )
+        return rows, has_next
+
+    def _parse_page(self, content, parser_func, content_type):
+        if table_parser.FAST_PARSER:
+            tree = table_parser.parse_html(content)
+            fast_parser = self._fast_row_parser(parser_func)
+            rows = [
+                fast_parser(row, content_type)
+                for row in table_parser.select_rows(tree, "edu_board")
+            ]
+            has_next = table_parser.has_edu_next_page(tree)
+        else:
+            soup = BeautifulSoup(content, "lxml")
+            rows = [
+                parser_func(row, content_type)
+                for row in soup.select("table.p-table tbody tr")
+            ]
+            has_next = soup.select_one("a.p-page__link.next-one") is not None
+        return rows, has_next
+
+    @staticmethod
+    def _board_key(params):
+        board_id = params.get("bbsNo") or f"expo{params.get('expoTypeNo', '')}"
+        return f"edu:{board_id}:{params.get('key', '')}"
+
+    def _paginator(self, params, parser_func, content_type):
+        """다음 페이지를 미리 가져오는 페이지 반복기 (선행 요청 수는 과거 기록으로 조정)"""
+        return PrefetchPaginator(
+            lambda page: self._load_page(params, page, parser_func, content_type),
+            max_pages=10 if self.test_mode else 5,
+            expected_pages=self.prefetch_history.expected_pages(
+                self._board_key(params)
+            ),
+        )
+
+    def _record_pages(self, params, paginator):
+        if paginator.consumed:
+            self.prefetch_history.record(self._board_key(params), paginator.consumed)
+
+    def _known_ids(self, board_key):
+        """증분 수집용: 이전 실행에서 이미 수집한 항목 식별자"""
+        if not self.incremental:
+            return set()
+        return self.crawl_state.known_ids(board_key)
+
+    def _finish_incremental(self, board_key, items, reached_known, failed, keep):
+        """
+        이미 아는 항목에서 멈췄다면 이전 스냅샷과 합치고, 결과를 다음 실행용으로 저장.
+        오류로 중단된 경우 불완전한 스냅샷이 남지 않도록 저장하지 않습니다.
+        """
+        if not self.incremental:
+            return items
+        if reached_known:
+            with metrics.timer("filter"):
+                items = self.crawl_state.merge(board_key, items, keep=keep)
+        if not failed:
+            self.crawl_state.record(board_key, items, full=not reached_known)
+        return items
 
     def _crawl_sorted_board(self, params, parser_func, content_type):
         """날짜 순으로 정렬된 게시판을 크롤링"""
         print(f"-> '{content_type}' (정렬) 크롤링 시작...")
         items = []
-        page = 1
-        max_pages = 10 if self.test_mode else 5
-
-        while page <= max_pages:
-            params_copy = params.copy()
-            params_copy["pageIndex"] = page
-            url_path = params_copy.pop("url_path", "/jinhak/selectBbsNttList.do")
-            url = f"{self.base_url}{url_path}"
+        board_key = self._board_key(params)
+        known_ids = self._known_ids(board_key)
+        reached_known = False
+        failed = False
+
+        paginator = self._paginator(params, parser_func, content_type)
+        with paginator as pages:
+            for page, fetch in pages:
+                try:
+                    rows, has_next = fetch()
+
+                    if not rows:
+                        break
 
-            try:
-                response = requests.get(url, params=params_copy, headers=self.headers)
-                soup = BeautifulSoup(response.content, "lxml")
-                rows = soup.select("table.p-table tbody tr")
+                    stop_for_this_board = False
+                    page_ids = []
+                    for item, is_valid_date in rows:
+                        if not item:
+                            continue
 
-                if not rows:
-                    break
+                        if not is_valid_date and not self.test_mode:
+                            stop_for_this_board = True
+                            break
 
-                stop_for_this_board = False
-                for row in rows:
-                    item, is_valid_date = parser_func(row, content_type)
-                    if not item:
-                        continue
+                        items.append(item)
+                        page_ids.append(item_id(item))
 
-                    if not is_valid_date and not self.test_mode:
-                        stop_for_this_board = True
+                    if stop_for_this_board:
                         break
-
-                    items.append(item)
-
-                if stop_for_this_board:
-                    break
-                if not soup.select_one("a.p-page__link.next-one"):
+                    if page_is_known(page_ids, known_ids):
+                        reached_known = True
+                        print("   이전 수집 항목에 도달 -> 증분 수집 종료")
+                        break
+                    if not has_next:
+                        break
+                except Exception as e:
+                    print(f"Error in _crawl_sorted_board for {content_type}: {e}")
+                    failed = True
                     break
-                page += 1
-            except Exception as e:
-                print(f"Error in _crawl_sorted_board for {content_type}: {e}")
-                break
+        self._record_pages(params, paginator)
+
+        items = self._finish_incremental(
+            board_key,
+            items,
+            reached_known,
+            failed,
+            keep=lambda item: self._is_future_event(
+                item.get("date", "") or item.get("registration_period", "")
+            ),
+        )
 
         print(f"   -> {len(items)}개 항목 수집 완료")
         return items
@@ -111,42 +199,35 @@ class DDMEducationCrawler:
         """정렬되지 않은 게시판은 전부 크롤링 후 날짜 필터링"""
         print(f"-> '{content_type}' (미정렬) 크롤링 시작...")
         all_items = []
-        page = 1
-        max_pages = 10 if self.test_mode else 5
 
-        while page <= max_pages:
-            params_copy = params.copy()
-            params_copy["pageIndex"] = page
-            url_path = params_copy.pop("url_path", "/jinhak/selectBbsNttList.do")
-            url = f"{self.base_url}{url_path}"
+        paginator = self._paginator(params, parser_func, content_type)
+        with paginator as pages:
+            for page, fetch in pages:
+                try:
+                    rows, has_next = fetch()
 
-            try:
-                response = requests.get(url, params=params_copy, headers=self.headers)
-                soup = BeautifulSoup(response.content, "lxml")
-                rows = soup.select("table.p-table tbody tr")
-
-                if not rows:
-                    break
+                    if not rows:
+                        break
 
-                for row in rows:
-                    item, _ = parser_func(row, content_type)
-                    if item:
-                        all_items.append(item)
+                    for item, _ in rows:
+                        if item:
+                            all_items.append(item)
 
-                if not soup.select_one("a.p-page__link.next-one"):
+                    if not has_next:
+                        break
+                except Exception as e:
+                    print(f"Error in _crawl_unsorted_board for {content_type}: {e}")
                     break
-                page += 1
-            except Exception as e:
-                print(f"Error in _crawl_unsorted_board for {content_type}: {e}")
-                break
-
-        filtered_items = [
-            item
-            for item in all_items
-            if self._is_future_event(
-                item.get("date", "") or item.get("registration_period", "")
-            )
-        ]
+        self._record_pages(params, paginator)
+
+        with metrics.timer("filter"):
+            filtered_items = [
+                item
+                for item in all_items
+                if self._is_future_event(
+                    item.get("date", "") or item.get("registration_period", "")
+                )
+            ]
         print(f"   -> {len(filtered_items)}개 항목 수집 완료 (전체: {len(all_items)})")
         return filtered_items
 
@@ -159,43 +240,58 @@ class DDMEducationCrawler:
         print(f"   데이터 수집 범위: {start_date} 이후 게시물")
 
         items = []
-        page = 1
-        max_pages = 10 if self.test_mode else 5
-
-        while page <= max_pages:
-            params_copy = params.copy()
-            params_copy["pageIndex"] = page
-            url_path = params_copy.pop("url_path", "/jinhak/selectBbsNttList.do")
-            url = f"{self.base_url}{url_path}"
-
-            try:
-                response = requests.get(url, params=params_copy, headers=self.headers)
-                soup = BeautifulSoup(response.content, "lxml")
-                rows = soup.select("table.p-table tbody tr")
-                if not rows:
-                    break
-
-                stop_for_this_board = False
-                for row in rows:
-                    item, post_date_str = parser_func(row, content_type)
-                    if not item:
-                        continue
-
-                    post_date = datetime.strptime(post_date_str, "%Y-%m-%d").date()
-                    if post_date < start_date:
-                        stop_for_this_board = True
+        board_key = self._board_key(params)
+        known_ids = self._known_ids(board_key)
+        reached_known = False
+        failed = False
+
+        paginator = self._paginator(params, parser_func, content_type)
+        with paginator as pages:
+            for page, fetch in pages:
+                try:
+                    rows, has_next = fetch()
+                    if not rows:
                         break
-                    else:
-                        items.append(item)
 
-                if stop_for_this_board:
-                    break
-                if not soup.select_one("a.p-page__link.next-one"):
+                    stop_for_this_board = False
+                    page_ids = []
+                    for item, post_date_str in rows:
+                        if not item:
+                            continue
+
+                        post_date = dates.parse(post_date_str, self.today)[0]
+                        if post_date is None:
+                            continue
+                        if post_date < start_date:
+                            stop_for_this_board = True
+                            break
+                        else:
+                            items.append(item)
+                            page_ids.append(item_id(item))
+
+                    if stop_for_this_board:
+                        break
+                    if page_is_known(page_ids, known_ids):
+                        reached_known = True
+                        print("   이전 수집 항목에 도달 -> 증분 수집 종료")
+                        break
+                    if not has_next:
+                        break
+                except Exception as e:
+                    print(f"Error in _crawl_notices for {content_type}: {e}")
+                    failed = True
                     break
-                page += 1
-            except Exception as e:
-                print(f"Error in _crawl_notices for {content_type}: {e}")
-                break
+        self._record_pages(params, paginator)
+
+        items = self._finish_incremental(
+            board_key,
+            items,
+            reached_known,
+            failed,
+            keep=lambda item: dates.ends_on_or_after(
+                item["date"], start_date, self.today
+            ),
+        )
 
         print(f"   -> {len(items)}개 항목 수집 완료")
         return items
@@ -275,13 +371,34 @@ class DDMEducationCrawler:
         }
         return item, date_str
 
-    def crawl_all(self):
-        """모든 섹션을 규칙에 맞게 크롤링"""
-        results = {
-            "notices": self._crawl_notices(
-                {"bbsNo": "175", "key": "3646"}, self._parse_notice_row, "공지사항"
+    def _fast_row_parser(self, parser_func):
+        """BeautifulSoup 행 파서와 같은 결과를 내는 lxml 행 파서"""
+        name = parser_func.__name__
+        if name == "_parse_notice_row":
+            return lambda row, content_type: table_parser.edu_notice_row(
+                row, content_type, self.base_url
+            )
+        fast = {
+            "_parse_board_row": table_parser.edu_board_row,
+            "_parse_expo_row": table_parser.edu_expo_row,
+        }[name]
+        return lambda row, content_type: fast(
+            row, content_type, self.base_url, self._is_future_event
+        )
+
+    def _board_specs(self):
+        """(결과 키, 크롤링 함수, 파라미터, 파서, 콘텐츠 유형) 목록 - 결과 순서 유지"""
+        return [
+            (
+                "notices",
+                self._crawl_notices,
+                {"bbsNo": "175", "key": "3646"},
+                self._parse_notice_row,
+                "공지사항",
             ),
-            "expo_university": self._crawl_sorted_board(
+            (
+                "expo_university",
+                self._crawl_sorted_board,
                 {
                     "key": "3634",
                     "expoTypeNo": "7",
@@ -290,13 +407,23 @@ class DDMEducationCrawler:
                 self._parse_expo_row,
                 "대입수시박람회",
             ),
-            "camps": self._crawl_sorted_board(
-                {"bbsNo": "332", "key": "3622"}, self._parse_board_row, "방학캠프"
+            (
+                "camps",
+                self._crawl_sorted_board,
+                {"bbsNo": "332", "key": "3622"},
+                self._parse_board_row,
+                "방학캠프",
             ),
-            "parent_programs": self._crawl_sorted_board(
-                {"bbsNo": "333", "key": "3623"}, self._parse_board_row, "학부모역량강화"
+            (
+                "parent_programs",
+                self._crawl_sorted_board,
+                {"bbsNo": "333", "key": "3623"},
+                self._parse_board_row,
+                "학부모역량강화",
             ),
-            "expo_college": self._crawl_sorted_board(
+            (
+                "expo_college",
+                self._crawl_sorted_board,
                 {
                     "key": "3635",
                     "expoTypeNo": "2",
@@ -305,7 +432,9 @@ class DDMEducationCrawler:
                 self._parse_expo_row,
                 "전문대학정보박람회",
             ),
-            "expo_highschool": self._crawl_sorted_board(
+            (
+                "expo_highschool",
+                self._crawl_sorted_board,
                 {
                     "key": "3636",
                     "expoTypeNo": "1",
@@ -314,15 +443,58 @@ class DDMEducationCrawler:
                 self._parse_expo_row,
                 "고교입학박람회",
             ),
-            "parent_lectures": self._crawl_unsorted_board(
-                {"bbsNo": "345", "key": "3632"}, self._parse_board_row, "학부모진학교실"
+            (
+                "parent_lectures",
+                self._crawl_unsorted_board,
+                {"bbsNo": "345", "key": "3632"},
+                self._parse_board_row,
+                "학부모진학교실",
             ),
-        }
+        ]
+
+    def board_keys(self):
+        """crawl_all 결과의 게시판 키 (출력 순서)"""
+        return [spec[0] for spec in self._board_specs()]
+
+    def _crawl_boards(self, max_workers=None):
+        """
+        게시판끼리는 상태를 공유하지 않으므로 max_workers개 스레드로 동시에 수집하고,
+        (결과 키, 항목 목록)을 항상 같은 게시판 순서로 내보냅니다.
+        """
+        if max_workers is None:
+            max_workers = int(os.environ.get("CRAWLER_EDU_WORKERS", "4"))
+
+        specs = self._board_specs()
+
+        def run(spec):
+            _, crawl_func, params, parser_func, content_type = spec
+            return crawl_func(params, parser_func, content_type)
+
+        if max_workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="edu-board"
+            ) as executor:
+                # 입력 순서대로 결과를 기다리므로 앞 게시판이 끝나는 대로 내보냄
+                futures = [submit_with_context(executor, run, spec) for spec in specs]
+                for spec, future in zip(specs, futures):
+                    yield spec[0], future.result()
+        else:
+            for spec in specs:
+                yield spec[0], run(spec)
+
+    def iter_all(self, max_workers=None):
+        """(결과 키, 항목)을 게시판 순서대로 하나씩 내보내는 제너레이터"""
+        for key, items in self._crawl_boards(max_workers):
+            for item in items:
+                yield key, item
+
+    def crawl_all(self, max_workers=None):
+        """모든 섹션을 규칙에 맞게 크롤링"""
+        results = dict(self._crawl_boards(max_workers))
         results["updated_at"] = datetime.now().isoformat()
         results["test_mode"] = self.test_mode
         return results
 
-
 if __name__ == "__main__":
     crawler = DDMEducationCrawler()
     all_crawled_data = crawler.crawl_all()
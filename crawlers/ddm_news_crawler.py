@@ -5,24 +5,128 @@ import re
 import json
 import os
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
-from .common import get_chrome_driver
+from .common import DDM_BASE_URL
+from .crawl_state import INCREMENTAL, get_crawl_state, item_id, page_is_known
+from .fetchers import get_fetcher
+from .metrics import metrics
+from .pagination import PrefetchPaginator, get_prefetch_history
+from . import dates, table_parser
+
+# 선행 요청 수 기록과 증분 크롤링 상태에 쓰는 게시판 키
+HISTORY_KEY = "news:38"
+
+BASE_URL = f"{DDM_BASE_URL}/www/"
+VIEW_URL = BASE_URL + "selectBbsNttView.do?key=575&bbsNo=38&nttNo={ntt_no}"
+LIST_URL = BASE_URL + "selectBbsNttList.do?key=575&bbsNo=38"
+URL_TEMPLATE = (
+    BASE_URL
+    + "selectBbsNttList.do?key=575&bbsNo=38&searchCtgry=%ea%b5%90%ec%9c%a1&pageIndex={page}"
+)
+
+
+def parse_news_row(notice):
+    """
+    목록 행 하나를 파싱해 (작성일, 항목)을 반환.
+    건너뛸 행(고정 공지, 구조가 다른 행, 날짜 인식 실패)은 None, 제목 링크가 없으면 항목이 None.
+    """
+    # 공지사항(img alt="공지")은 건너뛰기
+    if notice.find("img", alt="공지"):
+        return None
+
+    cells = notice.find_all("td")
+
+    # 테이블 구조 확인: 번호(0), 제목(1), 담당부서(2), 작성일(3), 첨부(4)
+    if len(cells) < 4:
+        return None
+
+    # 날짜 추출 및 검증 - 수정된 부분
+    date_cell = cells[3]
+    date_text = date_cell.text.strip()
+
+    # "작성일" 텍스트 제거 및 공백 정리
+    date_text = date_text.replace("작성일", "").strip()
+    # 여러 줄 공백 제거
+    date_text = re.sub(r"\s+", " ", date_text).strip()
+
+    # 날짜 형식 매칭 (YYYY-MM-DD)
+    date_match = re.search(r"(\d{4}-\d{2}-\d{2})", date_text)
+    if not date_match:
+        print(f"날짜 형식 인식 실패: {repr(date_text)}")
+        return None
+
+    date_str = date_match.group(1)
+
+    # 제목 및 URL 추출
+    title_cell = cells[1]
+    title_tag = title_cell.find("a")
+    if not title_tag:
+        return date_str, None
+
+    title = title_tag.text.strip()
+
+    # onclick 속성에서 nttNo 추출하여 실제 URL 생성
+    onclick = title_tag.get("onclick", "")
+    href = title_tag.get("href", "")
+
+    if onclick and "selectBbsNttView" in onclick:
+        # onclick에서 파라미터 추출
+        ntt_no_match = re.search(r'nttNo["\s]*[:=]["\s]*(\d+)', onclick)
+        if ntt_no_match:
+            absolute_url = VIEW_URL.format(ntt_no=ntt_no_match.group(1))
+        else:
+            # onclick 파싱 실패시 기본 처리
+            absolute_url = LIST_URL
+    elif href and href != "#" and href != "javascript:void(0);":
+        # href가 유효한 경우
+        if href.startswith("http"):
+            absolute_url = href
+        else:
+            absolute_url = BASE_URL + href.lstrip("/")
+    else:
+        # URL 추출 실패
+        print(f"URL 추출 실패: {title}")
+        absolute_url = LIST_URL
+
+    # 담당부서 추출
+    dept_cell = cells[2]
+    department = dept_cell.text.strip()
+
+    # 첨부파일 여부 확인
+    has_attachment = False
+    if len(cells) > 4:
+        attachment_cell = cells[4]
+        if attachment_cell.find("img") or "첨부" in attachment_cell.text:
+            has_attachment = True
+
+    item = {
+        "title": title,
+        "date": date_str,
+        "department": department,
+        "url": absolute_url,
+        "has_attachment": has_attachment,
+        "type": "교육소식",
+        "source": "동대문구청",
+        "crawled_at": datetime.now().isoformat(),
+    }
+    return date_str, item
+
+
+def parse_news_row_fast(notice):
+    """parse_news_row와 같은 결과를 내는 lxml 행 파서"""
+    return table_parser.news_row(notice, BASE_URL, VIEW_URL, LIST_URL)
 
 
 def crawl_ddm_news():
     """동대문구청 교육소식 게시판 크롤링"""
-    BASE_URL = "https://www.ddm.go.kr/www/"
-    URL_TEMPLATE = "https://www.ddm.go.kr/www/selectBbsNttList.do?key=575&bbsNo=38&searchCtgry=%ea%b5%90%ec%9c%a1&pageIndex={page}"
+    return list(iter_ddm_news())
+
 
-    # GitHub Actions 환경 체크
-    driver = get_chrome_driver()
+def iter_ddm_news():
+    """동대문구청 교육소식을 하나씩 내보내는 제너레이터"""
+    # HTTP 우선 fetcher (필요할 때만 공유 브라우저 풀 사용)
+    fetcher = get_fetcher()
 
     # 크롤링 범위 설정: 지난달 1일
     today = datetime.now().date()
@@ -34,66 +138,71 @@ def crawl_ddm_news():
     print(f"   데이터 수집 범위: {threshold_date} 이후 게시물")
     print("=" * 50 + "\n")
 
+    def load_page(page):
+        # 오류가 나면 같은 페이지를 최대 3번까지 다시 시도
+        for attempt in range(1, 4):
+            try:
+                # HTTP 우선, 목록이 없으면 브라우저로 렌더링
+                target_url = URL_TEMPLATE.format(page=page)
+                result = fetcher.fetch(target_url, "news_list", strict=True)
+                return result.tree if table_parser.FAST_PARSER else result.soup
+            except Exception as e:
+                print(f"페이지 {page} 처리 중 오류: {e}")
+                if attempt == 3:
+                    raise
+
     results = []
-    page_index = 1
     stop_crawling = False
-    consecutive_errors = 0
-
-    try:
-        while not stop_crawling and consecutive_errors < 3:
-            target_url = URL_TEMPLATE.format(page=page_index)
-            print(f"페이지 {page_index} 로딩 중...")
 
-            try:
-                driver.get(target_url)
+    # 증분 크롤링: 지난 실행에서 수집한 게시물 식별자
+    crawl_state = get_crawl_state()
+    known_ids = crawl_state.known_ids(HISTORY_KEY) if INCREMENTAL else set()
+    reached_known = False
+    failed = False
 
-                # tbody가 로드될 때까지 최대 10초 대기
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located(
-                        (By.CSS_SELECTOR, "tbody.text_center")
-                    )
-                )
+    # 현재 페이지를 파싱하는 동안 다음 페이지를 미리 요청
+    history = get_prefetch_history()
+    paginator = PrefetchPaginator(
+        load_page, expected_pages=history.expected_pages(HISTORY_KEY)
+    )
 
-                html = driver.page_source
-                soup = BeautifulSoup(html, "lxml")
+    try:
+        with paginator as pages:
+            for page_index, fetch in pages:
+                print(f"페이지 {page_index} 로딩 중...")
+                try:
+                    document = fetch()
+                except Exception:
+                    print("연속 오류 발생으로 크롤링 중단")
+                    failed = True
+                    break
 
-                notice_list = soup.select("tbody.text_center tr")
+                if table_parser.FAST_PARSER:
+                    notice_list = table_parser.select_rows(document, "news_list")
+                    parse_row = parse_news_row_fast
+                else:
+                    notice_list = document.select("tbody.text_center tr")
+                    parse_row = parse_news_row
 
                 if not notice_list:
                     print("게시물이 더 이상 없습니다. 크롤링을 종료합니다.")
                     break
 
                 page_items = 0
+                page_ids = []
+                # 행마다 yield하므로 파싱 시간만 더해서 페이지 단위로 기록
+                parse_seconds = 0.0
                 for notice in notice_list:
-                    # 공지사항(img alt="공지")은 건너뛰기
-                    if notice.find("img", alt="공지"):
-                        continue
-
-                    cells = notice.find_all("td")
-
-                    # 테이블 구조 확인: 번호(0), 제목(1), 담당부서(2), 작성일(3), 첨부(4)
-                    if len(cells) < 4:
-                        continue
-
                     try:
-                        # 날짜 추출 및 검증 - 수정된 부분
-                        date_cell = cells[3]
-                        date_text = date_cell.text.strip()
-
-                        # "작성일" 텍스트 제거 및 공백 정리
-                        date_text = date_text.replace("작성일", "").strip()
-                        # 여러 줄 공백 제거
-                        date_text = re.sub(r"\s+", " ", date_text).strip()
-
-                        # 날짜 형식 매칭 (YYYY-MM-DD)
-                        date_match = re.search(r"(\d{4}-\d{2}-\d{2})", date_text)
-                        if not date_match:
-                            print(f"날짜 형식 인식 실패: {repr(date_text)}")
+                        started = time.perf_counter()
+                        parsed = parse_row(notice)
+                        if parsed is not None:
+                            date_str, item = parsed
+                            post_date = dates.parse(date_str, today)[0]
+                        parse_seconds += time.perf_counter() - started
+                        if parsed is None:
                             continue
 
-                        date_str = date_match.group(1)
-                        post_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-
                         # 날짜가 기준일 이전이면 크롤링 중단
                         if post_date < threshold_date:
                             stop_crawling = True
@@ -102,102 +211,58 @@ def crawl_ddm_news():
                             )
                             break
 
-                        # 제목 및 URL 추출
-                        title_cell = cells[1]
-                        title_tag = title_cell.find("a")
-                        if not title_tag:
+                        # 제목 링크가 없는 행
+                        if item is None:
                             continue
 
-                        title = title_tag.text.strip()
-
-                        # onclick 속성에서 nttNo 추출하여 실제 URL 생성
-                        onclick = title_tag.get("onclick", "")
-                        href = title_tag.get("href", "")
-
-                        if onclick and "selectBbsNttView" in onclick:
-                            # onclick에서 파라미터 추출
-                            ntt_no_match = re.search(
-                                r'nttNo["\s]*[:=]["\s]*(\d+)', onclick
-                            )
-                            if ntt_no_match:
-                                ntt_no = ntt_no_match.group(1)
-                                absolute_url = f"https://www.ddm.go.kr/www/selectBbsNttView.do?key=575&bbsNo=38&nttNo={ntt_no}"
-                            else:
-                                # onclick 파싱 실패시 기본 처리
-                                absolute_url = (
-                                    BASE_URL + "selectBbsNttList.do?key=575&bbsNo=38"
-                                )
-                        elif href and href != "#" and href != "javascript:void(0);":
-                            # href가 유효한 경우
-                            if href.startswith("http"):
-                                absolute_url = href
-                            else:
-                                absolute_url = BASE_URL + href.lstrip("/")
-                        else:
-                            # URL 추출 실패
-                            print(f"URL 추출 실패: {title}")
-                            absolute_url = (
-                                BASE_URL + "selectBbsNttList.do?key=575&bbsNo=38"
-                            )
-
-                        # 담당부서 추출
-                        dept_cell = cells[2]
-                        department = dept_cell.text.strip()
-
-                        # 첨부파일 여부 확인
-                        has_attachment = False
-                        if len(cells) > 4:
-                            attachment_cell = cells[4]
-                            if (
-                                attachment_cell.find("img")
-                                or "첨부" in attachment_cell.text
-                            ):
-                                has_attachment = True
-
-                        results.append(
-                            {
-                                "title": title,
-                                "date": date_str,
-                                "department": department,
-                                "url": absolute_url,
-                                "has_attachment": has_attachment,
-                                "type": "교육소식",
-                                "source": "동대문구청",
-                                "crawled_at": datetime.now().isoformat(),
-                            }
-                        )
+                        results.append(item)
+                        page_ids.append(item_id(item))
                         page_items += 1
+                        yield item
 
                     except Exception as e:
                         print(f"항목 처리 중 오류: {e}")
                         continue
 
+                metrics.record("parse", parse_seconds, page_type="news_list")
                 print(f"  - 페이지 {page_index}: {page_items}개 항목 수집")
 
-                if not stop_crawling and page_items > 0:
-                    page_index += 1
-                    consecutive_errors = 0
-                    time.sleep(1)  # 페이지 간 1초 대기
-                elif page_items == 0:
+                if stop_crawling:
+                    # 남은 선행 요청은 paginator가 취소/폐기
+                    break
+                if page_is_known(page_ids, known_ids):
+                    reached_known = True
+                    print("이전 수집 항목에 도달. 증분 크롤링 종료.")
+                    break
+                if page_items == 0:
                     # 빈 페이지인 경우 종료
                     print("더 이상 게시물이 없습니다.")
                     break
 
-            except Exception as e:
-                print(f"페이지 {page_index} 처리 중 오류: {e}")
-                consecutive_errors += 1
-                if consecutive_errors >= 3:
-                    print("연속 오류 발생으로 크롤링 중단")
-                    break
-                time.sleep(2)  # 오류 발생시 2초 대기
-
     except Exception as e:
         print(f"크롤러 실행 중 치명적 오류: {e}")
-    finally:
-        driver.quit()
+        failed = True
+
+    if paginator.consumed:
+        history.record(HISTORY_KEY, paginator.consumed)
+
+    if INCREMENTAL:
+        # 이미 아는 게시물에서 멈췄다면 이전 결과 중 아직 범위 안의 게시물을 합칩니다.
+        if reached_known:
+            new_count = len(results)
+            with metrics.timer("filter"):
+                results = crawl_state.merge(
+                    HISTORY_KEY,
+                    results,
+                    keep=lambda item: dates.ends_on_or_after(
+                        item["date"], threshold_date, today
+                    ),
+                )
+            yield from results[new_count:]
+        if not failed:
+            crawl_state.record(HISTORY_KEY, results, full=not reached_known)
 
     print(f"\n총 {len(results)}개의 교육소식을 수집했습니다.")
-    return results
 
 
 # 테스트용 실행
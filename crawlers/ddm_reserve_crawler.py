@@ -1,15 +1,20 @@
 # crawlers/ddm_reserve_crawler.py
-import time
 import json
+import os
 
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import urljoin
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from .common import get_chrome_driver  # 추가
+from .common import DDM_BASE_URL
+from .fetchers import get_fetcher
+from .metrics import metrics, submit_with_context
+from . import table_parser
+
+# 두 번째 페이지부터 동시에 가져올 페이지 수와 목록당 최대 페이지 수
+PAGE_WORKERS = int(os.environ.get("CRAWLER_RESERVE_PAGE_WORKERS", "4"))
+MAX_PAGES = int(os.environ.get("CRAWLER_RESERVE_MAX_PAGES", "30"))
+# 페이지 요청이 실패했을 때 다시 시도할 횟수 (모두 실패하면 목록 전체를 실패로 처리)
+PAGE_RETRIES = int(os.environ.get("CRAWLER_RESERVE_PAGE_RETRIES", "2"))
 
 
 class DDMReserveCrawler:
@@ -17,32 +22,102 @@ class DDMReserveCrawler:
 
     def __init__(self):
         """크롤러 초기화"""
-        self.base_url = "https://www.ddm.go.kr"
+        self.base_url = DDM_BASE_URL
+        self.fetcher = get_fetcher()
 
-    def _get_soup(self, url, params=None):
+    def _fetch_page(self, url, page_type=None):
+        """
+        페이지를 가져와 FetchResult(.tree / .soup)를 반환하는 헬퍼 함수.
+        HTTP로 먼저 시도하고, 목록이 비어 있으면 실제 브라우저로 렌더링합니다.
+        오류가 나면 PAGE_RETRIES번 다시 시도하고, 그래도 실패하면 None.
+        """
+        for attempt in range(1, PAGE_RETRIES + 2):
+            try:
+                return self.fetcher.fetch(url, page_type)
+            except Exception as e:
+                print(f"Error fetching {url} (시도 {attempt}): {e}")
+        return None
+
+    @staticmethod
+    def _page_url(url, page_index):
+        separator = "&" if "?" in url else "?"
+        return f"{url}{separator}pageIndex={page_index}"
+
+    def _iter_pages(self, url, page_type):
         """
-        Selenium을 사용해 BeautifulSoup 객체를 반환하는 헬퍼 함수.
-        실제 브라우저를 구동하여 자바스크립트 렌더링과 봇 차단을 우회합니다.
+        목록의 모든 페이지를 페이지 순서대로 내보냅니다.
+        첫 페이지의 페이지 목록에서 마지막 페이지를 읽어 나머지를 동시에 가져오고,
+        빈 페이지가 나오면 남은 요청을 취소합니다.
+        다시 시도해도 받지 못한 페이지가 있으면 목록이 잘린 채 성공으로 기록되지 않도록 예외를 냅니다.
         """
-        driver = None
-        try:
-            driver = get_chrome_driver()
-
-            # 페이지 접속
-            driver.get(url)
-            # 페이지 로딩 대기
-            time.sleep(3)
-
-            # 렌더링된 HTML을 BeautifulSoup으로 변환
-            html = driver.page_source
-            return BeautifulSoup(html, "lxml")
-
-        except Exception as e:
-            print(f"Error fetching {url} with Selenium: {e}")
-            return None
-        finally:
-            if driver:
-                driver.quit()
+        first = self._fetch_page(url, page_type=page_type)
+        if first is None:
+            raise RuntimeError(f"1페이지를 가져오지 못함: {url}")
+        yield first
+
+        fetched = 1
+        last_page = min(MAX_PAGES, table_parser.pager_last_page(first.tree))
+        with ThreadPoolExecutor(
+            max_workers=PAGE_WORKERS, thread_name_prefix="reserve-page"
+        ) as executor:
+            while fetched < last_page:
+                futures = [
+                    (
+                        page_index,
+                        submit_with_context(
+                            executor,
+                            self._fetch_page,
+                            self._page_url(url, page_index),
+                            page_type,
+                        ),
+                    )
+                    for page_index in range(fetched + 1, last_page + 1)
+                ]
+                page = None
+                for page_index, future in futures:
+                    page = future.result()
+                    if page is None or not table_parser.select_rows(page.tree, page_type):
+                        for _, pending in futures:
+                            pending.cancel()
+                        if page is None:
+                            raise RuntimeError(f"{page_index}페이지를 가져오지 못함: {url}")
+                        print(f"     -> {page_index}페이지가 비어 있어 중단")
+                        return
+                    yield page
+
+                # 페이지 번호가 10개씩만 보이면 마지막으로 받은 페이지에서 다음 범위를 확인
+                fetched = last_page
+                last_page = min(
+                    MAX_PAGES, max(last_page, table_parser.pager_last_page(page.tree))
+                )
+        if fetched >= MAX_PAGES:
+            print(f"     -> 최대 {MAX_PAGES}페이지까지만 수집했습니다.")
+
+    def _programs_from(self, page, status):
+        """'전체프로그램' 목록 파싱 (기본은 lxml 빠른 파서)"""
+        with metrics.timer("parse", page_type="reserve_programs"):
+            if not table_parser.FAST_PARSER:
+                return self._parse_programs(page.soup, status)
+            programs = table_parser.reserve_programs(page.tree, status, self.base_url)
+        if programs:
+            print(f"     -> 전체프로그램 {status}: {len(programs)}개")
+        else:
+            print(f"     -> 전체프로그램 {status}: 데이터 없음")
+        return programs
+
+    def _receptions_from(self, page, status):
+        """'온라인접수' 목록 파싱 (기본은 lxml 빠른 파서)"""
+        with metrics.timer("parse", page_type="reserve_receptions"):
+            if not table_parser.FAST_PARSER:
+                return self._parse_online_receptions(page.soup, status)
+            receptions = table_parser.reserve_receptions(
+                page.tree, status, self.base_url
+            )
+        if receptions:
+            print(f"     -> 온라인접수 {status}: {len(receptions)}개")
+        else:
+            print(f"     -> 온라인접수 {status}: 데이터 없음")
+        return receptions
 
     def _parse_programs(self, soup, status):
         """'전체프로그램' 페이지의 목록을 파싱"""
@@ -147,43 +222,46 @@ class DDMReserveCrawler:
 
     def crawl_all(self):
         """모든 예약/접수 프로그램을 크롤링"""
+        return list(self.iter_all())
+
+    def iter_all(self):
+        """모든 예약/접수 프로그램을 하나씩 내보내는 제너레이터"""
         print("\n" + "=" * 50)
         print("   [동대문구 예약포털] 크롤링 시작")
         print("=" * 50 + "\n")
 
-        all_results = []
+        total = 0
 
         program_urls = {
-            "접수예정": "https://www.ddm.go.kr/reserve/selectDongdaemunUserCourseList.do?searchEduInstSe=&key=1529&searchEdcKey=&searchEdcRealm=&searchTime=%EC%A0%91%EC%88%98%EA%B8%B0%EA%B0%84&timeBgnde=&timeEndde=&receptionStts=TBCCPT&searchCnd=SJ&searchKrwd=",
-            "접수중": "https://www.ddm.go.kr/reserve/selectDongdaemunUserCourseList.do?searchEduInstSe=&key=1529&searchEdcKey=&searchEdcRealm=&searchTime=%EC%A0%91%EC%88%98%EA%B8%B0%EA%B0%84&timeBgnde=&timeEndde=&receptionStts=ACCPT&searchCnd=SJ&searchKrwd=",
+            "접수예정": f"{DDM_BASE_URL}/reserve/selectDongdaemunUserCourseList.do?searchEduInstSe=&key=1529&searchEdcKey=&searchEdcRealm=&searchTime=%EC%A0%91%EC%88%98%EA%B8%B0%EA%B0%84&timeBgnde=&timeEndde=&receptionStts=TBCCPT&searchCnd=SJ&searchKrwd=",
+            "접수중": f"{DDM_BASE_URL}/reserve/selectDongdaemunUserCourseList.do?searchEduInstSe=&key=1529&searchEdcKey=&searchEdcRealm=&searchTime=%EC%A0%91%EC%88%98%EA%B8%B0%EA%B0%84&timeBgnde=&timeEndde=&receptionStts=ACCPT&searchCnd=SJ&searchKrwd=",
         }
 
         print("1. [전체프로그램] 크롤링")
         for status, url in program_urls.items():
             print(f"   - {status} 페이지 로딩...")
-            soup = self._get_soup(url)
-            if soup:
-                programs = self._parse_programs(soup, status)
-                all_results.extend(programs)
+            for page in self._iter_pages(url, "reserve_programs"):
+                programs = self._programs_from(page, status)
+                total += len(programs)
+                yield from programs
             # Selenium은 자체적으로 로딩 시간이 있으므로 time.sleep()을 줄이거나 제거해도 됩니다.
             # time.sleep(1)
 
         reception_urls = {
-            "접수예정": "https://www.ddm.go.kr/reserve/selectUserOnlineReceptionList.do?key=3133&searchCnd=TBCCPT",
-            "접수중": "https://www.ddm.go.kr/reserve/selectUserOnlineReceptionList.do?key=3133&searchCnd=ACCPT",
+            "접수예정": f"{DDM_BASE_URL}/reserve/selectUserOnlineReceptionList.do?key=3133&searchCnd=TBCCPT",
+            "접수중": f"{DDM_BASE_URL}/reserve/selectUserOnlineReceptionList.do?key=3133&searchCnd=ACCPT",
         }
 
         print("\n2. [온라인접수] 크롤링")
         for status, url in reception_urls.items():
             print(f"   - {status} 페이지 로딩...")
-            soup = self._get_soup(url)
-            if soup:
-                receptions = self._parse_online_receptions(soup, status)
-                all_results.extend(receptions)
+            for page in self._iter_pages(url, "reserve_receptions"):
+                receptions = self._receptions_from(page, status)
+                total += len(receptions)
+                yield from receptions
             # time.sleep(1)
 
-        print(f"\n총 {len(all_results)}개의 예약/접수 정보를 수집했습니다.")
-        return all_results
+        print(f"\n총 {total}개의 예약/접수 정보를 수집했습니다.")
 
 
 # --- 테스트 실행 코드 ---
@@ -0,0 +1,258 @@
+# crawlers/details.py
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+
+from .common import DDM_BASE_URL, HTTP_TIMEOUT, get_http_session, host_slot, state_path
+from .crawl_state import item_id
+from .metrics import metrics, submit_with_context
+from .publish import content_hash
+from . import table_parser
+from .table_parser import has_class
+
+# 목록 항목의 상세 페이지를 가져와 본문/첨부/일정 정보를 덧붙이는 선택 단계
+ENRICH = os.environ.get("CRAWLER_ENRICH_DETAILS", "false").lower() == "true"
+# 동시에 가져올 상세 페이지 수 (호스트별 상한 host_slot도 함께 적용)
+DETAIL_WORKERS = int(os.environ.get("CRAWLER_DETAIL_WORKERS", "4"))
+# 목록 항목이 그대로여도 이 기간이 지나면 상세 페이지를 다시 확인
+DETAIL_MAX_AGE = float(os.environ.get("CRAWLER_DETAIL_MAX_AGE_DAYS", "14")) * 86400
+
+# 본문 영역 후보 (먼저 찾은 것 사용)
+CONTENT_XPATHS = (
+    f"//*[{has_class('p-table__content')}]",
+    f"//*[{has_class('bbs_con')}]",
+    f"//*[{has_class('view_cont')}]",
+    f"//*[{has_class('board_view')}]//*[{has_class('content')}]",
+    f"//*[{has_class('program_detail')}]",
+    "//*[@id='contents']//article",
+)
+ATTACHMENT_PATTERN = re.compile(r"(fileDown|download|atchFile|FileDown)", re.I)
+# 링크가 없는 항목이 대신 갖는 주소 (상세 페이지가 아니므로 가져오지 않음)
+NON_DETAIL_URLS = (DDM_BASE_URL,)
+# 일정 관련 항목 이름 (상세 표의 th/dt)
+SCHEDULE_LABELS = ("기간", "일시", "시간", "일정", "요일", "장소", "대상", "정원", "모집")
+
+
+def _clean(value):
+    return re.sub(r"\s+", " ", value).strip()
+
+
+def parse_detail(html, url):
+    """상세 페이지에서 {"description", "attachments", "fields", "schedule"} 추출"""
+    tree = table_parser.parse_html(html)
+
+    description = ""
+    for xpath in CONTENT_XPATHS:
+        found = tree.xpath(xpath)
+        if found:
+            description = table_parser.get_text(found[0], "\n", strip=True)
+            break
+
+    attachments = []
+    seen = set()
+    for link in tree.iter("a"):
+        href = link.get("href", "")
+        onclick = link.get("onclick", "")
+        if not (ATTACHMENT_PATTERN.search(href) or ATTACHMENT_PATTERN.search(onclick)):
+            continue
+        target = urljoin(url, href) if href and not href.startswith("javascript") else ""
+        name = _clean(table_parser.text(link)) or link.get("title", "")
+        key = (name, target)
+        if name and key not in seen:
+            seen.add(key)
+            attachments.append({"name": name, "url": target})
+
+    # 상세 표의 항목 이름/값 (th-td, dt-dd)
+    fields = {}
+    for label_tag, value_tag in (("th", "td"), ("dt", "dd")):
+        for label in tree.iter(label_tag):
+            value = label.getnext()
+            while value is not None and value.tag != value_tag:
+                value = value.getnext()
+            if value is None:
+                continue
+            name = _clean(table_parser.text(label))
+            if name and name not in fields:
+                fields[name] = _clean(table_parser.get_text(value, " ", strip=True))
+
+    schedule = {
+        name: value
+        for name, value in fields.items()
+        if any(word in name for word in SCHEDULE_LABELS)
+    }
+    return {
+        "description": description,
+        "attachments": attachments,
+        "fields": fields,
+        "schedule": schedule,
+    }
+
+
+class DetailCache:
+    """
+    식별자(nttNo 또는 URL)별 상세 정보 캐시.
+    목록 항목 해시가 같고 max_age 안이면 상세 페이지를 다시 받지 않고,
+    다시 받았더라도 본문 해시가 같으면 이전 추출 결과를 재사용합니다.
+    """
+
+    def __init__(self, path=None, max_age=DETAIL_MAX_AGE):
+        self.path = path or state_path("detail_cache.json")
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._dirty = False
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._data = json.load(f)
+        except (OSError, ValueError):
+            self._data = {}
+
+    def get(self, key, row_hash):
+        with self._lock:
+            entry = self._data.get(key)
+        if not entry or entry.get("row_hash") != row_hash:
+            return None
+        if time.time() - entry.get("fetched_at", 0) > self.max_age:
+            return None
+        return entry["detail"]
+
+    def reuse_if_same_body(self, key, body_hash):
+        with self._lock:
+            entry = self._data.get(key)
+        if entry and entry.get("body_hash") == body_hash:
+            return entry["detail"]
+        return None
+
+    def set(self, key, row_hash, body_hash, detail):
+        with self._lock:
+            self._data[key] = {
+                "row_hash": row_hash,
+                "body_hash": body_hash,
+                "detail": detail,
+                "fetched_at": time.time(),
+            }
+            self._dirty = True
+
+    def save(self):
+        """변경이 있으면 저장 (오래된 항목은 정리)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            cutoff = time.time() - self.max_age * 2
+            self._data = {
+                k: v for k, v in self._data.items() if v.get("fetched_at", 0) >= cutoff
+            }
+            try:
+                with open(self.path, "w", encoding="utf-8") as f:
+                    json.dump(self._data, f, ensure_ascii=False)
+                self._dirty = False
+            except OSError as e:
+                print(f"   [detail] 캐시 저장 실패: {e}")
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_detail_cache():
+    """프로세스 전체에서 공유하는 DetailCache를 반환"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = DetailCache()
+        return _cache
+
+
+class DetailEnricher:
+    """목록 항목의 url 상세 페이지를 동시에 가져와 item["detail"]을 채웁니다."""
+
+    def __init__(self, workers=None, cache=None, session=None, skip_urls=()):
+        self.workers = workers or DETAIL_WORKERS
+        self.skip_urls = {url.rstrip("/") for url in NON_DETAIL_URLS + tuple(skip_urls)}
+        self.cache = cache or get_detail_cache()
+        self.session = session or get_http_session("detail")
+        self.stats = {"fetched": 0, "cached": 0, "failed": 0}
+        self._lock = threading.Lock()
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _detail_for(self, item):
+        url = item.get("url") or ""
+        if not url.startswith("http") or url.rstrip("/") in self.skip_urls:
+            return None
+        key = item_id(item)
+        row_hash = content_hash(item)
+        detail = self.cache.get(key, row_hash)
+        if detail is not None:
+            self._count("cached")
+            return detail
+
+        try:
+            with metrics.timer("fetch", via="http", page_type="detail"):
+                with host_slot(url):
+                    response = self.session.get(url, timeout=HTTP_TIMEOUT)
+                response.raise_for_status()
+        except Exception as e:
+            print(f"   [detail] 가져오기 실패 ({url}): {e}")
+            self._count("failed")
+            return None
+
+        self._count("fetched")
+        body_hash = hashlib.sha256(response.content).hexdigest()
+        detail = self.cache.reuse_if_same_body(key, body_hash)
+        if detail is None:
+            with metrics.timer("parse", page_type="detail"):
+                detail = parse_detail(response.content, url)
+        self.cache.set(key, row_hash, body_hash, detail)
+        return detail
+
+    def _enrich(self, item):
+        detail = self._detail_for(item)
+        if detail is None:
+            return item
+        return dict(item, detail=detail)
+
+    def iter_enriched(self, records, grouped=False):
+        """
+        레코드를 입력 순서대로 내보내되, 최대 workers*2개를 미리 요청해 두고 동시에 가져옵니다.
+        grouped이면 레코드는 (그룹, 항목) 쌍입니다.
+        """
+        window = deque()
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="detail"
+        ) as executor:
+            try:
+                for record in records:
+                    group, item = record if grouped else (None, record)
+                    window.append((group, submit_with_context(executor, self._enrich, item)))
+                    if len(window) >= self.workers * 2:
+                        group, future = window.popleft()
+                        yield (group, future.result()) if grouped else future.result()
+                while window:
+                    group, future = window.popleft()
+                    yield (group, future.result()) if grouped else future.result()
+            finally:
+                for _, future in window:
+                    future.cancel()
+                self.cache.save()
+                print(
+                    f"   [detail] 상세 페이지 {self.stats['fetched']}개 요청, "
+                    f"캐시 {self.stats['cached']}개, 실패 {self.stats['failed']}개"
+                )
+
+
+def enrich(records, grouped=False, skip_urls=()):
+    """
+    ENRICH가 켜져 있으면 상세 정보를 덧붙인 레코드, 아니면 그대로.
+    skip_urls: 링크가 없을 때 대신 들어가는 목록 주소 등 상세 페이지가 아닌 주소
+    """
+    if not ENRICH:
+        return records
+    return DetailEnricher(skip_urls=skip_urls).iter_enriched(records, grouped=grouped)
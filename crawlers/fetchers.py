@@ -0,0 +1,205 @@
+# crawlers/fetchers.py
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from urllib.parse import parse_qs, urlsplit
+
+from bs4 import BeautifulSoup
+
+from .common import (
+    HTTP_TIMEOUT,
+    create_http_session,
+    get_driver_pool,
+    host_slot,
+    state_path,
+)
+from .http_cache import get_http_cache
+from .metrics import metrics
+from .replay import record_page
+from . import table_parser
+from .waits import wait_until_ready
+
+# 페이지 유형별 "정상적으로 받은 페이지"를 판단하는 행 선택자
+ROW_SELECTORS = {
+    "news_list": "tbody.text_center tr",
+    "reserve_programs": "div.program.lecture tbody.text_center tr",
+    "reserve_receptions": "div.online_accept.list tbody.text_center tr",
+}
+
+# HTTP 응답이 렌더링 전 껍데기임을 나타내는 문구 (있으면 브라우저로 전환)
+RENDER_MARKERS = (
+    b"enable JavaScript",
+    "자바스크립트를 활성화".encode("utf-8"),
+)
+
+# 브라우저 경로로 기억된 URL 패턴도 이 기간이 지나면 HTTP를 다시 시도
+STRATEGY_TTL = timedelta(days=int(os.environ.get("CRAWLER_STRATEGY_TTL_DAYS", "7")))
+
+
+class FetchResult:
+    def __init__(self, url, html, via):
+        self.url = url
+        self.html = html
+        self.via = via
+        self._soup = None
+        self._tree = None
+
+    @property
+    def soup(self):
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.html, "lxml")
+        return self._soup
+
+    @property
+    def tree(self):
+        """목록 행 추출용 lxml 트리 (BeautifulSoup 트리보다 훨씬 가볍습니다)"""
+        if self._tree is None:
+            self._tree = table_parser.parse_html(self.html)
+        return self._tree
+
+
+class HttpFetcher:
+    """requests + lxml로 페이지를 가져오는 가벼운 경로"""
+
+    name = "http"
+
+    def __init__(self, session=None, timeout=HTTP_TIMEOUT, cache=None):
+        self.session = session or create_http_session()
+        self.timeout = timeout
+        # 조건부 GET 캐시 (변경 없는 목록은 304로 본문 전송 생략)
+        self.cache = cache if cache is not None else get_http_cache()
+
+    def fetch(self, url, page_type=None, strict=False):
+        with metrics.timer("fetch", via=self.name, page_type=page_type):
+            if self.cache is not None:
+                response = self.cache.get(self.session, url, timeout=self.timeout)
+                return FetchResult(url, response.content, self.name)
+
+            with host_slot(url):
+                response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        # 인코딩 판별은 BeautifulSoup에 맡기기 위해 bytes 그대로 전달
+        return FetchResult(url, response.content, self.name)
+
+
+class BrowserFetcher:
+    """공유 DriverPool의 Chrome으로 렌더링하는 경로"""
+
+    name = "browser"
+
+    def __init__(self, pool=None, profile="ddm"):
+        self.pool = pool
+        self.profile = profile
+
+    def fetch(self, url, page_type=None, strict=False):
+        pool = self.pool or get_driver_pool()
+        with pool.checkout(profile=self.profile) as driver:
+            with metrics.timer("navigate", page_type=page_type):
+                driver.get(url)
+            if page_type:
+                wait_until_ready(driver, page_type, raise_on_timeout=strict)
+            with metrics.timer("fetch", via=self.name, page_type=page_type):
+                html = driver.page_source
+        record_page(url, html)
+        return FetchResult(url, html, self.name)
+
+
+class StrategyStore:
+    """URL 패턴별로 성공한 fetch 경로를 기억하는 JSON 저장소"""
+
+    def __init__(self, path=None):
+        self.path = path or state_path("fetch_strategy.json")
+        self._lock = threading.Lock()
+        self._data = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, pattern):
+        with self._lock:
+            entry = self._data.get(pattern)
+        if not entry:
+            return None
+        updated_at = datetime.fromisoformat(entry["updated_at"])
+        if entry["via"] == "browser" and datetime.now() - updated_at > STRATEGY_TTL:
+            return None
+        return entry["via"]
+
+    def set(self, pattern, via):
+        with self._lock:
+            if self._data.get(pattern, {}).get("via") == via:
+                return
+            self._data[pattern] = {"via": via, "updated_at": datetime.now().isoformat()}
+            try:
+                with open(self.path, "w", encoding="utf-8") as f:
+                    json.dump(self._data, f, ensure_ascii=False, indent=2)
+            except OSError as e:
+                print(f"   [fetch] 전략 저장 실패: {e}")
+
+
+def url_pattern(url, page_type=None):
+    """페이지 번호 등을 제외한 URL 패턴 (호스트 + 경로 + 메뉴 key)"""
+    parts = urlsplit(url)
+    key = parse_qs(parts.query).get("key", [""])[0]
+    return f"{page_type or ''}|{parts.netloc}{parts.path}?key={key}"
+
+
+class AdaptiveFetcher:
+    """
+    HTTP를 먼저 시도하고, 목록 영역이 없거나 렌더링 전 페이지이면 브라우저로 다시 가져옵니다.
+    목록 영역은 있는데 행이 없으면(빈 목록, 마지막 다음 페이지) HTTP 결과를 그대로 씁니다.
+    URL 패턴별로 성공한 경로를 기억해 다음부터는 바로 그 경로를 사용합니다.
+    """
+
+    def __init__(self, http=None, browser=None, strategies=None):
+        self.http = http or HttpFetcher()
+        self.browser = browser or BrowserFetcher()
+        self.strategies = strategies or StrategyStore()
+
+    def fetch(self, url, page_type, strict=False):
+        pattern = url_pattern(url, page_type)
+
+        if self.strategies.get(pattern) != "browser":
+            try:
+                result = self.http.fetch(url, page_type)
+                if self._is_rendered(result, page_type):
+                    self.strategies.set(pattern, "http")
+                    return result
+            except Exception as e:
+                print(f"   [fetch] HTTP 실패, 브라우저로 전환 ({url}): {e}")
+
+        result = self.browser.fetch(url, page_type, strict=strict)
+        if self._is_rendered(result, page_type):
+            self.strategies.set(pattern, "browser")
+        return result
+
+    @staticmethod
+    def _is_rendered(result, page_type):
+        """목록 영역이 있고 렌더링 전 페이지 표시가 없는지 (행이 없어도 True)"""
+        selector = ROW_SELECTORS.get(page_type)
+        if not selector:
+            return True
+        html = result.html if isinstance(result.html, bytes) else result.html.encode("utf-8")
+        if any(marker in html for marker in RENDER_MARKERS):
+            return False
+        if table_parser.FAST_PARSER:
+            return table_parser.has_list_container(result.tree, page_type)
+        return bool(result.soup.select(selector.rsplit(" tr", 1)[0]))
+
+
+_fetcher = None
+_fetcher_lock = threading.Lock()
+
+
+def get_fetcher():
+    """프로세스 전체에서 공유하는 AdaptiveFetcher를 반환"""
+    global _fetcher
+    with _fetcher_lock:
+        if _fetcher is None:
+            _fetcher = AdaptiveFetcher()
+        return _fetcher
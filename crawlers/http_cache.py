@@ -0,0 +1,192 @@
+# crawlers/http_cache.py
+import hashlib
+import json
+import os
+import threading
+import time
+
+import requests
+
+from .common import HTTP_TIMEOUT, host_slot, state_path
+from .replay import RECORD_DIR
+
+CACHE_ENABLED = os.environ.get("CRAWLER_HTTP_CACHE", "true").lower() == "true"
+CACHE_MAX_BYTES = int(os.environ.get("CRAWLER_HTTP_CACHE_MAX_MB", "50")) * 1024 * 1024
+CACHE_MAX_AGE = float(os.environ.get("CRAWLER_HTTP_CACHE_MAX_AGE_DAYS", "14")) * 86400
+
+
+class CachedResponse:
+    def __init__(self, url, content, body_hash, from_cache, unchanged, entry):
+        self.url = url
+        self.content = content
+        self.body_hash = body_hash
+        # 304 응답으로 캐시 본문을 사용했는지
+        self.from_cache = from_cache
+        # 본문이 지난번과 같은지 (304 또는 해시 일치)
+        self.unchanged = unchanged
+        self._entry = entry
+
+
+class HttpCache:
+    """
+    목록 페이지용 디스크 HTTP 캐시.
+
+    - ETag/Last-Modified를 저장해 조건부 요청(If-None-Match/If-Modified-Since)을 보냅니다.
+    - 304 응답이거나 본문 해시가 같으면 이전에 저장한 파싱 결과를 재사용할 수 있습니다.
+    - 오래된 항목(max_age)과 용량 초과분(max_bytes, 오래 안 쓴 순)을 정리합니다.
+    """
+
+    def __init__(self, directory=None, max_bytes=CACHE_MAX_BYTES, max_age=CACHE_MAX_AGE):
+        self.directory = directory or state_path("http_cache")
+        os.makedirs(self.directory, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self.prune()
+
+    def _paths(self, url):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, key)
+        return base + ".json", base + ".body"
+
+    def _load(self, url):
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None, None
+        return meta, body
+
+    def _write(self, path, data, binary=False):
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        if binary:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+        else:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def get(self, session, url, params=None, timeout=HTTP_TIMEOUT):
+        """조건부 GET. 변경이 없으면 캐시된 본문을 돌려줍니다."""
+        url = requests.Request("GET", url, params=params).prepare().url
+        meta, body = self._load(url)
+
+        headers = {}
+        if meta:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        with host_slot(url):
+            response = session.get(url, headers=headers, timeout=timeout)
+
+        now = time.time()
+        if response.status_code == 304 and meta:
+            meta["accessed_at"] = now
+            self._store_meta(url, meta)
+            return CachedResponse(url, body, meta["body_hash"], True, True, meta)
+
+        response.raise_for_status()
+        content = response.content
+        body_hash = hashlib.sha256(content).hexdigest()
+        unchanged = bool(meta) and meta.get("body_hash") == body_hash
+
+        entry = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "body_hash": body_hash,
+            "size": len(content),
+            "stored_at": meta["stored_at"] if unchanged else now,
+            "accessed_at": now,
+            # 본문이 같을 때만 이전 파싱 결과 유지
+            "parsed": meta.get("parsed", {}) if unchanged else {},
+        }
+        meta_path, body_path = self._paths(url)
+        try:
+            if not unchanged:
+                self._write(body_path, content, binary=True)
+            self._write(meta_path, entry)
+        except OSError as e:
+            print(f"   [http_cache] 저장 실패 ({url}): {e}")
+        return CachedResponse(url, content, body_hash, False, unchanged, entry)
+
+    def _store_meta(self, url, meta):
+        meta_path, _ = self._paths(url)
+        try:
+            self._write(meta_path, meta)
+        except OSError as e:
+            print(f"   [http_cache] 저장 실패 ({url}): {e}")
+
+    def get_parsed(self, response, parse_key):
+        """같은 본문에 대해 저장된 파싱 결과 (없으면 None)"""
+        if not response.unchanged:
+            return None
+        return response._entry.get("parsed", {}).get(parse_key)
+
+    def set_parsed(self, response, parse_key, parsed):
+        """JSON으로 저장 가능한 파싱 결과를 본문 해시와 함께 보관"""
+        with self._lock:
+            response._entry.setdefault("parsed", {})[parse_key] = parsed
+            self._store_meta(response.url, response._entry)
+
+    def prune(self):
+        """오래된 항목과 용량 초과 항목 삭제"""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+
+        now = time.time()
+        entries = []
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            meta_path = os.path.join(self.directory, name)
+            body_path = meta_path[: -len(".json")] + ".body"
+            try:
+                with open(meta_path, encoding="utf-8") as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                meta = {}
+            accessed_at = meta.get("accessed_at", 0)
+            if now - meta.get("stored_at", 0) > self.max_age:
+                self._remove(meta_path, body_path)
+                continue
+            entries.append((accessed_at, meta.get("size", 0), meta_path, body_path))
+
+        total = sum(size for _, size, _, _ in entries)
+        for _, size, meta_path, body_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(meta_path, body_path)
+            total -= size
+
+    @staticmethod
+    def _remove(*paths):
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache():
+    """공유 HttpCache (CRAWLER_HTTP_CACHE=false이거나 녹화 중이면 None)"""
+    global _cache
+    # 녹화 중에는 304 대신 전체 본문을 받아야 하므로 캐시를 쓰지 않습니다.
+    if not CACHE_ENABLED or RECORD_DIR:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = HttpCache()
+        return _cache
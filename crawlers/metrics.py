@@ -0,0 +1,172 @@
+# crawlers/metrics.py
+import contextvars
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# 선택 출력: Prometheus textfile collector용 파일과 JSON Lines 이벤트 로그
+PROM_PATH = os.environ.get("CRAWLER_METRICS_PROM")
+EVENTS_PATH = os.environ.get("CRAWLER_METRICS_EVENTS")
+
+# 단계 이름 (요약에서 이 순서로 표시)
+PHASES = (
+    "driver_startup",
+    "navigate",
+    "wait",
+    "fetch",
+    "parse",
+    "filter",
+    "serialize",
+    "upload",
+)
+
+# 현재 실행 중인 소스 이름. 작업 스레드로 넘길 때는 submit_with_context를 사용합니다.
+_current_source = contextvars.ContextVar("metrics_source", default=None)
+
+
+@contextmanager
+def source_scope(name):
+    """블록 안에서 기록되는 단계 시간을 name 소스로 집계"""
+    token = _current_source.set(name)
+    try:
+        yield
+    finally:
+        _current_source.reset(token)
+
+
+def submit_with_context(executor, fn, *args):
+    """현재 소스 정보를 유지한 채 executor에 작업을 넣습니다."""
+    return executor.submit(contextvars.copy_context().run, fn, *args)
+
+
+def _percentile(sorted_values, q):
+    index = max(0, math.ceil(q * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def histogram(values):
+    """count/p50/p95/max/합계 (초)"""
+    values = sorted(values)
+    if not values:
+        return {"count": 0, "total_sec": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+    return {
+        "count": len(values),
+        "total_sec": round(sum(values), 4),
+        "p50": round(_percentile(values, 0.5), 4),
+        "p95": round(_percentile(values, 0.95), 4),
+        "max": round(values[-1], 4),
+    }
+
+
+class Metrics:
+    """단계별 소요 시간 기록 (페이지 단위 이벤트를 모아 소스별/단계별 히스토그램으로 요약)"""
+
+    def __init__(self, events_path=EVENTS_PATH):
+        self._lock = threading.Lock()
+        self._samples = []
+        self.events_path = events_path
+
+    def reset(self, sources=None):
+        """기록 삭제. sources를 주면 그 소스(None은 공용)의 기록만 삭제"""
+        with self._lock:
+            if sources is None:
+                self._samples = []
+            else:
+                sources = set(sources)
+                self._samples = [s for s in self._samples if s[0] not in sources]
+
+    def record(self, phase, seconds, **labels):
+        source = labels.pop("source", None) or _current_source.get()
+        with self._lock:
+            self._samples.append((source, phase, seconds))
+            if self.events_path:
+                event = {
+                    "ts": datetime.now().isoformat(),
+                    "phase": phase,
+                    "seconds": round(seconds, 6),
+                    "source": source,
+                }
+                event.update(labels)
+                try:
+                    with open(self.events_path, "a", encoding="utf-8") as f:
+                        f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                except OSError as e:
+                    print(f"   [metrics] 이벤트 기록 실패: {e}")
+
+    @contextmanager
+    def timer(self, phase, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - started, **labels)
+
+    def summary(self):
+        """{"phases": {단계: 히스토그램}, "sources": {소스: {단계: 히스토그램}}}"""
+        with self._lock:
+            samples = list(self._samples)
+
+        by_phase = {}
+        by_source = {}
+        for source, phase, seconds in samples:
+            by_phase.setdefault(phase, []).append(seconds)
+            by_source.setdefault(source or "shared", {}).setdefault(phase, []).append(
+                seconds
+            )
+
+        def ordered(groups):
+            names = [p for p in PHASES if p in groups]
+            names += sorted(p for p in groups if p not in PHASES)
+            return {name: histogram(groups[name]) for name in names}
+
+        return {
+            "phases": ordered(by_phase),
+            "sources": {name: ordered(groups) for name, groups in by_source.items()},
+        }
+
+    def write_prometheus(self, path=None, summary=None):
+        """
+        node_exporter textfile collector 형식으로 저장 (임시 파일 후 교체).
+        summary를 주면 현재 기록 대신 그 요약({"sources": ...})을 씁니다.
+        """
+        path = path or PROM_PATH
+        if not path:
+            return
+        summary = summary or self.summary()
+        lines = [
+            "# HELP crawler_phase_seconds Crawl phase duration by source.",
+            "# TYPE crawler_phase_seconds summary",
+        ]
+        for source, phases in summary["sources"].items():
+            for phase, h in phases.items():
+                labels = f'source="{source}",phase="{phase}"'
+                lines.append(f'crawler_phase_seconds{{{labels},quantile="0.5"}} {h["p50"]}')
+                lines.append(f'crawler_phase_seconds{{{labels},quantile="0.95"}} {h["p95"]}')
+                lines.append(f"crawler_phase_seconds_sum{{{labels}}} {h['total_sec']}")
+                lines.append(f"crawler_phase_seconds_count{{{labels}}} {h['count']}")
+        lines.append("# HELP crawler_phase_seconds_max Slowest observation per phase.")
+        lines.append("# TYPE crawler_phase_seconds_max gauge")
+        for source, phases in summary["sources"].items():
+            for phase, h in phases.items():
+                lines.append(
+                    f'crawler_phase_seconds_max{{source="{source}",phase="{phase}"}} {h["max"]}'
+                )
+        lines.append("# HELP crawler_last_run_timestamp_seconds Time the crawl finished.")
+        lines.append("# TYPE crawler_last_run_timestamp_seconds gauge")
+        lines.append(f"crawler_last_run_timestamp_seconds {time.time():.0f}")
+
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"   [metrics] Prometheus 파일 저장 실패: {e}")
+
+
+metrics = Metrics()
@@ -0,0 +1,140 @@
+# crawlers/pagination.py
+import json
+import math
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from .common import state_path
+from .metrics import submit_with_context
+
+# 미리 가져올 수 있는 최대 페이지 수와 기록이 없을 때의 기본값
+MAX_PREFETCH = int(os.environ.get("CRAWLER_PREFETCH_MAX", "3"))
+DEFAULT_PREFETCH = int(os.environ.get("CRAWLER_PREFETCH_DEFAULT", "1"))
+HISTORY_RUNS = 10
+
+
+class PrefetchPaginator:
+    """
+    파서가 페이지 N을 처리하는 동안 다음 페이지들을 미리 요청하는 페이지 반복기.
+
+        with PrefetchPaginator(load_page, max_pages=5, expected_pages=2.4) as pages:
+            for page, fetch in pages:
+                soup = fetch()  # 로딩 중 발생한 예외는 여기서 다시 발생
+                ...             # 중단 조건이면 break -> 남은 요청은 취소/폐기
+
+    expected_pages(과거 실행에서 실제로 소비한 평균 페이지 수)가 주어지면
+    그 이상으로는 미리 가져오지 않아 조기 중단이 잦은 게시판의 낭비를 줄입니다.
+    """
+
+    def __init__(self, load_page, max_pages=None, expected_pages=None, start=1):
+        self.load_page = load_page
+        self.max_pages = max_pages
+        self.expected_pages = expected_pages
+        self.start = start
+        self.consumed = 0
+        self.discarded = 0
+        self._pending = deque()
+        self._executor = None
+
+    def depth_at(self, page):
+        """page를 처리하는 동안 유지할 선행 요청 수"""
+        if self.expected_pages is None:
+            depth = DEFAULT_PREFETCH
+        else:
+            depth = math.ceil(self.expected_pages) - page
+        return max(0, min(MAX_PREFETCH, depth))
+
+    def __enter__(self):
+        return self._iterate()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def _within_range(self, page):
+        return self.max_pages is None or page <= self.max_pages
+
+    def _iterate(self):
+        next_page = self.start
+        while True:
+            # 현재 처리할 페이지 + 선행 요청을 채워 둡니다.
+            current = self._pending[0][0] if self._pending else next_page
+            while self._within_range(next_page) and (
+                not self._pending or next_page <= current + self.depth_at(current)
+            ):
+                self._pending.append((next_page, self._submit(next_page)))
+                next_page += 1
+
+            if not self._pending:
+                return
+            page, fetch = self._pending.popleft()
+            self.consumed = page
+            yield page, fetch
+
+    def _submit(self, page):
+        if self.depth_at(page) == 0 and not self._pending:
+            # 선행 요청이 필요 없으면 스레드 없이 호출 시점에 로딩
+            return lambda: self.load_page(page)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=MAX_PREFETCH + 1, thread_name_prefix="prefetch"
+            )
+        return submit_with_context(self._executor, self.load_page, page).result
+
+    def close(self):
+        """아직 소비하지 않은 요청을 취소하거나 결과를 버립니다."""
+        self.discarded += len(self._pending)
+        for _, fetch in self._pending:
+            future = getattr(fetch, "__self__", None)
+            if future is not None:
+                future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+class PrefetchHistory:
+    """게시판별로 과거 실행에서 실제 소비한 페이지 수를 기록하는 JSON 저장소"""
+
+    def __init__(self, path=None):
+        self.path = path or state_path("prefetch_history.json")
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._data = json.load(f)
+        except (OSError, ValueError):
+            self._data = {}
+
+    def expected_pages(self, board_key):
+        with self._lock:
+            runs = self._data.get(board_key)
+        if not runs:
+            return None
+        return sum(runs) / len(runs)
+
+    def record(self, board_key, consumed_pages):
+        with self._lock:
+            runs = self._data.setdefault(board_key, [])
+            runs.append(consumed_pages)
+            del runs[:-HISTORY_RUNS]
+            try:
+                with open(self.path, "w", encoding="utf-8") as f:
+                    json.dump(self._data, f, ensure_ascii=False, indent=2)
+            except OSError as e:
+                print(f"   [prefetch] 기록 저장 실패: {e}")
+
+
+_history = None
+_history_lock = threading.Lock()
+
+
+def get_prefetch_history():
+    """프로세스 전체에서 공유하는 PrefetchHistory를 반환"""
+    global _history
+    with _history_lock:
+        if _history is None:
+            _history = PrefetchHistory()
+        return _history
@@ -0,0 +1,336 @@
+# crawlers/publish.py
+import gzip
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from .crawl_state import item_id
+from .metrics import metrics, submit_with_context
+
+# 내용 비교에서 제외하는 실행 시점 필드
+# carried_over: 증분 크롤링에서 이전 스냅샷으로 채운 항목 표시 (crawl_state.merge)
+VOLATILE_FIELDS = frozenset(["crawled_at", "updated_at", "updated", "carried_over"])
+
+
+def strip_volatile(value):
+    """실행할 때마다 바뀌는 필드를 재귀적으로 제거한 사본"""
+    if isinstance(value, dict):
+        return {
+            k: strip_volatile(v) for k, v in value.items() if k not in VOLATILE_FIELDS
+        }
+    if isinstance(value, list):
+        return [strip_volatile(v) for v in value]
+    return value
+
+
+def content_hash(data):
+    """변동 필드를 뺀 안정적인 내용 해시 (키 순서와 무관)"""
+    canonical = json.dumps(
+        strip_volatile(data), ensure_ascii=False, sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def delta_key(key):
+    """전체 파일 옆에 두는 변경분 파일 키 (예: ddm_news.json -> ddm_news.delta.json)"""
+    if key.endswith(".json"):
+        return key[: -len(".json")] + ".delta.json"
+    return key + ".delta"
+
+
+def _records(document):
+    """업로드 문서의 항목을 {식별자: 항목}으로 펼칩니다. (교육지원센터는 카테고리별 목록)"""
+    data = (document or {}).get("data")
+    records = {}
+    if isinstance(data, list):
+        for item in data:
+            records[item_id(item)] = item
+    elif isinstance(data, dict):
+        for category, items in data.items():
+            if not isinstance(items, list):
+                continue
+            for item in items:
+                records[f"{category}:{item_id(item)}"] = dict(item, category=category)
+    return records
+
+
+def build_delta(previous, current):
+    """이전 문서 대비 추가/삭제/변경 항목 문서"""
+    before = _records(previous)
+    after = _records(current)
+
+    added = [item for key, item in after.items() if key not in before]
+    removed = [key for key in before if key not in after]
+    changed = [
+        item
+        for key, item in after.items()
+        if key in before and strip_volatile(item) != strip_volatile(before[key])
+    ]
+    return {
+        "base_hash": content_hash(previous) if previous is not None else None,
+        "content_hash": content_hash(current),
+        "added": added,
+        "removed": removed,
+        "changed": changed,
+        "updated_at": datetime.now().isoformat(),
+    }
+
+
+# 업로드한 객체의 내용 해시를 담는 S3 메타데이터 키
+HASH_METADATA_KEY = "content-hash"
+DEFAULT_BUCKET = "test-dondaemoon-school-20250822"
+
+
+class S3Publisher:
+    """
+    크롤링 결과를 S3에 올리는 퍼블리셔.
+
+    - 연결 풀을 키운 클라이언트 하나를 모든 업로드가 공유합니다.
+    - submit()으로 넣은 업로드는 스레드 풀에서 동시에 진행되고 wait()로 결과를 모읍니다.
+    - gzip_enabled이면 본문을 gzip으로 압축하고 Content-Encoding: gzip을 붙입니다.
+    - S3_ENDPOINT_URL로 MinIO/moto 같은 로컬 S3 대체 서버를 가리킬 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        bucket_name=None,
+        gzip_enabled=None,
+        max_workers=None,
+        endpoint_url=None,
+        client=None,
+    ):
+        self.bucket_name = bucket_name or os.environ.get("S3_BUCKET_NAME", DEFAULT_BUCKET)
+        if gzip_enabled is None:
+            gzip_enabled = os.environ.get("CRAWLER_S3_GZIP", "false").lower() == "true"
+        self.gzip_enabled = gzip_enabled
+        self.max_workers = max_workers or int(os.environ.get("CRAWLER_S3_WORKERS", "8"))
+        self.endpoint_url = endpoint_url or os.environ.get("S3_ENDPOINT_URL")
+
+        self._client = client
+        self._lock = threading.Lock()
+        self._executor = None
+        self._futures = []
+
+    @property
+    def client(self):
+        with self._lock:
+            if self._client is None:
+                import boto3
+                from botocore.config import Config
+
+                config = Config(
+                    max_pool_connections=self.max_workers * 2,
+                    retries={"max_attempts": 3, "mode": "standard"},
+                )
+                self._client = boto3.client(
+                    "s3", endpoint_url=self.endpoint_url, config=config
+                )
+            return self._client
+
+    def _encode(self, document):
+        with metrics.timer("serialize"):
+            raw = json.dumps(document, ensure_ascii=False).encode("utf-8")
+            if self.gzip_enabled:
+                return raw, gzip.compress(raw)
+            return raw, raw
+
+    def _put(self, key, document, digest):
+        raw, body = self._encode(document)
+        extra = {"ContentEncoding": "gzip"} if self.gzip_enabled else {}
+        self.client.put_object(
+            Bucket=self.bucket_name,
+            Key=key,
+            Body=body,
+            ContentType="application/json",
+            Metadata={HASH_METADATA_KEY: digest},
+            **extra,
+        )
+        return len(raw), len(body)
+
+    def _get_previous(self, key):
+        """이미 올라가 있는 문서의 내용 해시와 로더 (객체가 없으면 None, None)"""
+        from botocore.exceptions import ClientError
+
+        try:
+            head = self.client.head_object(Bucket=self.bucket_name, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None, None
+            raise
+
+        def load():
+            obj = self.client.get_object(Bucket=self.bucket_name, Key=key)
+            body = obj["Body"].read()
+            if obj.get("ContentEncoding") == "gzip":
+                body = gzip.decompress(body)
+            return json.loads(body.decode("utf-8"))
+
+        return head.get("Metadata", {}).get(HASH_METADATA_KEY), load
+
+    def publish(self, data, key):
+        """
+        data를 key에 업로드하고 결과 보고(상태, 바이트 수, 소요 시간)를 반환.
+        변동 필드를 뺀 내용 해시가 기존 객체와 같으면 업로드를 생략하고,
+        바뀌었으면 전체 파일과 함께 변경분(delta) 문서를 옆에 올립니다.
+        """
+        started = time.monotonic()
+        report = {"key": key, "status": "uploaded", "bytes": 0, "sent_bytes": 0}
+        try:
+            digest = content_hash(data)
+            previous_hash, load_previous = self._get_previous(key)
+            if previous_hash == digest:
+                print(f"⏭️ 변경 없음, 업로드 생략: {key}")
+                report["status"] = "skipped"
+                return report
+
+            previous = load_previous() if load_previous else None
+            raw_size, sent_size = self._put(key, data, digest)
+            report["bytes"] += raw_size
+            report["sent_bytes"] += sent_size
+            print(f"✅ S3 업로드 성공: {key} ({sent_size:,} bytes)")
+
+            if previous is not None:
+                delta = build_delta(previous, data)
+                raw_size, sent_size = self._put(delta_key(key), delta, digest)
+                report["bytes"] += raw_size
+                report["sent_bytes"] += sent_size
+                report["delta"] = {
+                    "added": len(delta["added"]),
+                    "removed": len(delta["removed"]),
+                    "changed": len(delta["changed"]),
+                }
+                print(
+                    f"✅ 변경분 업로드: {delta_key(key)} "
+                    f"(추가 {len(delta['added'])}, 삭제 {len(delta['removed'])}, "
+                    f"변경 {len(delta['changed'])})"
+                )
+        except Exception as e:
+            print(f"❌ S3 업로드 실패 ({key}): {e}")
+            report["status"] = "failed"
+            report["error"] = str(e)
+        finally:
+            elapsed = time.monotonic() - started
+            report["latency_ms"] = round(elapsed * 1000, 1)
+            metrics.record("upload", elapsed, key=key, status=report["status"])
+        return report
+
+    def submit(self, data, key):
+        """업로드를 스레드 풀에 넣고 Future를 반환"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="s3-upload"
+                )
+            future = submit_with_context(self._executor, self.publish, data, key)
+            self._futures.append(future)
+        return future
+
+    def wait(self):
+        """지금까지 넣은 업로드가 끝날 때까지 기다리고 {key: 보고}를 반환"""
+        with self._lock:
+            futures, self._futures = self._futures, []
+        reports = {}
+        for future in futures:
+            report = future.result()
+            reports[report["key"]] = report
+        return reports
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+class LocalPublisher:
+    """
+    S3 대신 로컬 디렉터리에 같은 키 구조로 저장하는 퍼블리셔 (S3Publisher와 같은 인터페이스).
+    오프라인 재생 벤치마크나 로컬 실행에서 사용합니다.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._reports = {}
+        self._lock = threading.Lock()
+
+    def publish(self, data, key):
+        started = time.monotonic()
+        path = os.path.join(self.directory, key)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with metrics.timer("serialize", key=key):
+            raw = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(raw)
+        elapsed = time.monotonic() - started
+        metrics.record("upload", elapsed, key=key, status="uploaded")
+        report = {
+            "key": key,
+            "status": "uploaded",
+            "bytes": len(raw),
+            "sent_bytes": len(raw),
+            "latency_ms": round(elapsed * 1000, 1),
+        }
+        print(f"✅ 로컬 저장: {path} ({len(raw):,} bytes)")
+        return report
+
+    def submit(self, data, key):
+        report = self.publish(data, key)
+        with self._lock:
+            self._reports[key] = report
+        return report
+
+    def wait(self):
+        with self._lock:
+            reports, self._reports = self._reports, {}
+        return reports
+
+    def close(self):
+        pass
+
+
+class StdoutPublisher(LocalPublisher):
+    """업로드 문서를 {"key", "document"} JSON 한 줄씩 표준 출력으로 내보내는 퍼블리셔"""
+
+    def __init__(self, stream=None):
+        super().__init__(None)
+        self.stream = stream or sys.stdout
+
+    def publish(self, data, key):
+        started = time.monotonic()
+        with metrics.timer("serialize", key=key):
+            line = json.dumps({"key": key, "document": data}, ensure_ascii=False)
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+        elapsed = time.monotonic() - started
+        size = len(line.encode("utf-8"))
+        return {
+            "key": key,
+            "status": "uploaded",
+            "bytes": size,
+            "sent_bytes": size,
+            "latency_ms": round(elapsed * 1000, 1),
+        }
+
+
+class DryRunPublisher(LocalPublisher):
+    """아무 데이터도 내보내지 않고 보낼 크기만 보고하는 퍼블리셔 (--dry-run)"""
+
+    def __init__(self):
+        super().__init__(None)
+
+    def publish(self, data, key):
+        size = len(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+        print(f"📝 [dry-run] {key} ({size:,} bytes) 업로드 생략")
+        return {
+            "key": key,
+            "status": "dry_run",
+            "bytes": size,
+            "sent_bytes": 0,
+            "latency_ms": 0.0,
+        }
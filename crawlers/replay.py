@@ -0,0 +1,234 @@
+# crawlers/replay.py
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+# 설정되면 크롤러가 받은 모든 HTTP 응답과 렌더링된 page_source를 이 디렉터리에 녹화
+RECORD_DIR = os.environ.get("CRAWLER_RECORD_DIR")
+
+INDEX_NAME = "index.json"
+PAGE_PARAM = "pageIndex"
+
+# 녹화 범위를 벗어난 목록 페이지에 돌려주는 빈 목록
+EMPTY_LIST_PAGE = (
+    b'<!DOCTYPE html><html><head><meta charset="utf-8"></head><body>'
+    b'<table class="p-table"><tbody class="text_center"></tbody></table>'
+    b"</body></html>"
+)
+
+
+def canonical_key(url):
+    """호스트를 뺀 경로 + 정렬된 쿼리 (재생 서버의 요청 경로와 같은 형태)"""
+    parts = urlsplit(url)
+    query = sorted(parse_qsl(parts.query, keep_blank_values=True))
+    return parts.path + ("?" + urlencode(query) if query else "")
+
+
+def _split_page(key):
+    """(pageIndex를 뺀 키, 페이지 번호 또는 None)"""
+    path, _, query = key.partition("?")
+    params = parse_qsl(query, keep_blank_values=True)
+    page = None
+    rest = []
+    for name, value in params:
+        if name == PAGE_PARAM and value.isdigit():
+            page = int(value)
+        else:
+            rest.append((name, value))
+    return path + ("?" + urlencode(rest) if rest else ""), page
+
+
+class Recorder:
+    """
+    응답 본문을 디렉터리에 저장하고 index.json에 {키: {경로: 항목}}으로 기록.
+    같은 URL을 HTTP와 브라우저로 모두 받았다면 둘 다 남깁니다.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._index_path = os.path.join(directory, INDEX_NAME)
+        try:
+            with open(self._index_path, encoding="utf-8") as f:
+                self._index = json.load(f)
+        except (OSError, ValueError):
+            self._index = {}
+
+    def record(self, url, body, via, content_type=None):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+            content_type = "text/html; charset=utf-8"
+        key = canonical_key(url)
+        name = hashlib.sha1(f"{via}|{key}".encode("utf-8")).hexdigest() + ".html"
+        with self._lock:
+            with open(os.path.join(self.directory, name), "wb") as f:
+                f.write(body)
+            self._index.setdefault(key, {})[via] = {
+                "url": url,
+                "file": name,
+                "content_type": content_type or "text/html",
+                "size": len(body),
+                "recorded_at": time.time(),
+            }
+            with open(self._index_path, "w", encoding="utf-8") as f:
+                json.dump(self._index, f, ensure_ascii=False, indent=2)
+
+    def record_response(self, response, *args, **kwargs):
+        """requests 응답 훅: 정상 응답 본문을 녹화"""
+        if response.status_code == 200:
+            self.record(
+                response.url,
+                response.content,
+                "http",
+                response.headers.get("Content-Type"),
+            )
+        return response
+
+
+_recorder = None
+_recorder_lock = threading.Lock()
+
+
+def get_recorder():
+    """녹화 모드(CRAWLER_RECORD_DIR)이면 공유 Recorder, 아니면 None"""
+    global _recorder
+    if not RECORD_DIR:
+        return None
+    with _recorder_lock:
+        if _recorder is None:
+            _recorder = Recorder(RECORD_DIR)
+        return _recorder
+
+
+def record_page(url, html):
+    """브라우저로 렌더링한 page_source를 녹화 (녹화 모드가 아니면 무시)"""
+    recorder = get_recorder()
+    if recorder is not None:
+        recorder.record(url, html, "browser")
+
+
+class ReplayStore:
+    """녹화본 조회. HTTP 본문이 있으면 우선 사용하고, 없으면 렌더링된 page_source를 사용."""
+
+    def __init__(self, directory, max_pages=None):
+        self.directory = directory
+        self.max_pages = max_pages
+        with open(os.path.join(directory, INDEX_NAME), encoding="utf-8") as f:
+            self._index = json.load(f)
+        # 목록 페이지별 녹화된 페이지 번호 (페이지 수 조정용)
+        self._pages = {}
+        for key in self._index:
+            base, page = _split_page(key)
+            if page is not None:
+                self._pages.setdefault(base, {})[page] = key
+        # pageIndex 없이 녹화된 목록(예약포털 등)은 1페이지로 취급
+        for key in self._index:
+            if "?" in key and _split_page(key)[1] is None:
+                self._pages.setdefault(key, {}).setdefault(1, key)
+
+    def _read(self, key):
+        variants = self._index[key]
+        entry = variants.get("http") or variants.get("browser")
+        with open(os.path.join(self.directory, entry["file"]), "rb") as f:
+            return f.read(), entry["content_type"]
+
+    def lookup(self, path):
+        """
+        요청 경로의 (본문, Content-Type). 없으면 None.
+        max_pages가 있으면 목록은 정확히 max_pages 페이지가 되도록
+        녹화된 마지막 페이지를 반복하거나 이후 페이지를 빈 목록으로 돌려줍니다.
+        """
+        key = canonical_key(path)
+        base, page = _split_page(key)
+        recorded = self._pages.get(base)
+
+        if page is not None and recorded:
+            if self.max_pages is not None and page > self.max_pages:
+                return EMPTY_LIST_PAGE, "text/html; charset=utf-8"
+            if key in self._index:
+                return self._read(key)
+            if self.max_pages is None:
+                return EMPTY_LIST_PAGE, "text/html; charset=utf-8"
+            nearest = max((p for p in recorded if p <= page), default=min(recorded))
+            return self._read(recorded[nearest])
+
+        if key in self._index:
+            return self._read(key)
+        return None
+
+
+def make_server(directory, host="127.0.0.1", port=0, latency_ms=0, jitter_ms=0, max_pages=None):
+    """녹화본을 재생하는 로컬 HTTP 서버 (응답마다 지연 시간을 흉내 냄)"""
+    store = ReplayStore(directory, max_pages=max_pages)
+
+    class ReplayHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            delay = latency_ms + (random.uniform(-jitter_ms, jitter_ms) if jitter_ms else 0)
+            if delay > 0:
+                time.sleep(delay / 1000)
+
+            found = store.lookup(self.path)
+            if found is None:
+                body, content_type, status = b"not recorded", "text/plain", 404
+            else:
+                (body, content_type), status = found, 200
+
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), ReplayHandler)
+    server.daemon_threads = True
+    return server
+
+
+def start_server(directory, **kwargs):
+    """백그라운드 스레드에서 재생 서버를 시작하고 (서버, 기본 URL)을 반환"""
+    server = make_server(directory, **kwargs)
+    thread = threading.Thread(target=server.serve_forever, name="replay-server", daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}"
+
+
+if __name__ == "__main__":
+    # 사용법: python -m crawlers.replay <녹화 디렉터리> [--port 8765] [--latency-ms 150] ...
+    import argparse
+
+    parser = argparse.ArgumentParser(description="녹화본 재생 서버")
+    parser.add_argument("directory")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--max-pages", type=int, default=None)
+    args = parser.parse_args()
+
+    server = make_server(
+        args.directory,
+        host=args.host,
+        port=args.port,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        max_pages=args.max_pages,
+    )
+    base_url = f"http://{args.host}:{args.port}"
+    print(f"재생 서버 실행 중: {base_url}")
+    print(f"  DDM_BASE_URL={base_url} WARAK_BASE_URL={base_url} 로 크롤러를 실행하세요.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,211 @@
+# crawlers/scheduler.py
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from .common import state_path
+from .publish import content_hash
+
+# 소스별 첫 갱신 주기 (초). 이후에는 실제 변경 빈도에 맞춰 조정됩니다.
+DEFAULT_INTERVALS = {
+    "ddm_reserve": 3600,
+    "ddm_news": 6 * 3600,
+    "warak": 12 * 3600,
+    "ddm_edu": 24 * 3600,
+}
+FALLBACK_INTERVAL = 12 * 3600
+
+MIN_INTERVAL = float(os.environ.get("CRAWLER_SCHEDULE_MIN_MINUTES", "15")) * 60
+MAX_INTERVAL = float(os.environ.get("CRAWLER_SCHEDULE_MAX_HOURS", "72")) * 3600
+# 예상 변경 간격의 몇 배마다 다시 볼지 (0.5면 변경 간격의 절반마다 확인)
+FRESHNESS = float(os.environ.get("CRAWLER_SCHEDULE_FRESHNESS", "0.5"))
+# 변경이 관찰되지 않으면 주기를 이 배수만큼 늘림
+GROWTH = 1.5
+# 다음 실행 시각에 더하는 무작위 편차 (주기 대비 비율)
+JITTER = float(os.environ.get("CRAWLER_SCHEDULE_JITTER", "0.1"))
+# 실패 시 재시도 간격: RETRY_BASE * 2^(연속 실패 수 - 1), 최대 MAX_INTERVAL
+RETRY_BASE = float(os.environ.get("CRAWLER_SCHEDULE_RETRY_MINUTES", "5")) * 60
+# 동시에 실행할 수 있는 소스 수 (전체 예산)
+BUDGET = int(os.environ.get("CRAWLER_SCHEDULE_CONCURRENCY", "2"))
+# 변경 빈도 추정에 쓰는 최근 실행 수
+HISTORY_RUNS = 20
+
+
+class ScheduleStore:
+    """소스별 갱신 주기, 최근 실행의 변경 여부, 다음 실행 시각을 기록하는 JSON 저장소"""
+
+    def __init__(self, path=None):
+        self.path = path or state_path("schedule.json")
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._data = json.load(f)
+        except (OSError, ValueError):
+            self._data = {}
+
+    def entry(self, name):
+        with self._lock:
+            entry = self._data.setdefault(
+                name,
+                {
+                    "interval": DEFAULT_INTERVALS.get(name, FALLBACK_INTERVAL),
+                    "next_run": 0,
+                    "last_hash": None,
+                    "failures": 0,
+                    "history": [],
+                },
+            )
+            return dict(entry)
+
+    def update(self, name, **fields):
+        with self._lock:
+            self._data.setdefault(name, {}).update(fields)
+            try:
+                with open(self.path, "w", encoding="utf-8") as f:
+                    json.dump(self._data, f, ensure_ascii=False, indent=2)
+            except OSError as e:
+                print(f"   [schedule] 기록 저장 실패: {e}")
+
+
+def learned_interval(interval, history):
+    """
+    최근 실행 기록 [{"at", "changed"}]에서 변경 사이 평균 간격을 추정해 다음 주기를 정합니다.
+    변경이 한 번도 없으면 현재 주기를 GROWTH배로 늘립니다.
+    """
+    if len(history) < 2:
+        return interval
+    span = history[-1]["at"] - history[0]["at"]
+    changes = sum(1 for run in history[1:] if run["changed"])
+    if changes == 0:
+        interval = interval * GROWTH
+    else:
+        interval = span / changes * FRESHNESS
+    return min(MAX_INTERVAL, max(MIN_INTERVAL, interval))
+
+
+def _jittered(seconds):
+    return seconds * (1 + random.uniform(-JITTER, JITTER))
+
+
+class AdaptiveScheduler:
+    """
+    소스별 변경 빈도에 맞춰 크롤링을 반복하는 상주 스케줄러.
+
+    - run_source(source)는 (성공 여부, 업로드 문서)를 반환합니다.
+    - 문서의 내용 해시(변동 필드 제외)로 변경 여부를 판단해 주기를 조정합니다.
+    - 실패하면 지수 백오프로 다시 시도하고, 동시에 실행하는 소스 수는 budget으로 제한합니다.
+    - 브라우저 풀과 HTTP 세션은 프로세스 전체 공유이므로 실행 사이에도 웜 상태가 유지됩니다.
+    """
+
+    def __init__(self, sources, run_source, budget=None, store=None, after_run=None):
+        self.sources = sources
+        self.run_source = run_source
+        self.budget = budget or BUDGET
+        self.store = store or ScheduleStore()
+        self.after_run = after_run
+
+        self._running = set()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def _due(self, now):
+        """지금 실행할 소스 목록 (다음 실행 시각이 이른 순)"""
+        with self._lock:
+            idle = [s for s in self.sources if s["name"] not in self._running]
+        due = [(self.store.entry(s["name"])["next_run"], s) for s in idle]
+        due = [pair for pair in due if pair[0] <= now]
+        return [s for _, s in sorted(due, key=lambda pair: pair[0])]
+
+    @property
+    def active(self):
+        """지금 실행 중인 소스 수"""
+        with self._lock:
+            return len(self._running)
+
+    def _seconds_until_next(self, now):
+        """다음 확인까지 기다릴 시간. 예산이 다 찼으면 None (실행이 끝날 때까지 대기)"""
+        with self._lock:
+            if len(self._running) >= self.budget:
+                return None
+            idle = [s for s in self.sources if s["name"] not in self._running]
+        if not idle:
+            return None
+        return max(0.0, min(self.store.entry(s["name"])["next_run"] for s in idle) - now)
+
+    def _run(self, source):
+        name = source["name"]
+        started = time.time()
+        try:
+            ok, document = self.run_source(source)
+        except Exception as e:
+            print(f"❌ [schedule] {name} 실행 오류: {e}")
+            ok, document = False, None
+        try:
+            self._record(name, started, ok, document)
+        finally:
+            with self._lock:
+                self._running.discard(name)
+            if self.after_run:
+                self.after_run(source)
+            self._wake.set()
+
+    def _record(self, name, started, ok, document):
+        entry = self.store.entry(name)
+        now = time.time()
+        if not ok:
+            failures = entry["failures"] + 1
+            delay = min(MAX_INTERVAL, RETRY_BASE * 2 ** (failures - 1))
+            self.store.update(name, failures=failures, next_run=now + _jittered(delay))
+            print(f"   [schedule] {name}: 실패 {failures}회, {delay / 60:.0f}분 후 재시도")
+            return
+
+        digest = content_hash(document)
+        changed = entry["last_hash"] is not None and digest != entry["last_hash"]
+        history = entry["history"] + [{"at": started, "changed": changed}]
+        history = history[-HISTORY_RUNS:]
+        interval = learned_interval(entry["interval"], history)
+        self.store.update(
+            name,
+            interval=interval,
+            last_hash=digest,
+            failures=0,
+            history=history,
+            next_run=now + _jittered(interval),
+            last_run=datetime.now().isoformat(),
+        )
+        state = "변경됨" if changed else "변경 없음"
+        print(f"   [schedule] {name}: {state}, 다음 실행까지 {interval / 60:.0f}분")
+
+    def stop(self):
+        """run_forever를 멈춥니다. (시그널 핸들러 등 다른 스레드에서 호출 가능)"""
+        self._stop.set()
+        self._wake.set()
+
+    def run_forever(self):
+        """stop()이 호출될 때까지 반복. 종료 시 실행 중인 소스가 끝나길 기다립니다."""
+        print(
+            f"[schedule] {len(self.sources)}개 소스 상주 실행 (동시 {self.budget}개) "
+            f"- {', '.join(s['name'] for s in self.sources)}"
+        )
+        with ThreadPoolExecutor(
+            max_workers=self.budget, thread_name_prefix="schedule"
+        ) as executor:
+            while not self._stop.is_set():
+                self._wake.clear()
+                for source in self._due(time.time()):
+                    with self._lock:
+                        if len(self._running) >= self.budget:
+                            break
+                        self._running.add(source["name"])
+                    print(f"\n▶ [schedule] {source['label']} 크롤링...")
+                    executor.submit(self._run, source)
+
+                wait = self._seconds_until_next(time.time())
+                # 실행이 끝나거나(_wake) 다음 실행 시각이 되면 다시 확인
+                self._wake.wait(60 if wait is None else min(wait, 60))
+        print("[schedule] 종료")
@@ -0,0 +1,214 @@
+# crawlers/sinks.py
+import json
+import os
+import threading
+from datetime import datetime
+
+
+def _dumps(record):
+    return json.dumps(record, ensure_ascii=False)
+
+
+class JsonLinesSink:
+    """레코드를 한 줄씩 JSON Lines 파일에 바로 기록 (중간에 실패해도 앞부분이 남음)"""
+
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self._file = open(path, "w", encoding="utf-8")
+        self.count = 0
+
+    def write(self, record, group=None):
+        if group is not None:
+            record = dict(record, category=group)
+        self._file.write(_dumps(record) + "\n")
+        self._file.flush()
+        self.count += 1
+
+    def close(self, extra=None):
+        self._file.close()
+
+    def abort(self, error):
+        # 이미 기록한 레코드는 그대로 남겨 둡니다.
+        self._file.close()
+
+
+class JsonEnvelopeSink:
+    """
+    기존 업로드 형식({"data": [...], "count": N, "updated_at": ...})을 점진적으로 기록.
+
+    groups가 주어지면 교육지원센터처럼 {"data": {그룹: [...], ...}} 형태로 쓰며,
+    레코드는 groups 순서대로 들어와야 합니다. 레코드가 없는 그룹도 빈 목록으로 남깁니다.
+    """
+
+    def __init__(self, path, groups=None):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.groups = list(groups) if groups is not None else None
+        self._file = open(path, "w", encoding="utf-8")
+        self._file.write('{"data": ' + ("{" if self.groups is not None else "["))
+        self._group_index = -1
+        self._in_group_first = True
+        self.count = 0
+
+    def _open_group(self, group):
+        target = self.groups.index(group)
+        while self._group_index < target:
+            if self._group_index >= 0:
+                self._file.write("]")
+            self._group_index += 1
+            prefix = ", " if self._group_index > 0 else ""
+            self._file.write(f"{prefix}{_dumps(self.groups[self._group_index])}: [")
+            self._in_group_first = True
+
+    def write(self, record, group=None):
+        if self.groups is not None:
+            self._open_group(group)
+            first = self._in_group_first
+            self._in_group_first = False
+        else:
+            first = self.count == 0
+        self._file.write(("" if first else ", ") + _dumps(record))
+        self._file.flush()
+        self.count += 1
+
+    def close(self, extra=None):
+        """남은 그룹/목록을 닫고 count, updated_at 등 봉투 필드를 붙입니다."""
+        extra = dict(extra or {})
+        if self.groups is not None:
+            if self.groups:
+                self._open_group(self.groups[-1])
+                self._file.write("]")
+            # 교육지원센터 data에는 updated_at/test_mode가 함께 들어갑니다.
+            for key, value in extra.pop("data_extra", {}).items():
+                self._file.write(f", {_dumps(key)}: {_dumps(value)}")
+            self._file.write("}")
+        else:
+            self._file.write("]")
+            extra.setdefault("count", self.count)
+        extra.setdefault("updated_at", datetime.now().isoformat())
+        for key, value in extra.items():
+            self._file.write(f", {_dumps(key)}: {_dumps(value)}")
+        self._file.write("}\n")
+        self._file.close()
+
+    def abort(self, error):
+        self.close({"error": error})
+
+
+class S3MultipartSink:
+    """
+    JSON Lines를 S3 멀티파트 업로드로 흘려 보냅니다. (파트 최소 크기 5MB)
+    업로드는 첫 파트를 보낼 때 시작하므로 S3 오류가 싱크 생성 단계에서 나지 않습니다.
+    """
+
+    MIN_PART_SIZE = 5 * 1024 * 1024
+
+    def __init__(self, client, bucket_name, key, part_size=MIN_PART_SIZE):
+        self.client = client
+        self.bucket_name = bucket_name
+        self.key = key
+        self.part_size = max(part_size, self.MIN_PART_SIZE)
+        self._buffer = bytearray()
+        self._parts = []
+        self._upload_id = None
+        self.count = 0
+
+    def _flush_part(self):
+        if self._upload_id is None:
+            self._upload_id = self.client.create_multipart_upload(
+                Bucket=self.bucket_name, Key=self.key, ContentType="application/x-ndjson"
+            )["UploadId"]
+        part_number = len(self._parts) + 1
+        response = self.client.upload_part(
+            Bucket=self.bucket_name,
+            Key=self.key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=bytes(self._buffer),
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+        self._buffer = bytearray()
+
+    def write(self, record, group=None):
+        if group is not None:
+            record = dict(record, category=group)
+        self._buffer += (_dumps(record) + "\n").encode("utf-8")
+        self.count += 1
+        if len(self._buffer) >= self.part_size:
+            self._flush_part()
+
+    def close(self, extra=None):
+        # 마지막 파트는 5MB보다 작아도 됩니다. (파트가 하나뿐이어도 허용)
+        if self._buffer or not self._parts:
+            self._flush_part()
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=self.key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": self._parts},
+        )
+        print(f"✅ S3 스트리밍 업로드 완료: {self.key} ({self.count}개)")
+
+    def abort(self, error):
+        # 불완전한 결과는 소비자에게 공개하지 않습니다.
+        if self._upload_id is None:
+            return
+        self.client.abort_multipart_upload(
+            Bucket=self.bucket_name, Key=self.key, UploadId=self._upload_id
+        )
+        print(f"   [sink] S3 멀티파트 업로드 취소: {self.key}")
+
+
+class FanoutSink:
+    """
+    여러 싱크에 같은 레코드를 기록. 한 싱크의 실패가 다른 싱크를 막지 않습니다.
+    close/abort는 한 번만 적용되고, 그 뒤의 기록은 버립니다.
+    (시간 초과로 중단된 크롤러 스레드가 계속 기록하는 경우)
+    """
+
+    def __init__(self, *sinks):
+        self.sinks = list(sinks)
+        self.count = 0
+        self._lock = threading.Lock()
+        self._finished = False
+
+    def write(self, record, group=None):
+        with self._lock:
+            if self._finished:
+                return
+            self._write(record, group)
+
+    def _write(self, record, group):
+        for sink in list(self.sinks):
+            try:
+                sink.write(record, group=group)
+            except Exception as e:
+                # 실패한 싱크는 정리하고 나머지 싱크로 계속 기록
+                print(f"   [sink] {type(sink).__name__} 기록 실패, 제외: {e}")
+                self.sinks.remove(sink)
+                try:
+                    sink.abort(str(e))
+                except Exception:
+                    pass
+        self.count += 1
+
+    def _each(self, method, *args):
+        for sink in self.sinks:
+            try:
+                getattr(sink, method)(*args)
+            except Exception as e:
+                print(f"   [sink] {type(sink).__name__}.{method} 실패: {e}")
+
+    def _finish(self, method, *args):
+        with self._lock:
+            if self._finished:
+                return
+            self._finished = True
+            self._each(method, *args)
+
+    def close(self, extra=None):
+        self._finish("close", extra)
+
+    def abort(self, error):
+        self._finish("abort", error)
@@ -0,0 +1,436 @@
+# crawlers/table_parser.py
+import os
+import re
+from datetime import datetime
+from urllib.parse import urljoin
+
+import lxml.html
+from bs4.dammit import UnicodeDammit
+
+# BeautifulSoup 트리 대신 lxml XPath로 목록 행을 추출 (false이면 기존 BeautifulSoup 파서 사용)
+FAST_PARSER = os.environ.get("CRAWLER_FAST_PARSER", "true").lower() == "true"
+
+
+def has_class(name):
+    """XPath 조건: class 속성에 name 클래스가 있는지 (CSS의 .name과 같음)"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# 페이지 유형별 목록 행 XPath (fetchers.ROW_SELECTORS의 CSS 선택자와 같은 행)
+ROW_XPATH = {
+    "edu_board": f"//table[{has_class('p-table')}]//tbody//tr",
+    "news_list": f"//tbody[{has_class('text_center')}]//tr",
+    "reserve_programs": (
+        f"//div[{has_class('program')}][{has_class('lecture')}]"
+        f"//tbody[{has_class('text_center')}]//tr"
+    ),
+    "reserve_receptions": (
+        f"//div[{has_class('online_accept')}][{has_class('list')}]"
+        f"//tbody[{has_class('text_center')}]//tr"
+    ),
+}
+EDU_NEXT_XPATH = f"//a[{has_class('p-page__link')}][{has_class('next-one')}]"
+# 페이지 이동 링크 (fn_link_page(N) 또는 pageIndex=N)
+PAGER_LINK_XPATH = "//a[contains(@onclick, 'fn_link_page') or contains(@href, 'pageIndex=')]"
+PAGER_NUMBER_PATTERN = re.compile(r"(?:fn_link_page\(|pageIndex=)(\d+)")
+
+# BeautifulSoup의 get_text()가 건너뛰는 요소
+_SKIP_TAGS = frozenset(["script", "style", "template"])
+
+
+def parse_html(content):
+    """HTML(bytes 또는 str)을 lxml 트리로 파싱"""
+    if isinstance(content, bytes):
+        try:
+            content = content.decode("utf-8")
+        except UnicodeDecodeError:
+            # 인코딩 판별은 BeautifulSoup과 같은 방식으로
+            content = UnicodeDammit(content, is_html=True).unicode_markup
+    return lxml.html.fromstring(content)
+
+
+def select_rows(tree, page_type):
+    """페이지 유형의 목록 행(tr) 목록"""
+    return tree.xpath(ROW_XPATH[page_type])
+
+
+def has_list_container(tree, page_type):
+    """목록 행을 담는 tbody가 있는지 (행이 없는 빈 목록이어도 True)"""
+    return bool(tree.xpath(ROW_XPATH[page_type].rsplit("//tr", 1)[0]))
+
+
+def has_edu_next_page(tree):
+    return bool(tree.xpath(EDU_NEXT_XPATH))
+
+
+def pager_last_page(tree):
+    """
+    페이지 목록에 보이는 가장 큰 페이지 번호 (마지막/다음 버튼 포함, 없으면 1).
+    번호가 10개씩 보이는 목록이면 실제 마지막 페이지보다 작을 수 있습니다.
+    """
+    last = 1
+    for link in tree.xpath(PAGER_LINK_XPATH):
+        value = f"{link.get('onclick', '')} {link.get('href', '')}"
+        for number in PAGER_NUMBER_PATTERN.findall(value):
+            last = max(last, int(number))
+    return last
+
+
+def _strings(el):
+    """요소 안의 텍스트 조각을 문서 순서대로 (주석/스크립트 제외)"""
+    if el.text:
+        yield el.text
+    for child in el:
+        if isinstance(child.tag, str) and child.tag not in _SKIP_TAGS:
+            yield from _strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def text(el):
+    """BeautifulSoup의 .text와 같은 결과"""
+    return "".join(_strings(el))
+
+
+def get_text(el, separator="", strip=False):
+    """BeautifulSoup의 get_text(separator, strip)와 같은 결과"""
+    strings = _strings(el)
+    if strip:
+        strings = (s.strip() for s in strings)
+        strings = (s for s in strings if s)
+    return separator.join(strings)
+
+
+def cells(row):
+    return list(row.iter("td"))
+
+
+def find(el, tag):
+    """첫 번째 하위 요소 (BeautifulSoup의 find(tag))"""
+    return next(el.iter(tag), None)
+
+
+def _apply_url(apply_button, title_tag):
+    detail_url = ""
+    if apply_button is not None and "href" in apply_button.attrib:
+        detail_url = apply_button.get("href")
+    elif title_tag is not None and "href" in title_tag.attrib:
+        detail_url = title_tag.get("href", "")
+    return detail_url
+
+
+# --- 교육지원센터 (DDMEducationCrawler._parse_*_row와 같은 결과) ---
+
+
+def edu_board_row(row, content_type, base_url, is_future_event):
+    cols = cells(row)
+    if len(cols) != 7:
+        return None, None
+
+    event_date_str = text(cols[2]).strip()
+    is_valid = is_future_event(event_date_str)
+    apply_button = find(cols[6], "a")
+    title_tag = find(cols[1], "a")
+
+    item = {
+        "title": text(title_tag if title_tag is not None else cols[1]).strip(),
+        "date": event_date_str,
+        "target": text(cols[4]).strip(),
+        "location": text(cols[5]).strip(),
+        "status": text(apply_button).strip() if apply_button is not None else "마감",
+        "url": urljoin(base_url, _apply_url(apply_button, title_tag)),
+        "type": content_type,
+    }
+    return item, is_valid
+
+
+def edu_expo_row(row, content_type, base_url, is_future_event):
+    cols = cells(row)
+    if len(cols) != 5:
+        return None, None
+
+    registration_period_str = text(cols[3]).strip()
+    is_valid = is_future_event(registration_period_str)
+    apply_button = find(cols[4], "a")
+    title_tag = find(cols[1], "a")
+
+    item = {
+        "title": text(title_tag if title_tag is not None else cols[1]).strip(),
+        "event_period": text(cols[2]).strip(),
+        "registration_period": registration_period_str,
+        "status": text(apply_button).strip() if apply_button is not None else "마감",
+        "url": urljoin(base_url, _apply_url(apply_button, title_tag)),
+        "type": content_type,
+    }
+    return item, is_valid
+
+
+def edu_notice_row(row, content_type, base_url):
+    cols = cells(row)
+    if len(cols) != 5:
+        return None, None
+    title_tag = find(cols[1], "a")
+    date_str = text(cols[3]).strip()
+    item = {
+        "title": text(title_tag if title_tag is not None else cols[1]).strip(),
+        "date": date_str,
+        "url": urljoin(
+            base_url, title_tag.get("href", "") if title_tag is not None else ""
+        ),
+        "type": content_type,
+    }
+    return item, date_str
+
+
+# --- 교육소식 (ddm_news_crawler.parse_news_row와 같은 결과) ---
+
+NEWS_DATE_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2})")
+NEWS_NTT_NO_PATTERN = re.compile(r'nttNo["\s]*[:=]["\s]*(\d+)')
+_WHITESPACE = re.compile(r"\s+")
+
+
+def news_row(row, base_url, view_url, list_url):
+    if row.xpath(".//img[@alt='공지']"):
+        return None
+
+    cols = cells(row)
+    if len(cols) < 4:
+        return None
+
+    date_text = text(cols[3]).strip().replace("작성일", "").strip()
+    date_text = _WHITESPACE.sub(" ", date_text).strip()
+    date_match = NEWS_DATE_PATTERN.search(date_text)
+    if not date_match:
+        print(f"날짜 형식 인식 실패: {repr(date_text)}")
+        return None
+    date_str = date_match.group(1)
+
+    title_tag = find(cols[1], "a")
+    if title_tag is None:
+        return date_str, None
+    title = text(title_tag).strip()
+
+    onclick = title_tag.get("onclick", "")
+    href = title_tag.get("href", "")
+    if onclick and "selectBbsNttView" in onclick:
+        ntt_no_match = NEWS_NTT_NO_PATTERN.search(onclick)
+        if ntt_no_match:
+            absolute_url = view_url.format(ntt_no=ntt_no_match.group(1))
+        else:
+            absolute_url = list_url
+    elif href and href != "#" and href != "javascript:void(0);":
+        absolute_url = href if href.startswith("http") else base_url + href.lstrip("/")
+    else:
+        print(f"URL 추출 실패: {title}")
+        absolute_url = list_url
+
+    attachment = cols[4] if len(cols) > 4 else None
+    has_attachment = attachment is not None and (
+        find(attachment, "img") is not None or "첨부" in text(attachment)
+    )
+
+    item = {
+        "title": title,
+        "date": date_str,
+        "department": text(cols[2]).strip(),
+        "url": absolute_url,
+        "has_attachment": has_attachment,
+        "type": "교육소식",
+        "source": "동대문구청",
+        "crawled_at": datetime.now().isoformat(),
+    }
+    return date_str, item
+
+
+# --- 예약포털 (DDMReserveCrawler._parse_*와 같은 결과) ---
+
+
+def _reserve_detail_url(title_tag, status_tag, base_url):
+    if title_tag is not None and "href" in title_tag.attrib:
+        return urljoin(base_url, title_tag.get("href"))
+    if status_tag is not None and "onclick" in status_tag.attrib:
+        onclick = status_tag.get("onclick")
+        if "location.href" in onclick:
+            url_match = onclick.split("'")[1] if "'" in onclick else ""
+            if url_match:
+                return urljoin(base_url, url_match)
+    return ""
+
+
+def reserve_programs(tree, status, base_url):
+    programs = []
+    for row in select_rows(tree, "reserve_programs"):
+        cols = cells(row)
+        if len(cols) < 8:
+            continue
+
+        title_tag = find(cols[1], "a")
+        status_tag = find(cols[7], "a")
+
+        date_parts = [p.strip() for p in get_text(cols[3], "|").strip().split("|")]
+        date_parts = [p for p in date_parts if p]
+
+        programs.append(
+            {
+                "title": text(title_tag).strip() if title_tag is not None else "제목 없음",
+                "location": text(cols[2]).strip(),
+                "application_period": date_parts[0] if date_parts else "",
+                "education_period": date_parts[1] if len(date_parts) > 1 else "",
+                "education_time": get_text(cols[4], " ", strip=True),
+                "selection_method": text(cols[5]).strip(),
+                "capacity_status": get_text(cols[6], " ", strip=True),
+                "status": status,
+                "button_text": text(status_tag).strip() if status_tag is not None else "",
+                "url": _reserve_detail_url(title_tag, status_tag, base_url),
+                "type": "전체프로그램",
+                "source": "동대문구 예약포털",
+                "crawled_at": datetime.now().isoformat(),
+            }
+        )
+    return programs
+
+
+def reserve_receptions(tree, status, base_url):
+    receptions = []
+    for row in select_rows(tree, "reserve_receptions"):
+        cols = cells(row)
+        if len(cols) < 8:
+            continue
+
+        title_tag = find(cols[1], "a")
+        status_tag = find(cols[7], "a")
+
+        receptions.append(
+            {
+                "title": text(title_tag).strip() if title_tag is not None else "제목 없음",
+                "department": text(cols[2]).strip(),
+                "application_period": get_text(cols[3], "~", strip=True),
+                "selection_method": text(cols[4]).strip(),
+                "capacity_status": get_text(cols[5], "/", strip=True).replace("\n", ""),
+                "fee": text(cols[6]).strip(),
+                "status": status,
+                "button_text": text(status_tag).strip() if status_tag is not None else "",
+                "url": _reserve_detail_url(title_tag, status_tag, base_url),
+                "type": "온라인접수",
+                "source": "동대문구 예약포털",
+                "crawled_at": datetime.now().isoformat(),
+            }
+        )
+    return receptions
+
+
+# --- 기존 BeautifulSoup 파서와의 호환성 확인 ---
+
+PARITY_PAGE_TYPES = (
+    "edu_board",
+    "edu_expo",
+    "edu_notice",
+    "news_list",
+    "reserve_programs",
+    "reserve_receptions",
+)
+
+
+def _without_volatile(value):
+    if isinstance(value, dict):
+        return {k: _without_volatile(v) for k, v in value.items() if k != "crawled_at"}
+    if isinstance(value, (list, tuple)):
+        return [_without_volatile(v) for v in value]
+    return value
+
+
+def parsers_for(page_type):
+    """
+    페이지 유형의 (기존 BeautifulSoup 파서, 빠른 파서)를 반환.
+    둘 다 HTML을 받아 행별 파싱 결과 목록을 돌려줍니다. (호환성 확인/벤치마크용)
+    """
+    from bs4 import BeautifulSoup
+
+    def soup_of(html):
+        return BeautifulSoup(html, "lxml")
+
+    if page_type.startswith("edu_"):
+        from .ddm_edu_crawler import DDMEducationCrawler
+
+        # 네트워크/상태 저장소 없이 파서만 쓰기 위해 __init__을 건너뜁니다.
+        crawler = DDMEducationCrawler.__new__(DDMEducationCrawler)
+        crawler.base_url = "https://www.ddm.go.kr"
+        crawler.today = datetime.now().date()
+        crawler.date_threshold = crawler.today
+        kind = page_type[len("edu_"):]
+        slow_parser = getattr(crawler, f"_parse_{kind}_row")
+        fast_parser = crawler._fast_row_parser(slow_parser)
+
+        def slow(html):
+            soup = soup_of(html)
+            rows = [slow_parser(row, kind) for row in soup.select("table.p-table tbody tr")]
+            return rows + [soup.select_one("a.p-page__link.next-one") is not None]
+
+        def fast(html):
+            tree = parse_html(html)
+            rows = [fast_parser(row, kind) for row in select_rows(tree, "edu_board")]
+            return rows + [has_edu_next_page(tree)]
+
+    elif page_type == "news_list":
+        from . import ddm_news_crawler as news
+
+        def slow(html):
+            rows = soup_of(html).select("tbody.text_center tr")
+            return [news.parse_news_row(row) for row in rows]
+
+        def fast(html):
+            rows = select_rows(parse_html(html), "news_list")
+            return [news.parse_news_row_fast(row) for row in rows]
+
+    elif page_type in ("reserve_programs", "reserve_receptions"):
+        from .ddm_reserve_crawler import DDMReserveCrawler
+
+        crawler = DDMReserveCrawler.__new__(DDMReserveCrawler)
+        crawler.base_url = "https://www.ddm.go.kr"
+        if page_type == "reserve_programs":
+            slow_parser, fast_parser = crawler._parse_programs, reserve_programs
+        else:
+            slow_parser, fast_parser = crawler._parse_online_receptions, reserve_receptions
+
+        def slow(html):
+            return slow_parser(soup_of(html), "접수중")
+
+        def fast(html):
+            return fast_parser(parse_html(html), "접수중", crawler.base_url)
+
+    else:
+        raise ValueError(f"알 수 없는 페이지 유형: {page_type}")
+
+    return slow, fast
+
+
+def parse_both(page_type, html):
+    """같은 HTML을 기존 BeautifulSoup 파서와 빠른 파서로 각각 파싱해 (기존, 빠른) 결과를 반환"""
+    slow, fast = parsers_for(page_type)
+    return _without_volatile(slow(html)), _without_volatile(fast(html))
+
+
+if __name__ == "__main__":
+    # 사용법: python -m crawlers.table_parser <page_type> <html 파일> [...]
+    import sys
+
+    if len(sys.argv) < 3 or sys.argv[1] not in PARITY_PAGE_TYPES:
+        print(f"사용법: python -m crawlers.table_parser <{'|'.join(PARITY_PAGE_TYPES)}> <html 파일> [...]")
+        sys.exit(2)
+
+    page_type = sys.argv[1]
+    failures = 0
+    for path in sys.argv[2:]:
+        with open(path, "rb") as f:
+            slow, fast = parse_both(page_type, f.read())
+        if slow == fast:
+            print(f"✅ {path}: 일치 ({len(slow)}개)")
+        else:
+            failures += 1
+            print(f"❌ {path}: 불일치")
+            for i, (a, b) in enumerate(zip(slow, fast)):
+                if a != b:
+                    print(f"   [{i}] 기존: {a}\n   [{i}] 빠른: {b}")
+            if len(slow) != len(fast):
+                print(f"   개수 차이: 기존 {len(slow)}, 빠른 {len(fast)}")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,152 @@
+# crawlers/waits.py
+import os
+import threading
+import time
+
+from .metrics import metrics
+
+# 대기 상한 (초) 및 확인 주기
+DEFAULT_TIMEOUT = float(os.environ.get("CRAWLER_WAIT_TIMEOUT", "10"))
+POLL_INTERVAL = float(os.environ.get("CRAWLER_WAIT_POLL", "0.1"))
+
+
+class RowsPresent:
+    """CSS 선택자에 해당하는 요소가 하나 이상 있으면 준비 완료"""
+
+    def __init__(self, selector):
+        self.selector = selector
+
+    def checker(self):
+        from selenium.webdriver.common.by import By
+
+        def check(driver):
+            return len(driver.find_elements(By.CSS_SELECTOR, self.selector)) > 0
+
+        return check
+
+
+class DomQuiet:
+    """문서 로딩이 끝나고 DOM 요소 수가 quiet_ms 동안 변하지 않으면 준비 완료"""
+
+    SCRIPT = (
+        "return document.readyState === 'loading'"
+        " ? -1 : document.getElementsByTagName('*').length"
+    )
+
+    def __init__(self, quiet_ms=500):
+        self.quiet_ms = quiet_ms
+
+    def checker(self):
+        state = {"count": None, "since": None}
+
+        def check(driver):
+            count = driver.execute_script(self.SCRIPT)
+            now = time.monotonic()
+            if count < 0 or count != state["count"]:
+                state["count"] = count
+                state["since"] = now
+                return False
+            return (now - state["since"]) * 1000 >= self.quiet_ms
+
+        return check
+
+
+class AnyOf:
+    """여러 조건 중 하나라도 만족하면 준비 완료"""
+
+    def __init__(self, *conditions):
+        self.conditions = conditions
+
+    def checker(self):
+        checks = [condition.checker() for condition in self.conditions]
+
+        def check(driver):
+            return any(c(driver) for c in checks)
+
+        return check
+
+
+# 페이지 유형별 준비 조건
+# 빈 목록 페이지는 행이 없을 수 있으므로 DOM 안정 조건을 함께 둡니다.
+PAGE_READY = {
+    "news_list": AnyOf(RowsPresent("tbody.text_center tr"), DomQuiet()),
+    "reserve_programs": AnyOf(
+        RowsPresent("div.program.lecture tbody.text_center tr"), DomQuiet()
+    ),
+    "reserve_receptions": AnyOf(
+        RowsPresent("div.online_accept.list tbody.text_center tr"), DomQuiet()
+    ),
+    "warak_list": RowsPresent("ul.sVaQi4G"),
+}
+
+
+class WaitResult:
+    def __init__(self, page_type, elapsed, ready):
+        self.page_type = page_type
+        self.elapsed = elapsed
+        self.ready = ready
+
+
+class WaitStats:
+    """페이지 유형별 대기 시간 기록"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._records = {}
+
+    def record(self, result):
+        with self._lock:
+            self._records.setdefault(result.page_type, []).append(result)
+
+    def reset(self):
+        with self._lock:
+            self._records = {}
+
+    def summary(self):
+        with self._lock:
+            records = {k: list(v) for k, v in self._records.items()}
+        summary = {}
+        for page_type, results in records.items():
+            elapsed = [r.elapsed for r in results]
+            summary[page_type] = {
+                "count": len(results),
+                "total_sec": round(sum(elapsed), 3),
+                "max_sec": round(max(elapsed), 3),
+                "timeouts": sum(1 for r in results if not r.ready),
+            }
+        return summary
+
+
+wait_stats = WaitStats()
+
+
+def wait_until_ready(driver, page_type, timeout=None, raise_on_timeout=False):
+    """
+    page_type의 준비 조건을 만족하는 즉시 반환합니다.
+    timeout(초)을 넘기면 raise_on_timeout이 False일 때는 그대로 진행합니다.
+    """
+    # Selenium은 브라우저로 페이지를 기다릴 때만 import
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    condition = PAGE_READY[page_type]
+    timeout = DEFAULT_TIMEOUT if timeout is None else timeout
+
+    started = time.monotonic()
+    ready = True
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(
+            condition.checker()
+        )
+    except TimeoutException:
+        ready = False
+
+    result = WaitResult(page_type, time.monotonic() - started, ready)
+    wait_stats.record(result)
+    metrics.record("wait", result.elapsed, page_type=page_type, ready=ready)
+
+    if not ready:
+        print(f"   [wait] {page_type}: {timeout:.0f}초 내에 준비되지 않음")
+        if raise_on_timeout:
+            raise TimeoutException(f"{page_type} 페이지 로딩 시간 초과")
+    return result
@@ -1,19 +1,35 @@
 # crawlers/warak_crawler.py
 import time
-import re
 import json
-import boto3
 import os
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
-from .common import get_chrome_driver  # 추가
+from . import dates, wix_feed
+from .common import (
+    HTTP_TIMEOUT,
+    WARAK_BASE_URL,
+    get_http_session,
+    get_driver_pool,
+    host_slot,
+)
+from .metrics import metrics
+from .replay import record_page
+from .waits import wait_until_ready
+
+# 화면 대신 Wix 예약 서비스 데이터(페이지 내장 JSON 또는 API 응답)에서 프로그램을 읽습니다.
+# 데이터를 찾지 못하면 렌더링된 목록 스크랩으로 대체합니다.
+WARAK_FEED = os.environ.get("CRAWLER_WARAK_FEED", "true").lower() == "true"
+FEED_TIMEOUT = float(os.environ.get("CRAWLER_WARAK_FEED_TIMEOUT", "5"))
+
+# 예약 페이지에서 보여주는 프로그램 카테고리 (데이터 경로도 이 카테고리의 서비스만 사용)
+WARAK_CATEGORY_ID = os.environ.get(
+    "CRAWLER_WARAK_CATEGORY", "44962198-7cc6-4efd-83be-39d4dd7f08d8"
+)
+
+# 데이터 경로에서 예약 가능한 프로그램에 붙이는 상태 (예약 버튼 문구)
+BOOKABLE_STATUS = "예약하기"
 
 
 def is_program_valid(title, test_mode=False, prev_month=None):
@@ -21,129 +37,202 @@ def is_program_valid(title, test_mode=False, prev_month=None):
     프로그램의 유효성을 판단합니다.
 
     와락 특징: 신청일 내림차순 정렬
-    - 월이 갑자기 커지면 작년 데이터
+    - 월이 갑자기 커지면(prev_month보다 크면) 작년 데이터
 
     테스트 모드: 3개월 전까지의 프로그램도 포함
     일반 모드: 미래 프로그램만 포함
     """
-    try:
-        # M/D 형식 날짜 찾기
-        matches = re.findall(r"(\d{1,2})/(\d{1,2})", title)
+    today = datetime.now().date()
+    # 첫 번째 날짜만 확인 (주로 시작일)
+    program_date = dates.parse(title, today)[0]
+    if program_date is None:
+        return True, None  # 날짜 없으면 포함, 월 정보 없음
+
+    # 내림차순 정렬 체크: 이전 월보다 크면 작년
+    if prev_month is not None and program_date.month > prev_month:
+        try:
+            program_date = program_date.replace(year=today.year - 1)
+        except ValueError:
+            return True, program_date.month  # 날짜 변환 실패시 포함
+
+    # 테스트 모드: 3개월 전까지 OK
+    if test_mode:
+        threshold = today - relativedelta(months=3)
+        return program_date >= threshold, program_date.month
+    else:
+        # 일반 모드: 오늘 이후만 OK
+        return program_date >= today, program_date.month
+
+
+def _program_record(title, status, duration, tags, link, today):
+    """화면/데이터 어느 쪽에서 읽었든 같은 형태의 프로그램 항목 (지난 프로그램이면 None)"""
+    # 날짜 추출 및 필터링 (시작일 기준, 미래 날짜만)
+    program_date = dates.parse(title, today)[0]
+    if program_date is not None and program_date < today:
+        return None
+    return {
+        "title": title,
+        "status": status if status else "상태 미상",
+        "duration": duration if duration else "시간 정보 없음",
+        "tags": tags,
+        "link": link,
+        "date": program_date.isoformat() if program_date else None,
+        "crawled_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    }
 
-        if not matches:
-            return True, None  # 날짜 없으면 포함, 월 정보 없음
 
-        # 첫 번째 날짜만 확인 (주로 시작일)
-        month = int(matches[0][0])
-        day = int(matches[0][1])
+def parse_warak_programs(html, today=None):
+    """렌더링된 예약 목록 HTML에서 예약/신청 가능한 미래 프로그램을 추출"""
+    soup = BeautifulSoup(html, "lxml")
 
-        today = datetime.now().date()
-        current_year = today.year
+    program_items = soup.find_all("li", class_="sWsUGva")
+    print(f"발견된 프로그램 수: {len(program_items)}개")
 
-        # 내림차순 정렬 체크: 이전 월보다 크면 작년
-        if prev_month is not None and month > prev_month:
-            current_year -= 1
+    today = today or datetime.now().date()
+    programs = []
+
+    for item in program_items:
+        button_tag = item.find("span", class_="sqQSaw2")
+        status_text = button_tag.text.strip() if button_tag else ""
+
+        # 예약/신청 가능한 것만
+        if "예약" in status_text or "신청" in status_text:
+            title_tag = item.find("h2", class_="sK8oMUK")
+            title = title_tag.text.strip() if title_tag else "제목 없음"
+
+            tag_line_tag = item.find("p", class_="sYCZueN")
+            duration_tag = item.find("p", class_="s__8v7Zit")
+            link_tag = item.find("a", class_="sk3GcZh")
+
+            program = _program_record(
+                title,
+                status_text,
+                duration_tag.text.strip() if duration_tag else "",
+                tag_line_tag.text.strip() if tag_line_tag else "",
+                link_tag["href"] if link_tag and link_tag.has_attr("href") else "",
+                today,
+            )
+            if program:
+                programs.append(program)
+    return programs
 
-        try:
-            program_date = datetime(current_year, month, day).date()
-        except ValueError:
-            return True, month  # 날짜 변환 실패시 포함
 
-        # 테스트 모드: 3개월 전까지 OK
-        if test_mode:
-            threshold = today - relativedelta(months=3)
-            return program_date >= threshold, month
-        else:
-            # 일반 모드: 오늘 이후만 OK
-            return program_date >= today, month
+def _format_minutes(minutes):
+    """90 -> "1시간 30분" (예약 페이지 표기와 같은 형식)"""
+    if not minutes:
+        return ""
+    hours, rest = divmod(int(minutes), 60)
+    parts = []
+    if hours:
+        parts.append(f"{hours}시간")
+    if rest:
+        parts.append(f"{rest}분")
+    return " ".join(parts)
 
-    except Exception:
-        return True, None
+
+def programs_from_services(services, today=None):
+    """Wix 서비스 데이터(wix_feed.extract_services 결과)에서 예약 가능한 미래 프로그램을 추출"""
+    today = today or datetime.now().date()
+    programs = []
+    for service in services:
+        if not service["bookable"]:
+            continue
+        link = service["url"] or (
+            f"{WARAK_BASE_URL}/service-page/{service['slug']}" if service["slug"] else ""
+        )
+        program = _program_record(
+            service["name"],
+            BOOKABLE_STATUS,
+            _format_minutes(service["minutes"]),
+            service["tag_line"],
+            link,
+            today,
+        )
+        if program:
+            programs.append(program)
+    return programs
 
 
 def crawl_warak_programs():
     """와락 센터 프로그램 크롤링"""
-    target_url = "https://www.ddmwarak.com/book-online?category=44962198-7cc6-4efd-83be-39d4dd7f08d8"
+    return list(iter_warak_programs())
 
-    # GitHub Actions 환경 체크
-    driver = get_chrome_driver()
 
-    programs = []
+def _programs_from_page_data(target_url, today):
+    """
+    브라우저 없이 예약 페이지 HTML에 포함된 서버 렌더링 데이터에서 프로그램을 추출.
+    서비스 데이터가 없으면 None (브라우저 경로로 넘어감)
+    """
+    try:
+        with metrics.timer("fetch", via="http", page_type="warak_feed"):
+            with host_slot(target_url):
+                response = get_http_session().get(target_url, timeout=HTTP_TIMEOUT)
+            response.raise_for_status()
+    except Exception as e:
+        print(f"   [warak] 페이지 데이터 요청 실패: {e}")
+        return None
+
+    with metrics.timer("parse", page_type="warak_feed"):
+        services = wix_feed.extract_services(
+            wix_feed.warmup_documents(response.content), WARAK_CATEGORY_ID
+        )
+        if not services:
+            return None
+        print(f"   [warak] 페이지 데이터에서 서비스 {len(services)}개 발견")
+        return programs_from_services(services, today)
+
+
+def _programs_from_browser(target_url, today):
+    """브라우저로 열어 서비스 API 응답을 가로채고, 없으면 렌더링된 목록을 스크랩"""
+    # 공유 풀에서 웜 상태의 브라우저를 빌려 사용 (Wix 스크립트는 차단하지 않음)
+    with get_driver_pool().checkout(profile="warak") as driver:
+        if WARAK_FEED:
+            wix_feed.drain_network_log(driver)
+        with metrics.timer("navigate", page_type="warak_list"):
+            driver.get(target_url)
+
+        if WARAK_FEED:
+            with metrics.timer("wait", page_type="warak_feed"):
+                services = wix_feed.capture_services(
+                    driver, FEED_TIMEOUT, category_id=WARAK_CATEGORY_ID
+                )
+            if services:
+                print(f"   [warak] 서비스 API 응답에서 {len(services)}개 발견")
+                with metrics.timer("parse", page_type="warak_feed"):
+                    return programs_from_services(services, today)
+            print("   [warak] 서비스 데이터를 찾지 못해 화면에서 추출합니다.")
+
+        wait_until_ready(driver, "warak_list", raise_on_timeout=True)
+        with metrics.timer("fetch", via="browser", page_type="warak_list"):
+            html = driver.page_source
+        record_page(target_url, html)
+
+    with metrics.timer("parse", page_type="warak_list"):
+        return parse_warak_programs(html, today)
+
+
+def iter_warak_programs():
+    """와락 센터 프로그램을 하나씩 내보내는 제너레이터"""
+    target_url = f"{WARAK_BASE_URL}/book-online?category={WARAK_CATEGORY_ID}"
+    today = datetime.now().date()
+
+    count = 0
 
     try:
         print("페이지 로딩 중...")
-        driver.get(target_url)
-        wait = WebDriverWait(driver, 10)
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "ul.sVaQi4G")))
-
-        html = driver.page_source
-        soup = BeautifulSoup(html, "lxml")
-
-        program_items = soup.find_all("li", class_="sWsUGva")
-        print(f"발견된 프로그램 수: {len(program_items)}개")
-
-        today = datetime.now().date()
-
-        for item in program_items:
-            button_tag = item.find("span", class_="sqQSaw2")
-            status_text = button_tag.text.strip() if button_tag else ""
-
-            # 예약/신청 가능한 것만
-            if "예약" in status_text or "신청" in status_text:
-                title_tag = item.find("h2", class_="sK8oMUK")
-                title = title_tag.text.strip() if title_tag else "제목 없음"
-
-                # 날짜 추출 및 필터링
-                date_match = re.search(r"(\d{1,2})/(\d{1,2})", title)
-                if date_match:
-                    month = int(date_match.group(1))
-                    day = int(date_match.group(2))
-                    year = today.year
-
-                    try:
-                        program_date = datetime(year, month, day).date()
-                        # 미래 날짜만
-                        if program_date < today:
-                            continue
-                        date_str = program_date.strftime("%Y-%m-%d")
-                    except ValueError:
-                        date_str = None
-                else:
-                    date_str = None
-
-                tag_line_tag = item.find("p", class_="sYCZueN")
-                duration_tag = item.find("p", class_="s__8v7Zit")
-                link_tag = item.find("a", class_="sk3GcZh")
-
-                programs.append(
-                    {
-                        "title": title,
-                        "status": status_text if status_text else "상태 미상",
-                        "duration": (
-                            duration_tag.text.strip()
-                            if duration_tag
-                            else "시간 정보 없음"
-                        ),
-                        "tags": tag_line_tag.text.strip() if tag_line_tag else "",
-                        "link": (
-                            link_tag["href"]
-                            if link_tag and link_tag.has_attr("href")
-                            else ""
-                        ),
-                        "date": date_str,
-                        "crawled_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    }
-                )
+        programs = _programs_from_page_data(target_url, today) if WARAK_FEED else None
+        if programs is None:
+            programs = _programs_from_browser(target_url, today)
 
-        print(f"수집된 프로그램: {len(programs)}개")
+        for program in programs:
+            count += 1
+            yield program
+
+        print(f"수집된 프로그램: {count}개")
 
     except Exception as e:
         print(f"오류 발생: {str(e)}")
         print("페이지 로딩 중 시간 초과 또는 오류 발생")
-    finally:
-        driver.quit()
-
-    return programs
 
 
 # 테스트 실행 코드 - main 함수 안이 아닌 __main__ 부분
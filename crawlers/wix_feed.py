@@ -0,0 +1,179 @@
+# crawlers/wix_feed.py
+import base64
+import json
+import re
+import time
+
+from lxml import etree
+
+from .table_parser import parse_html
+
+# 페이지 HTML에 포함되는 서버 렌더링 데이터 (<script type="application/json">)
+WARMUP_SCRIPT_XPATH = '//script[@type="application/json"]'
+
+# 브라우저가 받는 예약 서비스 목록 API (Wix Bookings)
+SERVICE_API_PATTERN = re.compile(r"/_api/(bookings|services-catalog|bookings-catalog)")
+
+# 서비스 객체에만 있는 설정 블록 (직원/자원 객체는 type/name만 같을 수 있음)
+SERVICE_BLOCKS = ("schedule", "schedulePolicy", "payment", "onlineBooking")
+
+
+def _walk(value):
+    """JSON 값의 모든 dict를 깊이 우선으로 순회"""
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            yield current
+            stack.extend(reversed(list(current.values())))
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
+
+
+def _category_of(candidate):
+    """서비스의 카테고리 id (v1: categoryId, v2: category.id)"""
+    category = candidate.get("category")
+    if isinstance(category, dict):
+        return category.get("id")
+    return candidate.get("categoryId")
+
+
+def _service_fields(candidate, category_id=None):
+    """
+    Wix 서비스 객체(v1 catalog의 info 포함 형태, v2 services 형태)를
+    {"id", "name", "tag_line", "minutes", "slug", "url", "bookable"}로 정리.
+    서비스가 아니거나 category_id가 주어졌는데 다른 카테고리면 None.
+    """
+    info = candidate.get("info") if isinstance(candidate.get("info"), dict) else None
+    source = info or candidate
+    name = source.get("name")
+    if not isinstance(name, str) or not name.strip():
+        return None
+
+    # id와 함께 일정/결제/예약 설정(v1은 info)이 있어야 서비스
+    service_id = candidate.get("id") or source.get("id")
+    has_block = info is not None or any(
+        isinstance(candidate.get(key), dict) for key in SERVICE_BLOCKS
+    )
+    if not service_id or not has_block:
+        return None
+    if category_id and _category_of(candidate) != category_id:
+        return None
+
+    online = candidate.get("onlineBooking") or {}
+    hidden = candidate.get("hidden") or candidate.get("status") == "DELETED"
+    bookable = not hidden and online.get("enabled", True) is not False
+
+    schedule = candidate.get("schedule") or {}
+    constraints = schedule.get("availabilityConstraints") or {}
+    durations = constraints.get("sessionDurations") or constraints.get("durations") or []
+    minutes = None
+    if durations:
+        first = durations[0]
+        minutes = first.get("minutes") if isinstance(first, dict) else first
+    minutes = minutes or candidate.get("durationInMinutes")
+
+    urls = candidate.get("urls") or {}
+    service_page = urls.get("servicePage") or {}
+    slug = candidate.get("mainSlug") or candidate.get("slug") or {}
+    if isinstance(slug, dict):
+        slug = slug.get("name")
+
+    return {
+        "id": service_id,
+        "name": name.strip(),
+        "tag_line": (source.get("tagLine") or source.get("tagline") or "").strip(),
+        "minutes": minutes if isinstance(minutes, (int, float)) else None,
+        "slug": slug if isinstance(slug, str) else None,
+        "url": service_page.get("url") if isinstance(service_page, dict) else None,
+        "bookable": bookable,
+    }
+
+
+def extract_services(documents, category_id=None):
+    """
+    JSON 문서들에서 서비스 목록을 처음 나온 순서대로 추출 (id 기준 중복 제거).
+    category_id가 주어지면 그 카테고리의 서비스만
+    """
+    services = []
+    seen = set()
+    for document in documents:
+        for candidate in _walk(document):
+            service = _service_fields(candidate, category_id)
+            if service is None:
+                continue
+            key = service["id"]
+            if key in seen:
+                continue
+            seen.add(key)
+            services.append(service)
+    return services
+
+
+def warmup_documents(html):
+    """페이지 HTML에 포함된 JSON 스크립트(wix-warmup-data 등)를 파싱"""
+    try:
+        tree = parse_html(html)
+    except (ValueError, etree.ParserError):
+        return []
+    documents = []
+    for script in tree.xpath(WARMUP_SCRIPT_XPATH):
+        try:
+            documents.append(json.loads(script.text or ""))
+        except ValueError:
+            continue
+    return documents
+
+
+def drain_network_log(driver):
+    """이전 페이지에서 쌓인 performance 로그를 비웁니다."""
+    try:
+        driver.get_log("performance")
+    except Exception:
+        pass
+
+
+def _json_responses(driver, entries, matches):
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, ValueError):
+            continue
+        if message.get("method") != "Network.responseReceived":
+            continue
+        params = message.get("params", {})
+        response = params.get("response", {})
+        if "json" not in response.get("mimeType", "") or not matches(response.get("url", "")):
+            continue
+        try:
+            body = driver.execute_cdp_cmd(
+                "Network.getResponseBody", {"requestId": params["requestId"]}
+            )
+            text = body.get("body", "")
+            if body.get("base64Encoded"):
+                text = base64.b64decode(text).decode("utf-8")
+            yield response["url"], json.loads(text)
+        except Exception:
+            continue
+
+
+def capture_services(driver, timeout, poll_interval=0.2, matches=None, category_id=None):
+    """
+    Chrome performance 로그(goog:loggingPrefs)에서 서비스 API 응답을 찾아 서비스 목록을 반환.
+    서비스가 잡히는 즉시 반환하므로 화면 렌더링이 끝날 때까지 기다리지 않습니다.
+    """
+    matches = matches or SERVICE_API_PATTERN.search
+    deadline = time.monotonic() + timeout
+    documents = []
+    while True:
+        try:
+            entries = driver.get_log("performance")
+        except Exception as e:
+            print(f"   [wix] performance 로그를 읽을 수 없음: {e}")
+            return []
+        for _, document in _json_responses(driver, entries, matches):
+            documents.append(document)
+        services = extract_services(documents, category_id)
+        if services or time.monotonic() >= deadline:
+            return services
+        time.sleep(poll_interval)
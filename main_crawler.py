@@ -1,169 +1,380 @@
 # main_crawler.py (push 테스트)
+#
+# 사용법:
+#   python main_crawler.py                                # 전체 크롤링 후 S3 업로드
+#   python main_crawler.py --only edu,news --output local # 일부 소스만, 로컬 저장
+#   python main_crawler.py --only news --dry-run          # 업로드 없이 수집 결과만 확인
+#   python main_crawler.py --daemon --only reserve,news   # 상주 모드 (변경 빈도에 맞춰 반복)
+#
+# 크롤러 모듈(Selenium, bs4 등)은 선택된 소스를 실행할 때 import합니다.
 
+import argparse
+import atexit
+import contextlib
 import json
+import queue
+import shutil
+import signal
+import sys
+import tempfile
+import threading
+import time
 from datetime import datetime
-from crawlers.warak_crawler import crawl_warak_programs
-from crawlers.ddm_edu_crawler import DDMEducationCrawler
-from crawlers.ddm_news_crawler import crawl_ddm_news
-from crawlers.ddm_reserve_crawler import DDMReserveCrawler
-import boto3
+from crawlers.common import shutdown_driver_pool, use_scratch_state
+from crawlers.details import enrich
+from crawlers.waits import wait_stats
+from crawlers.metrics import metrics, source_scope
+from crawlers.publish import DryRunPublisher, LocalPublisher, S3Publisher, StdoutPublisher
+from crawlers.sinks import FanoutSink, JsonEnvelopeSink, JsonLinesSink, S3MultipartSink
 import os
 
+# 동시 실행 모드 설정 (환경 변수로 제어)
+SOURCE_TIMEOUT = float(os.environ.get("CRAWLER_SOURCE_TIMEOUT", "900"))
+GLOBAL_TIMEOUT = float(os.environ.get("CRAWLER_GLOBAL_TIMEOUT", "1800"))
 
-def upload_to_s3(data, key, bucket_name=None):
-    """S3에 데이터 업로드"""
-    if bucket_name is None:
-        bucket_name = os.environ.get(
-            "S3_BUCKET_NAME", "test-dondaemoon-school-20250822"
+# 레코드를 수집하는 즉시 기록하는 스트리밍 출력 위치
+OUTPUT_DIR = os.environ.get("CRAWLER_OUTPUT_DIR", "output")
+STREAM_TO_S3 = os.environ.get("CRAWLER_S3_JSONL", "false").lower() == "true"
+
+
+def _open_sink(source, publisher, groups=None):
+    """
+    소스의 레코드를 흘려 보낼 싱크: 기존 형식 JSON 파일(업로드 문서 원본) + 로컬 JSON Lines,
+    CRAWLER_S3_JSONL=true이면 S3 멀티파트 JSON Lines 업로드까지.
+    JSON 파일은 업로드 문서를 만드는 데 필요하므로 열지 못하면 소스 실패로 처리하고,
+    나머지 싱크는 열지 못해도 제외하고 계속 진행합니다.
+    """
+    name = os.path.splitext(os.path.basename(source["key"]))[0]
+    sinks = [JsonEnvelopeSink(os.path.join(OUTPUT_DIR, f"{name}.json"), groups=groups)]
+    factories = [lambda: JsonLinesSink(os.path.join(OUTPUT_DIR, f"{name}.jsonl"))]
+    if STREAM_TO_S3 and isinstance(publisher, S3Publisher):
+        jsonl_key = os.path.splitext(source["key"])[0] + ".jsonl"
+        factories.append(
+            lambda: S3MultipartSink(publisher.client, publisher.bucket_name, jsonl_key)
         )
+    for factory in factories:
+        try:
+            sinks.append(factory())
+        except Exception as e:
+            print(f"   [sink] {source['name']} 싱크 열기 실패, 제외: {e}")
+    return FanoutSink(*sinks)
 
-    s3_client = boto3.client("s3")
 
+def _stream_records(records, sink, groups=None):
+    """
+    크롤러가 내보내는 레코드를 바로 싱크에 기록합니다. (메모리에 모아 두지 않음)
+    groups가 있으면 레코드는 (그룹, 항목) 쌍입니다.
+    """
+    # 크롤링 시간과 섞이지 않도록 싱크 기록 시간만 더해서 한 번에 기록
+    write_seconds = 0.0
     try:
-        s3_client.put_object(
-            Bucket=bucket_name,
-            Key=key,
-            Body=json.dumps(data, ensure_ascii=False).encode("utf-8"),
-            ContentType="application/json",
-        )
-        print(f"✅ S3 업로드 성공: {key}")
-        return True
+        for record in records:
+            started = time.perf_counter()
+            if groups is not None:
+                group, item = record
+                sink.write(item, group=group)
+            else:
+                sink.write(record)
+            write_seconds += time.perf_counter() - started
     except Exception as e:
-        print(f"❌ S3 업로드 실패 ({key}): {e}")
-        return False
+        sink.abort(str(e))
+        raise
+    finally:
+        metrics.record("serialize", write_seconds, key="sink")
 
 
-def main():
-    """모든 크롤러 실행 및 S3 업로드"""
-    print("\n" + "=" * 60)
-    print("   동대문구 교육정보 통합 크롤링 시작")
-    print("   시작 시간:", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-    print("=" * 60)
+def _spooled_document(sink):
+    """닫힌 싱크가 기록한 기존 형식 JSON 파일을 업로드 문서로 읽습니다."""
+    for part in sink.sinks:
+        if isinstance(part, JsonEnvelopeSink):
+            with open(part.path, encoding="utf-8") as f:
+                return json.load(f)
+    # 기록 중 실패해 제외된 경우: 불완전한 문서를 올리지 않도록 실패 처리
+    raise RuntimeError("업로드 문서 JSON 파일을 기록하지 못했습니다.")
 
-    results = {}
 
-    # 1. 와락 프로그램 크롤링
-    print("\n[1/4] 와락센터 프로그램 크롤링...")
-    try:
-        warak_data = crawl_warak_programs()
-        results["warak"] = {
-            "count": len(warak_data) if warak_data else 0,
-            "status": "success",
-        }
+def _crawl_list(open_sink, records):
+    """목록형 소스 공통: 레코드를 기록하고 JSON 파일에서 업로드 문서를 읽어 반환"""
+    sink = open_sink()
+    _stream_records(records, sink)
+    sink.close()
+    # 빈 데이터여도 업로드
+    upload_data = _spooled_document(sink)
+    result = {
+        "count": upload_data["count"],
+        "status": "success",
+    }
+    return result, upload_data
 
-        # 빈 데이터여도 업로드
-        upload_data = {
-            "data": warak_data if warak_data else [],
-            "count": len(warak_data) if warak_data else 0,
-            "updated_at": datetime.now().isoformat(),
-        }
-        upload_to_s3(upload_data, "dynamic_programs/warak_programs.json")
 
-    except Exception as e:
-        print(f"❌ 와락 크롤링 실패: {e}")
-        results["warak"] = {"status": "failed", "error": str(e)}
-        # 실패해도 빈 파일 업로드
-        upload_data = {
-            "data": [],
-            "count": 0,
-            "updated_at": datetime.now().isoformat(),
-            "error": str(e),
-        }
-        upload_to_s3(upload_data, "dynamic_programs/warak_programs.json")
+def _crawl_warak(open_sink):
+    from crawlers.warak_crawler import iter_warak_programs
 
-    # 2. 교육지원센터 크롤링
-    print("\n[2/4] 교육지원센터 크롤링...")
-    try:
-        edu_crawler = DDMEducationCrawler()
-        ddm_edu_data = edu_crawler.crawl_all()
-
-        # 각 카테고리별 개수 계산
-        edu_count = 0
-        for key, value in ddm_edu_data.items():
-            if isinstance(value, list):
-                edu_count += len(value)
-
-        results["ddm_edu"] = {
-            "count": edu_count,
-            "status": "success",
-        }
+    return _crawl_list(open_sink, iter_warak_programs())
 
-        # 빈 데이터여도 업로드
-        upload_data = {
-            "data": ddm_edu_data if ddm_edu_data else {},
-            "updated_at": datetime.now().isoformat(),
-        }
-        upload_to_s3(upload_data, "dynamic_programs/ddm_edu_programs.json")
 
-    except Exception as e:
-        print(f"❌ 교육지원센터 크롤링 실패: {e}")
-        results["ddm_edu"] = {"status": "failed", "error": str(e)}
-        # 실패해도 빈 파일 업로드
-        upload_data = {
-            "data": {},
-            "updated_at": datetime.now().isoformat(),
-            "error": str(e),
-        }
-        upload_to_s3(upload_data, "dynamic_programs/ddm_edu_programs.json")
+def _crawl_ddm_edu(open_sink):
+    from crawlers.ddm_edu_crawler import DDMEducationCrawler
 
-    # 3. 교육소식 크롤링
-    print("\n[3/4] 동대문구청 교육소식 크롤링...")
-    try:
-        ddm_news_data = crawl_ddm_news()
-        results["ddm_news"] = {
-            "count": len(ddm_news_data) if ddm_news_data else 0,
-            "status": "success",
+    edu_crawler = DDMEducationCrawler()
+    board_keys = edu_crawler.board_keys()
+    sink = open_sink(groups=board_keys)
+    _stream_records(
+        enrich(edu_crawler.iter_all(), grouped=True), sink, groups=board_keys
+    )
+    sink.close(
+        {
+            "data_extra": {
+                "updated_at": datetime.now().isoformat(),
+                "test_mode": edu_crawler.test_mode,
+            }
         }
+    )
+    # 빈 데이터여도 업로드
+    upload_data = _spooled_document(sink)
 
-        # 빈 데이터여도 업로드
-        upload_data = {
-            "data": ddm_news_data if ddm_news_data else [],
-            "count": len(ddm_news_data) if ddm_news_data else 0,
-            "updated_at": datetime.now().isoformat(),
-        }
-        upload_to_s3(upload_data, "dynamic_programs/ddm_news.json")
+    # 각 카테고리별 개수 계산
+    edu_count = 0
+    for key, value in upload_data["data"].items():
+        if isinstance(value, list):
+            edu_count += len(value)
 
-    except Exception as e:
-        print(f"❌ 교육소식 크롤링 실패: {e}")
-        results["ddm_news"] = {"status": "failed", "error": str(e)}
-        # 실패해도 빈 파일 업로드
-        upload_data = {
-            "data": [],
-            "count": 0,
-            "updated_at": datetime.now().isoformat(),
-            "error": str(e),
-        }
-        upload_to_s3(upload_data, "dynamic_programs/ddm_news.json")
+    result = {
+        "count": edu_count,
+        "status": "success",
+    }
+    return result, upload_data
 
-    # 4. 예약포털 크롤링
-    print("\n[4/4] 동대문구 예약포털 크롤링...")
-    try:
-        reserve_crawler = DDMReserveCrawler()
-        ddm_reserve_data = reserve_crawler.crawl_all()
-        results["ddm_reserve"] = {
-            "count": len(ddm_reserve_data) if ddm_reserve_data else 0,
-            "status": "success",
-        }
 
-        # 빈 데이터여도 업로드
-        upload_data = {
-            "data": ddm_reserve_data if ddm_reserve_data else [],
-            "count": len(ddm_reserve_data) if ddm_reserve_data else 0,
-            "updated_at": datetime.now().isoformat(),
-        }
-        upload_to_s3(upload_data, "dynamic_programs/ddm_reserve.json")
+def _crawl_ddm_news(open_sink):
+    from crawlers.ddm_news_crawler import LIST_URL, iter_ddm_news
 
-    except Exception as e:
-        print(f"❌ 예약포털 크롤링 실패: {e}")
-        results["ddm_reserve"] = {"status": "failed", "error": str(e)}
-        # 실패해도 빈 파일 업로드
-        upload_data = {
-            "data": [],
-            "count": 0,
-            "updated_at": datetime.now().isoformat(),
-            "error": str(e),
-        }
-        upload_to_s3(upload_data, "dynamic_programs/ddm_reserve.json")
+    # nttNo를 찾지 못한 글은 목록 주소를 url로 가지므로 상세 페이지를 받지 않음
+    return _crawl_list(open_sink, enrich(iter_ddm_news(), skip_urls=(LIST_URL,)))
+
+
+def _crawl_ddm_reserve(open_sink):
+    from crawlers.ddm_reserve_crawler import DDMReserveCrawler
+
+    reserve_crawler = DDMReserveCrawler()
+    return _crawl_list(open_sink, enrich(reserve_crawler.iter_all()))
+
+
+# 크롤링 대상 목록 (실행/요약 순서)
+SOURCES = [
+    {
+        "name": "warak",
+        "label": "와락센터 프로그램",
+        "error_label": "와락",
+        "crawl": _crawl_warak,
+        "key": "dynamic_programs/warak_programs.json",
+        "list_data": True,
+    },
+    {
+        "name": "ddm_edu",
+        "label": "교육지원센터",
+        "error_label": "교육지원센터",
+        "crawl": _crawl_ddm_edu,
+        "key": "dynamic_programs/ddm_edu_programs.json",
+        "list_data": False,
+    },
+    {
+        "name": "ddm_news",
+        "label": "동대문구청 교육소식",
+        "error_label": "교육소식",
+        "crawl": _crawl_ddm_news,
+        "key": "dynamic_programs/ddm_news.json",
+        "list_data": True,
+    },
+    {
+        "name": "ddm_reserve",
+        "label": "동대문구 예약포털",
+        "error_label": "예약포털",
+        "crawl": _crawl_ddm_reserve,
+        "key": "dynamic_programs/ddm_reserve.json",
+        "list_data": True,
+    },
+]
+
+
+def select_sources(only=None):
+    """
+    쉼표로 구분한 소스 이름(예: "edu,news")에 해당하는 SOURCES 항목을 실행 순서대로 반환.
+    "ddm_" 접두사는 생략할 수 있습니다.
+    """
+    if not only:
+        return list(SOURCES)
+    names = {part.strip() for part in only.split(",") if part.strip()}
+    selected = []
+    for source in SOURCES:
+        aliases = {source["name"], source["name"].replace("ddm_", "", 1)}
+        if aliases & names:
+            selected.append(source)
+            names -= aliases
+    if names:
+        available = ", ".join(s["name"].replace("ddm_", "", 1) for s in SOURCES)
+        raise ValueError(
+            f"알 수 없는 소스: {', '.join(sorted(names))} (사용 가능: {available})"
+        )
+    return selected
+
+
+def _failed_outcome(source, error):
+    """실패 결과와 빈 업로드 데이터 생성 (실패해도 빈 파일 업로드)"""
+    print(f"❌ {source['error_label']} 크롤링 실패: {error}")
+    if source["list_data"]:
+        upload_data = {"data": [], "count": 0}
+    else:
+        upload_data = {"data": {}}
+    upload_data["updated_at"] = datetime.now().isoformat()
+    upload_data["error"] = error
+    return {"status": "failed", "error": error}, upload_data
+
+
+def _source_by_name(sources, name):
+    return next(source for source in sources if source["name"] == name)
+
+
+def _abort_sinks(sinks, error):
+    """아직 닫히지 않은 싱크를 중단 (이미 닫힌 싱크에는 영향 없음)"""
+    for sink in sinks:
+        sink.abort(error)
+
+
+def _crawl_source(source, publisher, opened=None):
+    """
+    크롤러 하나를 실행하고 (results 항목, 업로드 데이터)를 반환.
+    연 싱크는 opened 목록에 담아 두어 시간 초과 시 호출한 쪽에서 중단할 수 있습니다.
+    """
+    opened = [] if opened is None else opened
+
+    def open_sink(groups=None):
+        sink = _open_sink(source, publisher, groups=groups)
+        opened.append(sink)
+        return sink
+
+    with source_scope(source["name"]):
+        try:
+            return source["crawl"](open_sink)
+        except Exception as e:
+            _abort_sinks(opened, str(e))
+            return _failed_outcome(source, str(e))
+
+
+def _submit_upload(publisher, source, upload_data):
+    """업로드 시간도 소스별로 집계되도록 소스 정보를 붙여 업로드 요청"""
+    with source_scope(source["name"]):
+        publisher.submit(upload_data, source["key"])
+
+
+def _run_sequentially(sources, results, publisher):
+    total = len(sources)
+    for index, source in enumerate(sources, 1):
+        print(f"\n[{index}/{total}] {source['label']} 크롤링...")
+        result, upload_data = _crawl_source(source, publisher)
+        results[source["name"]] = result
+        # 업로드는 백그라운드에서 진행하고 다음 크롤러를 바로 시작
+        _submit_upload(publisher, source, upload_data)
+
+
+def _run_concurrently(sources, results, publisher, source_timeout, global_timeout):
+    """
+    모든 크롤러를 스레드로 동시에 실행합니다.
+    소스별 제한 시간과 전체 제한 시간을 넘긴 크롤러는 실패로 기록하고 기다리지 않습니다.
+    업로드 요청은 메인 스레드에서만 넣으므로 시간 초과된 크롤러가 결과를 덮어쓰지 않습니다.
+    """
+    print(
+        f"\n[동시 실행] {len(sources)}개 소스 병렬 크롤링 "
+        f"(소스별 {source_timeout:.0f}초, 전체 {global_timeout:.0f}초 제한)"
+    )
+    completed = queue.Queue()
+    started_at = time.monotonic()
+    global_deadline = started_at + global_timeout
+    # 소스별 마감 시각: 각 스레드의 시작 시각 + 소스별 제한 시간 (전체 마감을 넘지 않음)
+    deadlines = {}
+
+    opened = {source["name"]: [] for source in sources}
+    for source in sources:
+        print(f"   - {source['label']} 크롤링 시작...")
+        deadlines[source["name"]] = min(
+            time.monotonic() + source_timeout, global_deadline
+        )
+        # 데몬 스레드: 시간 초과된 크롤러가 프로세스 종료를 막지 않도록
+        threading.Thread(
+            target=lambda s=source: completed.put(
+                (s["name"], _crawl_source(s, publisher, opened[s["name"]]))
+            ),
+            name=f"crawl-{source['name']}",
+            daemon=True,
+        ).start()
+
+    def expire(source):
+        elapsed = time.monotonic() - started_at
+        outcome = _failed_outcome(source, f"시간 초과 ({elapsed:.0f}초)")
+        # 열린 싱크(S3 멀티파트 업로드 등)를 정리하고 이후 기록은 버림
+        _abort_sinks(opened[source["name"]], outcome[0]["error"])
+        _submit_upload(publisher, source, outcome[1])
+        return outcome
+
+    outcomes = {}
+    pending = {source["name"]: source for source in sources}
+    while pending:
+        now = time.monotonic()
+        for name in [n for n in pending if deadlines[n] <= now]:
+            outcomes[name] = expire(pending.pop(name))
+        if not pending:
+            break
+        remaining = min(deadlines[name] for name in pending) - now
+        try:
+            name, outcome = completed.get(timeout=max(0.0, remaining))
+        except queue.Empty:
+            continue
+        if name not in pending:
+            # 이미 시간 초과로 처리된 소스의 늦은 결과는 버림
+            continue
+        del pending[name]
+        outcomes[name] = outcome
+        elapsed = time.monotonic() - started_at
+        print(f"   - {name} 완료 ({elapsed:.1f}초)")
+        # 끝난 소스는 다른 소스를 기다리지 않고 바로 업로드 시작
+        _submit_upload(publisher, _source_by_name(sources, name), outcome[1])
+
+    for source in sources:
+        results[source["name"]] = outcomes[source["name"]][0]
+
+
+def main(concurrent=None, publisher=None, sources=None):
+    """
+    크롤러 실행 및 S3 업로드 (publisher를 주면 그쪽으로 결과를 보냅니다).
+    sources를 주면 그 소스만 실행합니다. (select_sources 참고)
+    """
+    sources = SOURCES if sources is None else sources
+    if concurrent is None:
+        concurrent = os.environ.get("CRAWLER_CONCURRENT", "false").lower() == "true"
+
+    print("\n" + "=" * 60)
+    print("   동대문구 교육정보 통합 크롤링 시작")
+    print("   시작 시간:", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    print("=" * 60)
+
+    results = {}
+    metrics.reset()
+    if publisher is None:
+        publisher = S3Publisher()
+
+    try:
+        if concurrent:
+            _run_concurrently(
+                sources, results, publisher, SOURCE_TIMEOUT, GLOBAL_TIMEOUT
+            )
+        else:
+            _run_sequentially(sources, results, publisher)
+    finally:
+        # 모든 크롤러가 공유한 브라우저 종료 (시간 초과로 남은 브라우저 포함)
+        shutdown_driver_pool()
+
+    uploads = publisher.wait()
+    publisher.close()
 
     # 최종 결과 출력
     print("\n" + "=" * 60)
@@ -181,20 +392,155 @@ def main():
         else:
             print(f"❌ {name}: 실패 - {result.get('error', 'Unknown error')}")
 
+    for key, report in uploads.items():
+        print(
+            f"   업로드 {key}: {report['status']} "
+            f"({report['sent_bytes']:,} bytes, {report['latency_ms']:.0f}ms)"
+        )
+
+    timings = metrics.summary()
+    print("\n   단계별 소요 시간 (합계 / p95)")
+    for phase, h in timings["phases"].items():
+        print(f"   - {phase:<15} {h['total_sec']:>8.2f}s / {h['p95']:.3f}s ({h['count']}회)")
+
     print(f"\n총 {total_count}개 데이터 수집 완료")
     print("완료 시간:", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
+    if isinstance(publisher, DryRunPublisher):
+        # --dry-run: 요약 파일도 남기지 않음
+        return results
+
     # 로컬 요약 파일 저장
     summary = {
         "results": results,
         "total_count": total_count,
+        "mode": "concurrent" if concurrent else "sequential",
+        "waits": wait_stats.summary(),
+        "uploads": uploads,
+        "timings": timings,
         "completed_at": datetime.now().isoformat(),
     }
     with open("crawl_summary.json", "w", encoding="utf-8") as f:
         json.dump(summary, f, ensure_ascii=False, indent=2)
+    metrics.write_prometheus()
 
     return results
 
 
+def run_daemon(sources, publisher):
+    """
+    상주 모드: 소스별 변경 빈도에 맞춰 반복 크롤링 (crawlers.scheduler 참고).
+    브라우저 풀과 HTTP 세션은 실행 사이에 닫지 않고 재사용합니다.
+    단계별 기록은 실행마다 소스별 마지막 실행 요약으로 바꿔 두어 계속 쌓이지 않습니다.
+    """
+    from crawlers.http_cache import get_http_cache
+    from crawlers.scheduler import AdaptiveScheduler
+
+    # 소스별 마지막 실행의 단계별 요약 (Prometheus 파일에 기록)
+    last_cycle = {}
+    last_cycle_lock = threading.Lock()
+
+    def run_source(source):
+        # 상주 프로세스에서는 캐시를 생성 시점에만 정리하지 않도록 실행마다 정리
+        http_cache = get_http_cache()
+        if http_cache is not None:
+            http_cache.prune()
+        result, upload_data = _crawl_source(source, publisher)
+        with source_scope(source["name"]):
+            publisher.publish(upload_data, source["key"])
+        return result["status"] == "success", upload_data
+
+    def after_run(source):
+        name = source["name"]
+        with last_cycle_lock:
+            last_cycle[name] = metrics.summary()["sources"].get(name, {})
+            # 끝난 소스와 공용 기록은 요약으로 옮겼으므로 비웁니다.
+            metrics.reset(sources=(name, None))
+            wait_stats.reset()
+            metrics.write_prometheus(summary={"sources": dict(last_cycle)})
+
+    scheduler = AdaptiveScheduler(sources, run_source, after_run=after_run)
+    signal.signal(signal.SIGTERM, lambda *_: scheduler.stop())
+    try:
+        scheduler.run_forever()
+    except KeyboardInterrupt:
+        scheduler.stop()
+    finally:
+        shutdown_driver_pool()
+        publisher.close()
+
+
+def _use_scratch_dirs():
+    """--dry-run: 스트리밍 출력과 상태 파일을 임시 디렉터리로 돌려 실제 파일을 바꾸지 않음"""
+    global OUTPUT_DIR
+    OUTPUT_DIR = tempfile.mkdtemp(prefix="crawler_output_")
+    atexit.register(shutil.rmtree, OUTPUT_DIR, ignore_errors=True)
+    use_scratch_state()
+
+
+def cli(argv=None):
+    parser = argparse.ArgumentParser(description="동대문구 교육정보 통합 크롤러")
+    parser.add_argument(
+        "--only", help="실행할 소스 (쉼표 구분: warak,edu,news,reserve). 기본은 전체"
+    )
+    parser.add_argument(
+        "--output",
+        choices=("s3", "local", "stdout"),
+        default=os.environ.get("CRAWLER_OUTPUT", "s3"),
+        help="업로드 문서를 보낼 곳 (기본 s3)",
+    )
+    parser.add_argument(
+        "--local-dir", default=OUTPUT_DIR, help="--output local일 때 저장 디렉터리"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="크롤링만 하고 업로드/저장은 하지 않음 (출력/상태 파일은 임시 디렉터리에 쓰고 종료 시 삭제)",
+    )
+    parser.add_argument(
+        "--concurrent",
+        action="store_const",
+        const=True,
+        default=None,
+        help="소스를 동시에 실행 (기본은 CRAWLER_CONCURRENT)",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="상주 모드: 소스별 변경 빈도에 맞춰 반복 크롤링",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        sources = select_sources(args.only)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.dry_run:
+        _use_scratch_dirs()
+        publisher = DryRunPublisher()
+    elif args.output == "local":
+        publisher = LocalPublisher(args.local_dir)
+    elif args.output == "stdout":
+        publisher = StdoutPublisher(sys.stdout)
+    else:
+        publisher = S3Publisher()
+
+    if args.daemon:
+        run = lambda: run_daemon(sources, publisher)
+    else:
+        run = lambda: main(
+            concurrent=args.concurrent, publisher=publisher, sources=sources
+        )
+
+    if args.output == "stdout" and not args.dry_run:
+        # 표준 출력은 업로드 문서 전용으로 두고 진행 로그는 stderr로 보냄
+        with contextlib.redirect_stdout(sys.stderr):
+            run()
+    else:
+        run()
+    return 0
+
+
 if __name__ == "__main__":
-    main()
+    sys.exit(cli())
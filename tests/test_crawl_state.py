@@ -0,0 +1,96 @@
+# tests/test_crawl_state.py
+import json
+from datetime import datetime, timedelta
+
+from crawlers import crawl_state
+from crawlers.crawl_state import CrawlStateStore, item_id, page_is_known
+from crawlers.publish import build_delta, content_hash
+
+VIEW = "https://www.ddm.go.kr/www/selectBbsNttView.do?key=575&bbsNo=38&nttNo={}"
+
+
+def _item(ntt_no, title, **fields):
+    return dict({"title": title, "url": VIEW.format(ntt_no)}, **fields)
+
+
+def test_item_id_prefers_ntt_no():
+    assert item_id(_item(7, "a")) == "ntt:7"
+    assert item_id({"url": "https://x/list", "title": "b"}) == "https://x/list|b"
+
+
+def test_page_is_known_requires_every_item():
+    assert page_is_known(["ntt:1", "ntt:2"], {"ntt:1", "ntt:2", "ntt:3"})
+    assert not page_is_known(["ntt:1", "ntt:9"], {"ntt:1", "ntt:2"})
+    assert not page_is_known([], {"ntt:1"})
+    assert not page_is_known(["ntt:1"], set())
+
+
+def test_merge_appends_marked_snapshot_items(tmp_path):
+    store = CrawlStateStore(str(tmp_path / "crawl_state.json"))
+    old = _item(1, "old", status="접수중", crawled_at="2026-10-01T09:00:00")
+    expired = _item(2, "expired", date="2026-01-01")
+    store.record("news:38", [_item(3, "stale copy"), old, expired])
+
+    fresh = [_item(3, "fresh copy")]
+    merged = store.merge("news:38", fresh, keep=lambda item: item.get("date") is None)
+
+    assert [item["title"] for item in merged] == ["fresh copy", "old"]
+    assert "carried_over" not in merged[0]
+    # 이어 붙인 항목은 표시만 추가되고 이전 실행의 상태/수집 시각은 그대로
+    assert merged[1]["carried_over"] is True
+    assert merged[1]["status"] == "접수중"
+    assert merged[1]["crawled_at"] == "2026-10-01T09:00:00"
+
+
+def test_merge_without_snapshot_returns_new_items(tmp_path):
+    store = CrawlStateStore(str(tmp_path / "crawl_state.json"))
+    assert store.merge("news:38", [_item(1, "a")]) == [_item(1, "a")]
+
+
+def test_content_hash_ignores_volatile_fields():
+    a = {"data": [_item(1, "a", crawled_at="2026-10-01")], "updated_at": "x"}
+    b = {"data": [_item(1, "a", crawled_at="2026-10-17", carried_over=True)], "updated_at": "y"}
+    assert content_hash(a) == content_hash(b)
+    assert content_hash(a) != content_hash({"data": [_item(1, "b")]})
+
+
+def test_build_delta_lists_added_removed_changed():
+    previous = {"data": [_item(1, "a"), _item(2, "b", status="접수예정")]}
+    current = {"data": [_item(2, "b", status="접수중"), _item(3, "c")]}
+    delta = build_delta(previous, current)
+    assert [item["title"] for item in delta["added"]] == ["c"]
+    assert delta["removed"] == ["ntt:1"]
+    assert [item["status"] for item in delta["changed"]] == ["접수중"]
+    assert delta["base_hash"] == content_hash(previous)
+
+
+def test_build_delta_keys_grouped_documents_by_category():
+    previous = {"data": {"camps": [_item(1, "a")], "notices": []}}
+    current = {"data": {"camps": [], "notices": [_item(1, "a")]}}
+    delta = build_delta(previous, current)
+    assert delta["removed"] == ["camps:ntt:1"]
+    assert [item["category"] for item in delta["added"]] == ["notices"]
+
+
+def test_incremental_runs_do_not_extend_state_age(tmp_path):
+    path = str(tmp_path / "crawl_state.json")
+    store = CrawlStateStore(path)
+    store.record("news:38", [_item(1, "a")])
+    assert store.known_ids("news:38") == {"ntt:1"}
+
+    # 마지막 전체 크롤링 이후 증분 실행만 있었다면 updated_at이 최근이어도 만료
+    old = (datetime.now() - crawl_state.STATE_MAX_AGE - timedelta(days=1)).isoformat()
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    data["news:38"]["full_crawl_at"] = old
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+    store = CrawlStateStore(path)
+    store.record("news:38", [_item(2, "b"), _item(1, "a")], full=False)
+    assert store._data["news:38"]["full_crawl_at"] == old
+    assert store.known_ids("news:38") == set()
+
+    # 전체 크롤링을 마치면 기한이 다시 시작
+    store.record("news:38", [_item(2, "b"), _item(1, "a")], full=True)
+    assert store.known_ids("news:38") == {"ntt:1", "ntt:2"}
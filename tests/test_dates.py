@@ -0,0 +1,59 @@
+# tests/test_dates.py
+from datetime import date
+
+import pytest
+
+from crawlers import dates
+from crawlers.warak_crawler import is_program_valid
+
+
+@pytest.mark.parametrize(
+    "today, text, expected",
+    [
+        # 10월: 지난 날짜도, 두 달 뒤 날짜도 올해
+        (date(2026, 10, 17), "2/10", date(2026, 2, 10)),
+        (date(2026, 10, 17), "3월 1일", date(2026, 3, 1)),
+        (date(2026, 10, 17), "12/20", date(2026, 12, 20)),
+        # 12월: 1월 초 날짜만 내년
+        (date(2026, 12, 20), "1/5", date(2027, 1, 5)),
+        (date(2026, 12, 20), "3/1", date(2026, 3, 1)),
+        # 1월: 12월 말 날짜는 작년, 2월 날짜는 올해
+        (date(2027, 1, 10), "12/20", date(2026, 12, 20)),
+        (date(2027, 1, 10), "2/10", date(2027, 2, 10)),
+    ],
+)
+def test_year_inference(today, text, expected):
+    assert dates.parse(text, today) == (expected, expected)
+
+
+def test_period_end_crosses_new_year():
+    assert dates.parse("12/20~1/5", date(2026, 12, 1)) == (
+        date(2026, 12, 20),
+        date(2027, 1, 5),
+    )
+
+
+def test_full_dates_take_precedence():
+    assert dates.parse("2026-03-02 ~ 2026-03-05 (3/1 공지)", date(2026, 10, 17)) == (
+        date(2026, 3, 2),
+        date(2026, 3, 5),
+    )
+
+
+def test_invalid_and_missing_dates():
+    assert dates.parse("", date(2026, 10, 17)) == (None, None)
+    assert dates.parse("날짜 없음", date(2026, 10, 17)) == (None, None)
+    assert dates.parse("2/30", date(2026, 10, 17)) == (None, None)
+
+
+def test_ends_on_or_after_uses_period_end():
+    today = date(2026, 10, 17)
+    assert dates.ends_on_or_after("10/1~10/20", today, today)
+    assert not dates.ends_on_or_after("10/1~10/16", today, today)
+    assert dates.ends_on_or_after("상시 모집", today, today)
+
+
+def test_warak_month_jump_means_last_year():
+    # 신청일 내림차순 목록에서 이전 항목보다 월이 크면 작년 프로그램
+    valid, month = is_program_valid("12/31 부모 교실", prev_month=1)
+    assert (valid, month) == (False, 12)
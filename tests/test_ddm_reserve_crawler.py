@@ -0,0 +1,116 @@
+# tests/test_ddm_reserve_crawler.py
+import pytest
+
+from crawlers import ddm_reserve_crawler, table_parser
+
+LIST_URL = "https://www.ddm.go.kr/reserve/selectDongdaemunUserCourseList.do?key=1529"
+
+
+def _page_html(rows, pager=()):
+    body = "".join(f"<tr><td>{row}</td></tr>" for row in rows)
+    links = "".join(
+        f'<a href="#" onclick="fn_link_page({number});return false;">{number}</a>'
+        for number in pager
+    )
+    return (
+        '<html><body><div class="program lecture"><table>'
+        f'<tbody class="text_center">{body}</tbody></table></div>'
+        f'<div class="paging">{links}</div></body></html>'
+    )
+
+
+class FakePage:
+    def __init__(self, html):
+        self.tree = table_parser.parse_html(html)
+
+
+class FakeFetcher:
+    """pageIndex별 HTML을 돌려주고, failures에 적힌 횟수만큼은 먼저 오류를 냅니다."""
+
+    def __init__(self, pages, failures=None):
+        self.pages = pages
+        self.failures = dict(failures or {})
+        self.requested = []
+
+    def fetch(self, url, page_type=None):
+        page_index = int(url.rsplit("pageIndex=", 1)[1]) if "pageIndex=" in url else 1
+        self.requested.append(page_index)
+        if self.failures.get(page_index):
+            self.failures[page_index] -= 1
+            raise OSError("connection reset")
+        return FakePage(self.pages[page_index])
+
+
+def _crawler(monkeypatch, fetcher):
+    monkeypatch.setattr(ddm_reserve_crawler, "get_fetcher", lambda: fetcher)
+    return ddm_reserve_crawler.DDMReserveCrawler()
+
+
+def _rows(pages):
+    return [
+        table_parser.text(row).strip()
+        for page in pages
+        for row in table_parser.select_rows(page.tree, "reserve_programs")
+    ]
+
+
+def test_pager_last_page():
+    tree = table_parser.parse_html(_page_html(["a"], pager=(1, 2, 3, 11)))
+    assert table_parser.pager_last_page(tree) == 11
+    href = '<a href="?key=1529&amp;pageIndex=7">7</a>'
+    assert table_parser.pager_last_page(table_parser.parse_html(href)) == 7
+    assert table_parser.pager_last_page(table_parser.parse_html(_page_html(["a"]))) == 1
+
+
+def test_iter_pages_follows_pager_in_order(monkeypatch):
+    fetcher = FakeFetcher(
+        {
+            1: _page_html(["p1"], pager=(1, 2, 3)),
+            2: _page_html(["p2"], pager=(1, 2, 3)),
+            # 번호가 10개씩 보이는 목록처럼 마지막으로 받은 페이지에서 다음 범위가 보임
+            3: _page_html(["p3"], pager=(1, 2, 3, 4)),
+            4: _page_html(["p4"], pager=(1, 2, 3, 4)),
+        }
+    )
+    crawler = _crawler(monkeypatch, fetcher)
+    assert _rows(crawler._iter_pages(LIST_URL, "reserve_programs")) == [
+        "p1", "p2", "p3", "p4"
+    ]
+
+
+def test_iter_pages_stops_at_empty_page(monkeypatch):
+    fetcher = FakeFetcher(
+        {
+            1: _page_html(["p1"], pager=(1, 2, 3)),
+            2: _page_html([], pager=(1, 2, 3)),
+            3: _page_html(["p3"], pager=(1, 2, 3)),
+        }
+    )
+    crawler = _crawler(monkeypatch, fetcher)
+    assert _rows(crawler._iter_pages(LIST_URL, "reserve_programs")) == ["p1"]
+
+
+def test_iter_pages_retries_failed_page(monkeypatch):
+    fetcher = FakeFetcher(
+        {
+            1: _page_html(["p1"], pager=(1, 2)),
+            2: _page_html(["p2"], pager=(1, 2)),
+        },
+        failures={2: ddm_reserve_crawler.PAGE_RETRIES},
+    )
+    crawler = _crawler(monkeypatch, fetcher)
+    assert _rows(crawler._iter_pages(LIST_URL, "reserve_programs")) == ["p1", "p2"]
+
+
+def test_iter_pages_fails_instead_of_truncating(monkeypatch):
+    fetcher = FakeFetcher(
+        {
+            1: _page_html(["p1"], pager=(1, 2, 3)),
+            2: _page_html(["p2"], pager=(1, 2, 3)),
+            3: _page_html(["p3"], pager=(1, 2, 3)),
+        },
+        failures={2: ddm_reserve_crawler.PAGE_RETRIES + 1},
+    )
+    crawler = _crawler(monkeypatch, fetcher)
+    with pytest.raises(RuntimeError):
+        list(crawler._iter_pages(LIST_URL, "reserve_programs"))
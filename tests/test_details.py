@@ -0,0 +1,67 @@
+# tests/test_details.py
+from crawlers.common import DDM_BASE_URL
+from crawlers.details import DetailEnricher, parse_detail
+
+DETAIL_PAGE = """
+<html><body>
+<div class="board_view">
+  <table>
+    <tr><th>접수기간</th><td>2026-10-01 ~ 2026-10-20</td></tr>
+    <tr><th>장소</th><td>동대문구청  3층</td></tr>
+    <tr><th>작성자</th><td>교육지원과</td></tr>
+  </table>
+  <div class="content">진학 설명회를 엽니다.</div>
+  <a href="/common/fileDown.do?atchFileId=1">안내문.pdf</a>
+  <a href="/common/fileDown.do?atchFileId=1">안내문.pdf</a>
+  <a href="/www/list.do">목록</a>
+</div>
+</body></html>
+""".encode("utf-8")
+
+
+def test_parse_detail_extracts_body_attachments_and_schedule():
+    detail = parse_detail(DETAIL_PAGE, "https://www.ddm.go.kr/www/view.do?nttNo=1")
+    assert detail["description"] == "진학 설명회를 엽니다."
+    assert detail["attachments"] == [
+        {
+            "name": "안내문.pdf",
+            "url": "https://www.ddm.go.kr/common/fileDown.do?atchFileId=1",
+        }
+    ]
+    assert detail["fields"]["장소"] == "동대문구청 3층"
+    assert detail["schedule"] == {
+        "접수기간": "2026-10-01 ~ 2026-10-20",
+        "장소": "동대문구청 3층",
+    }
+
+
+class FakeCache:
+    def get(self, key, row_hash):
+        return None
+
+    def save(self):
+        pass
+
+
+class FailingSession:
+    def __init__(self):
+        self.requested = []
+
+    def get(self, url, timeout=None):
+        self.requested.append(url)
+        raise OSError("offline")
+
+
+def test_enricher_skips_base_and_list_urls():
+    session = FailingSession()
+    list_url = "https://www.ddm.go.kr/www/selectBbsNttList.do?key=575&bbsNo=38"
+    enricher = DetailEnricher(
+        workers=1, cache=FakeCache(), session=session, skip_urls=(list_url,)
+    )
+    items = [
+        {"title": "링크 없음", "url": DDM_BASE_URL + "/"},
+        {"title": "nttNo 없음", "url": list_url},
+        {"title": "상세", "url": "https://www.ddm.go.kr/www/view.do?nttNo=1"},
+    ]
+    assert list(enricher.iter_enriched(items)) == items
+    assert session.requested == ["https://www.ddm.go.kr/www/view.do?nttNo=1"]
@@ -0,0 +1,73 @@
+# tests/test_fetchers.py
+import pytest
+
+from crawlers.fetchers import AdaptiveFetcher, FetchResult, StrategyStore, url_pattern
+
+URL = "https://www.ddm.go.kr/www/selectBbsNttList.do?key=575&bbsNo=38&pageIndex=2"
+
+ROWS_PAGE = (
+    b'<html><body><table><tbody class="text_center">'
+    b"<tr><td>1</td></tr></tbody></table></body></html>"
+)
+EMPTY_PAGE = b'<html><body><table><tbody class="text_center"></tbody></table></body></html>'
+SHELL_PAGE = b"<html><body><div id='app'></div></body></html>"
+MARKER_PAGE = (
+    b'<html><body><noscript>Please enable JavaScript</noscript>'
+    b'<table><tbody class="text_center"></tbody></table></body></html>'
+)
+
+
+class FakeFetcher:
+    def __init__(self, name, html=None, error=None):
+        self.name = name
+        self.html = html
+        self.error = error
+        self.calls = 0
+
+    def fetch(self, url, page_type=None, strict=False):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return FetchResult(url, self.html, self.name)
+
+
+def _fetcher(tmp_path, http_html=None, http_error=None):
+    http = FakeFetcher("http", http_html, http_error)
+    browser = FakeFetcher("browser", ROWS_PAGE)
+    strategies = StrategyStore(str(tmp_path / "fetch_strategy.json"))
+    return AdaptiveFetcher(http, browser, strategies), http, browser, strategies
+
+
+@pytest.mark.parametrize("html", [ROWS_PAGE, EMPTY_PAGE])
+def test_http_page_with_list_is_kept(tmp_path, html):
+    # 빈 목록(마지막 다음 페이지 등)도 HTTP 성공으로 보고 브라우저를 띄우지 않음
+    fetcher, http, browser, strategies = _fetcher(tmp_path, http_html=html)
+    result = fetcher.fetch(URL, "news_list")
+    assert result.via == "http"
+    assert browser.calls == 0
+    assert strategies.get(url_pattern(URL, "news_list")) == "http"
+
+
+@pytest.mark.parametrize("html", [SHELL_PAGE, MARKER_PAGE])
+def test_unrendered_http_page_escalates(tmp_path, html):
+    fetcher, http, browser, strategies = _fetcher(tmp_path, http_html=html)
+    result = fetcher.fetch(URL, "news_list")
+    assert result.via == "browser"
+    assert strategies.get(url_pattern(URL, "news_list")) == "browser"
+
+
+def test_http_error_escalates(tmp_path):
+    fetcher, http, browser, _ = _fetcher(tmp_path, http_error=OSError("reset"))
+    assert fetcher.fetch(URL, "news_list").via == "browser"
+
+
+def test_remembered_browser_pattern_skips_http(tmp_path):
+    fetcher, http, browser, strategies = _fetcher(tmp_path, http_html=ROWS_PAGE)
+    strategies.set(url_pattern(URL, "news_list"), "browser")
+    assert fetcher.fetch(URL, "news_list").via == "browser"
+    assert http.calls == 0
+
+
+def test_url_pattern_ignores_page_index():
+    other_page = URL.replace("pageIndex=2", "pageIndex=7")
+    assert url_pattern(URL, "news_list") == url_pattern(other_page, "news_list")
@@ -0,0 +1,70 @@
+# tests/test_http_cache.py
+import os
+import time
+
+import pytest
+
+from crawlers.http_cache import HttpCache
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise OSError(self.status_code)
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.sent_headers.append(headers or {})
+        return self.responses.pop(0)
+
+
+URL = "https://www.ddm.go.kr/jinhak/selectBbsNttList.do?key=3646"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HttpCache(str(tmp_path / "http_cache"))
+
+
+def test_not_modified_returns_cached_body_and_parsed_rows(cache):
+    session = FakeSession(
+        [FakeResponse(200, b"<html>list</html>", {"ETag": '"v1"'}), FakeResponse(304)]
+    )
+    first = cache.get(session, URL)
+    assert not first.from_cache
+    cache.set_parsed(first, "rows", [["a"]])
+
+    second = cache.get(session, URL)
+    assert session.sent_headers[1]["If-None-Match"] == '"v1"'
+    assert second.from_cache and second.unchanged
+    assert second.content == b"<html>list</html>"
+    assert cache.get_parsed(second, "rows") == [["a"]]
+
+
+def test_changed_body_drops_parsed_rows(cache):
+    session = FakeSession(
+        [FakeResponse(200, b"<html>v1</html>"), FakeResponse(200, b"<html>v2</html>")]
+    )
+    cache.set_parsed(cache.get(session, URL), "rows", [["a"]])
+    second = cache.get(session, URL)
+    assert not second.unchanged
+    assert cache.get_parsed(second, "rows") is None
+
+
+def test_prune_removes_expired_entries(cache):
+    cache.get(FakeSession([FakeResponse(200, b"<html>v1</html>")]), URL)
+    assert os.listdir(cache.directory)
+    cache.max_age = 0
+    time.sleep(0.01)
+    cache.prune()
+    assert os.listdir(cache.directory) == []
@@ -0,0 +1,42 @@
+# tests/test_main_crawler.py
+import pytest
+
+import main_crawler
+from crawlers.publish import DryRunPublisher
+from crawlers.sinks import JsonEnvelopeSink
+
+SOURCE = {"name": "ddm_news", "key": "dynamic_programs/ddm_news.json"}
+
+
+@pytest.fixture
+def open_sink(tmp_path, monkeypatch):
+    monkeypatch.setattr(main_crawler, "OUTPUT_DIR", str(tmp_path))
+    return lambda groups=None: main_crawler._open_sink(
+        SOURCE, DryRunPublisher(), groups=groups
+    )
+
+
+def test_list_document_is_read_from_spooled_file(open_sink, tmp_path):
+    records = iter([{"title": "a"}, {"title": "b"}])
+    result, upload_data = main_crawler._crawl_list(open_sink, records)
+
+    assert result == {"count": 2, "status": "success"}
+    assert upload_data["data"] == [{"title": "a"}, {"title": "b"}]
+    assert upload_data["count"] == 2
+    assert "updated_at" in upload_data
+    assert (tmp_path / "ddm_news.jsonl").read_text(encoding="utf-8").count("\n") == 2
+
+
+def test_empty_list_still_builds_document(open_sink):
+    result, upload_data = main_crawler._crawl_list(open_sink, iter([]))
+    assert result["count"] == 0
+    assert upload_data["data"] == []
+
+
+def test_missing_spool_fails_the_source(open_sink):
+    sink = open_sink()
+    # 기록 중 실패한 싱크처럼 JSON 파일 싱크가 빠지면 문서를 만들지 않음
+    sink.sinks = [part for part in sink.sinks if not isinstance(part, JsonEnvelopeSink)]
+    sink.close()
+    with pytest.raises(RuntimeError):
+        main_crawler._spooled_document(sink)
@@ -0,0 +1,52 @@
+# tests/test_pagination.py
+import threading
+
+from crawlers import pagination
+from crawlers.pagination import PrefetchHistory, PrefetchPaginator
+
+
+def test_pages_are_yielded_in_order():
+    with PrefetchPaginator(lambda page: f"page-{page}", max_pages=4) as pages:
+        loaded = [fetch() for _, fetch in pages]
+    assert loaded == ["page-1", "page-2", "page-3", "page-4"]
+
+
+def test_break_discards_prefetched_pages():
+    requested = []
+    lock = threading.Lock()
+
+    def load(page):
+        with lock:
+            requested.append(page)
+        return page
+
+    paginator = PrefetchPaginator(load, max_pages=10, expected_pages=3)
+    with paginator as pages:
+        for page, fetch in pages:
+            fetch()
+            if page == 1:
+                break
+    assert paginator.consumed == 1
+    assert paginator.discarded >= 1
+    # 예상 페이지 수(3)를 넘어서는 미리 요청하지 않음
+    assert max(requested) <= 3
+
+
+def test_depth_follows_expected_pages():
+    paginator = PrefetchPaginator(lambda page: page, expected_pages=2.2)
+    assert paginator.depth_at(1) == 2
+    assert paginator.depth_at(3) == 0
+    assert PrefetchPaginator(lambda page: page).depth_at(1) == pagination.DEFAULT_PREFETCH
+    assert PrefetchPaginator(lambda page: page, expected_pages=50).depth_at(1) == (
+        pagination.MAX_PREFETCH
+    )
+
+
+def test_history_averages_recent_runs(tmp_path):
+    history = PrefetchHistory(str(tmp_path / "prefetch_history.json"))
+    assert history.expected_pages("news:38") is None
+    for consumed in [1] * pagination.HISTORY_RUNS + [3, 3]:
+        history.record("news:38", consumed)
+    reloaded = PrefetchHistory(str(tmp_path / "prefetch_history.json"))
+    expected = (pagination.HISTORY_RUNS - 2 + 6) / pagination.HISTORY_RUNS
+    assert reloaded.expected_pages("news:38") == expected
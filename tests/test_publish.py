@@ -0,0 +1,161 @@
+# tests/test_publish.py
+import gzip
+import io
+import json
+
+from botocore.exceptions import ClientError
+
+from crawlers.publish import HASH_METADATA_KEY, S3Publisher, content_hash, delta_key
+from crawlers.sinks import S3MultipartSink
+
+KEY = "dynamic_programs/ddm_news.json"
+
+
+class StubS3:
+    """head/get/put와 멀티파트 호출을 메모리에 기록하는 boto3 S3 클라이언트 대역"""
+
+    def __init__(self, head_error=None):
+        self.objects = {}
+        self.head_error = head_error
+        self.puts = []
+        self.parts = []
+        self.completed = None
+
+    def head_object(self, Bucket, Key):
+        if self.head_error:
+            raise ClientError({"Error": {"Code": self.head_error}}, "HeadObject")
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return {"Metadata": self.objects[Key]["Metadata"]}
+
+    def get_object(self, Bucket, Key):
+        stored = self.objects[Key]
+        return {
+            "Body": io.BytesIO(stored["Body"]),
+            "ContentEncoding": stored.get("ContentEncoding"),
+        }
+
+    def put_object(self, Bucket, Key, Body, ContentType, Metadata, **extra):
+        self.puts.append(Key)
+        self.objects[Key] = dict(extra, Body=Body, Metadata=Metadata)
+
+    def create_multipart_upload(self, **kwargs):
+        return {"UploadId": "upload-1"}
+
+    def upload_part(self, PartNumber, Body, **kwargs):
+        self.parts.append(len(Body))
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, MultipartUpload, **kwargs):
+        self.completed = MultipartUpload["Parts"]
+
+    def abort_multipart_upload(self, **kwargs):
+        pass
+
+
+def _document(*titles, crawled_at="2026-10-17T09:00:00"):
+    items = [
+        {
+            "title": title,
+            "url": f"https://www.ddm.go.kr/www/view.do?nttNo={i}",
+            "crawled_at": crawled_at,
+        }
+        for i, title in enumerate(titles, 1)
+    ]
+    return {"data": items, "count": len(items), "updated_at": crawled_at}
+
+
+def _body(stored):
+    body = stored["Body"]
+    if stored.get("ContentEncoding") == "gzip":
+        body = gzip.decompress(body)
+    return json.loads(body.decode("utf-8"))
+
+
+def test_first_upload_puts_document_with_hash():
+    client = StubS3()
+    report = S3Publisher(bucket_name="bucket", client=client).publish(_document("a"), KEY)
+
+    assert report["status"] == "uploaded"
+    assert client.puts == [KEY]
+    stored = client.objects[KEY]
+    assert stored["Metadata"] == {HASH_METADATA_KEY: content_hash(_document("a"))}
+    assert _body(stored) == _document("a")
+    assert "delta" not in report
+
+
+def test_unchanged_content_is_skipped():
+    client = StubS3()
+    publisher = S3Publisher(bucket_name="bucket", client=client)
+    publisher.publish(_document("a", "b"), KEY)
+
+    # 수집 시각만 바뀐 문서는 내용 해시가 같으므로 다시 올리지 않음
+    report = publisher.publish(_document("a", "b", crawled_at="2026-10-18T09:00:00"), KEY)
+    assert report["status"] == "skipped"
+    assert report["sent_bytes"] == 0
+    assert client.puts == [KEY]
+
+
+def test_changed_content_uploads_delta():
+    client = StubS3()
+    publisher = S3Publisher(bucket_name="bucket", client=client)
+    publisher.publish(_document("a", "b"), KEY)
+
+    current = _document("a", "b2", "c")
+    report = publisher.publish(current, KEY)
+    assert report["status"] == "uploaded"
+    assert client.puts == [KEY, KEY, delta_key(KEY)]
+    assert report["delta"] == {"added": 1, "removed": 0, "changed": 1}
+    delta = _body(client.objects[delta_key(KEY)])
+    assert delta["base_hash"] == content_hash(_document("a", "b"))
+    assert delta["content_hash"] == content_hash(current)
+
+
+def test_gzip_upload_is_compressed_and_read_back():
+    client = StubS3()
+    publisher = S3Publisher(bucket_name="bucket", gzip_enabled=True, client=client)
+    report = publisher.publish(_document("a"), KEY)
+    assert client.objects[KEY]["ContentEncoding"] == "gzip"
+    assert report["sent_bytes"] == len(client.objects[KEY]["Body"])
+    assert _body(client.objects[KEY]) == _document("a")
+
+    # 이전 문서가 gzip이어도 변경분 계산을 위해 풀어서 읽음
+    report = publisher.publish(_document("a", "b"), KEY)
+    assert report["delta"]["added"] == 1
+
+
+def test_head_error_other_than_missing_fails_upload():
+    client = StubS3(head_error="403")
+    report = S3Publisher(bucket_name="bucket", client=client).publish(_document("a"), KEY)
+    assert report["status"] == "failed"
+    assert client.puts == []
+
+
+def test_submit_and_wait_collect_reports():
+    client = StubS3()
+    publisher = S3Publisher(bucket_name="bucket", client=client, max_workers=2)
+    publisher.submit(_document("a"), KEY)
+    publisher.submit(_document("b"), "dynamic_programs/ddm_reserve.json")
+    reports = publisher.wait()
+    publisher.close()
+    assert {key: report["status"] for key, report in reports.items()} == {
+        KEY: "uploaded",
+        "dynamic_programs/ddm_reserve.json": "uploaded",
+    }
+
+
+def test_multipart_stream_uses_publisher_client():
+    client = StubS3()
+    publisher = S3Publisher(bucket_name="bucket", client=client)
+    sink = S3MultipartSink(publisher.client, publisher.bucket_name, "ddm_news.jsonl")
+    record = {"title": "x" * 1024}
+    # 5MB 파트를 두 개 넘기도록 기록하면 마지막 파트만 작게 남음
+    for _ in range(11 * 1024):
+        sink.write(record)
+    sink.close()
+
+    assert len(client.parts) == 3
+    assert all(size >= S3MultipartSink.MIN_PART_SIZE for size in client.parts[:-1])
+    assert client.completed == [
+        {"ETag": f"etag-{n}", "PartNumber": n} for n in (1, 2, 3)
+    ]
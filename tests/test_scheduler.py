@@ -0,0 +1,36 @@
+# tests/test_scheduler.py
+import pytest
+
+from crawlers import scheduler
+from crawlers.scheduler import learned_interval
+
+HOUR = 3600
+
+
+def _history(changes, step=HOUR):
+    return [{"at": i * step, "changed": changed} for i, changed in enumerate(changes)]
+
+
+def test_short_history_keeps_interval():
+    assert learned_interval(6 * HOUR, []) == 6 * HOUR
+    assert learned_interval(6 * HOUR, _history([True])) == 6 * HOUR
+
+
+def test_interval_follows_observed_change_rate():
+    # 10시간 동안 변경 2번 -> 변경 간격 5시간의 FRESHNESS배
+    history = _history([False, True, False, False, False, False, True, False, False, False, False])
+    assert learned_interval(HOUR, history) == pytest.approx(10 * HOUR / 2 * scheduler.FRESHNESS)
+
+
+def test_no_changes_grows_interval():
+    assert learned_interval(2 * HOUR, _history([False] * 5)) == pytest.approx(
+        2 * HOUR * scheduler.GROWTH
+    )
+
+
+def test_interval_is_clamped():
+    assert learned_interval(scheduler.MAX_INTERVAL, _history([False] * 3)) == (
+        scheduler.MAX_INTERVAL
+    )
+    every_minute = _history([True] * 10, step=60)
+    assert learned_interval(HOUR, every_minute) == scheduler.MIN_INTERVAL
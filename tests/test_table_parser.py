@@ -0,0 +1,22 @@
+# tests/test_table_parser.py
+import os
+
+import pytest
+
+from crawlers import table_parser
+
+FIXTURE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "benchmarks", "fixtures"
+)
+
+
+def _load_fixture(page_type):
+    with open(os.path.join(FIXTURE_DIR, f"{page_type}.html"), "rb") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("page_type", table_parser.PARITY_PAGE_TYPES)
+def test_fast_parser_matches_beautifulsoup(page_type):
+    slow, fast = table_parser.parse_both(page_type, _load_fixture(page_type))
+    assert slow, f"{page_type} 고정 페이지에서 항목을 찾지 못함"
+    assert fast == slow
@@ -0,0 +1,60 @@
+# tests/test_wix_feed.py
+import datetime
+import os
+
+from crawlers import warak_crawler, wix_feed
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "warak_book_online.html")
+TODAY = datetime.date(2026, 10, 17)
+
+
+def _documents():
+    with open(FIXTURE, "rb") as f:
+        return wix_feed.warmup_documents(f.read())
+
+
+def test_extract_services_skips_staff_and_duplicates():
+    services = wix_feed.extract_services(_documents())
+    names = [service["name"] for service in services]
+    assert "Staff Member" not in names
+    assert "상담 선생님" not in names
+    assert names.count("[11/3] 가족 원예 교실") == 1
+    assert len(services) == 5
+
+
+def test_extract_services_filters_category():
+    services = wix_feed.extract_services(_documents(), warak_crawler.WARAK_CATEGORY_ID)
+    assert [service["name"] for service in services] == [
+        "[11/3] 가족 원예 교실",
+        "2026년 12월 5일 부모 교육",
+        "2026년 9월 1일 지난 강좌",
+        "[11/10] 마감된 요가",
+    ]
+    garden = services[0]
+    assert garden["tag_line"] == "아이와 함께 화분 만들기"
+    assert garden["minutes"] == 90
+    assert garden["slug"] == "family-garden"
+    assert garden["bookable"] is True
+    assert services[1]["minutes"] == 60
+    assert services[3]["bookable"] is False
+
+
+def test_extract_services_requires_service_block():
+    staff = {"id": "s1", "name": "Staff Member", "type": "INDIVIDUAL"}
+    assert wix_feed.extract_services([staff]) == []
+
+
+def test_programs_from_services():
+    services = wix_feed.extract_services(_documents(), warak_crawler.WARAK_CATEGORY_ID)
+    programs = warak_crawler.programs_from_services(services, TODAY)
+    assert [program["title"] for program in programs] == [
+        "[11/3] 가족 원예 교실",
+        "2026년 12월 5일 부모 교육",
+    ]
+    garden, parent = programs
+    assert garden["status"] == warak_crawler.BOOKABLE_STATUS
+    assert garden["duration"] == "1시간 30분"
+    assert garden["link"] == "https://www.ddmwarak.com/service-page/family-garden"
+    assert garden["date"] == "2026-11-03"
+    assert parent["duration"] == "1시간"
+    assert parent["link"] == f"{warak_crawler.WARAK_BASE_URL}/service-page/parent-class"